@@ -1,3 +1,4 @@
+from contextlib import closing
 from typing import List, Optional
 
 from kloppy.config import get_config
@@ -10,7 +11,7 @@ from kloppy.infra.serializers.tracking.sportec import (
     SportecTrackingDataDeserializer,
     SportecTrackingDataInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, prefetch_inputs
 from kloppy.utils import deprecated
 
 
@@ -39,14 +40,17 @@ def load_event(
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
     )
-    with open_as_file(event_data) as event_data_fp, open_as_file(
-        meta_data
-    ) as meta_data_fp:
-        return serializer.deserialize(
-            SportecEventDataInputs(
-                event_data=event_data_fp, meta_data=meta_data_fp
-            )
-        )
+    # Both inputs are opened concurrently, which speeds up loading the
+    # open data from remote URLs
+    opened_inputs = prefetch_inputs([event_data, meta_data])
+    with closing(opened_inputs):
+        with next(opened_inputs) as event_data_fp:
+            with next(opened_inputs) as meta_data_fp:
+                return serializer.deserialize(
+                    SportecEventDataInputs(
+                        event_data=event_data_fp, meta_data=meta_data_fp
+                    )
+                )
 
 
 def load_tracking(
@@ -77,14 +81,15 @@ def load_tracking(
         coordinate_system=coordinates,
         only_alive=only_alive,
     )
-    with open_as_file(meta_data) as meta_data_fp, open_as_file(
-        raw_data
-    ) as raw_data_fp:
-        return deserializer.deserialize(
-            inputs=SportecTrackingDataInputs(
-                meta_data=meta_data_fp, raw_data=raw_data_fp
-            )
-        )
+    opened_inputs = prefetch_inputs([meta_data, raw_data])
+    with closing(opened_inputs):
+        with next(opened_inputs) as meta_data_fp:
+            with next(opened_inputs) as raw_data_fp:
+                return deserializer.deserialize(
+                    inputs=SportecTrackingDataInputs(
+                        meta_data=meta_data_fp, raw_data=raw_data_fp
+                    )
+                )
 
 
 @deprecated("sportec.load_event should be used")
@@ -14,10 +14,14 @@ cache_dir = os.environ.get("KLOPPY_CACHE_DIR")
 if not cache_dir:
     cache_dir = os.path.expanduser("~/kloppy_cache")
 
+# Parsed when the cache is used, so an invalid value doesn't break the import
+cache_max_size = os.environ.get("KLOPPY_CACHE_MAX_SIZE") or None
+
 Config = TypedDict(
     "Config",
     {
         "cache": Optional[str],
+        "cache.max_size": Optional[Union[int, str]],
         "coordinate_system": Optional[str],
         "event_factory": Optional[EventFactory],
         "adapters.http.basic_authentication": Optional[str],
@@ -26,18 +30,21 @@ Config = TypedDict(
         "dataframe.engine": Optional[
             Union[Literal["pandas"], Literal["polars"]]
         ],
+        "prefetch.concurrency": Optional[int],
     },
 )
 
 # https://github.com/python/mypy/issues/6262
 CONFIG_KEYS = Literal[
     "cache",
+    "cache.max_size",
     "coordinate_system",
     "event_factory",
     "adapters.http.basic_authentication",
     "adapters.s3.s3fs",
     "adapters.zip.fo",
     "dataframe.engine",
+    "prefetch.concurrency",
 ]
 
 
@@ -47,12 +54,14 @@ class PartialConfig(Config, total=False):
 
 _default_config: Config = {
     "cache": cache_dir,
+    "cache.max_size": cache_max_size,
     "coordinate_system": "kloppy",
     "event_factory": None,
     "adapters.http.basic_authentication": None,
     "adapters.s3.s3fs": None,
     "adapters.zip.fo": None,
     "dataframe.engine": "pandas",
+    "prefetch.concurrency": 8,
 }
 
 config = copy(_default_config)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import os
 import sys
+import uuid
+import warnings
+import weakref
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from collections.abc import Sequence
+from copy import copy
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum, Flag
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,17 +21,24 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Literal,
+    NamedTuple,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     overload,
 )
 
-from kloppy.utils import deprecated, snake_case
+from kloppy.utils import add_slots, deprecated, snake_case
 
 if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+    import pyarrow as pa
+
     from ..services.transformers.data_record import (
         Column,
         NamedColumns,
@@ -1508,6 +1523,7 @@ class ActionValue(Statistic):
         return self.offensive_value - self.defensive_value
 
 
+@add_slots("_index")
 @dataclass
 class DataRecord(ABC):
     """
@@ -1515,8 +1531,10 @@ class DataRecord(ABC):
 
     Attributes:
         dataset: The dataset to which the record belongs.
-        prev_record: The previous record in the dataset.
-        next_record: The next record in the dataset.
+        prev_record: The previous record in the dataset. Derived from the
+            position of the record in the dataset.
+        next_record: The next record in the dataset. Derived from the
+            position of the record in the dataset.
         record_id: The unique identifier of the record. Given by the provider.
         period: The match period in which the observation occurred.
         timestamp: Timestamp of occurrence, relative to the period kick-off.
@@ -1527,8 +1545,6 @@ class DataRecord(ABC):
     """
 
     dataset: Dataset = field(init=False)
-    prev_record: Optional[Self] = field(init=False)
-    next_record: Optional[Self] = field(init=False)
     period: Period
     timestamp: timedelta
     statistics: List[Statistic]
@@ -1547,17 +1563,56 @@ class DataRecord(ABC):
     def set_refs(
         self,
         dataset: Dataset,
-        prev: Optional[Self],
-        next_: Optional[Self],
+        prev: Optional[Self] = None,
+        next_: Optional[Self] = None,
+        index: Optional[int] = None,
     ):
-        if hasattr(self, "dataset"):
-            # TODO: determine if next/prev record should be affected
-            # by Dataset.filter
-            return
+        """
+        Link the record to the dataset it belongs to.
+
+        A record belongs to the last dataset that was created with it. Views
+        on the dataset, for example from `filter`, share the record without
+        linking it, so navigating with `prev` and `next` stays within the
+        owning dataset.
 
+        The previous and next record are no longer stored on the record, but
+        derived from its position in `dataset.records`. The record keeps a
+        strong reference to the dataset, so the dataset and its records
+        still form a reference cycle that is cleaned up by the garbage
+        collector.
+
+        Arguments:
+            dataset: The dataset the record is part of.
+            prev: Deprecated and ignored.
+            next_: Deprecated and ignored.
+            index: The position of the record in `dataset.records`. When
+                omitted, the position is looked up when it's first needed.
+        """
+        if index is None:
+            warnings.warn(
+                "Calling set_refs without an index is deprecated and will be "
+                "removed in a future version. The prev and next_ arguments "
+                "are ignored; the neighbouring records are derived from the "
+                "position of the record in the dataset.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.dataset = dataset
-        self.prev_record = prev
-        self.next_record = next_
+        self._index = -1 if index is None else index
+
+    @property
+    def prev_record(self) -> Optional[Self]:
+        position = self.dataset._get_record_position(self)
+        if position is not None and position > 0:
+            return self.dataset.records[position - 1]
+        return None
+
+    @property
+    def next_record(self) -> Optional[Self]:
+        position = self.dataset._get_record_position(self)
+        if position is not None and position + 1 < len(self.dataset.records):
+            return self.dataset.records[position + 1]
+        return None
 
     @property
     def attacking_direction(self):
@@ -1676,6 +1731,335 @@ class Metadata:
 T = TypeVar("T", bound="DataRecord")
 
 
+def _to_seconds(timestamp: Union[timedelta, float]) -> float:
+    if isinstance(timestamp, timedelta):
+        return timestamp.total_seconds()
+    return timestamp
+
+
+def _record_time_key(record: DataRecord) -> Optional[Tuple[int, float]]:
+    if record.period is None or record.timestamp is None:
+        return None
+    return record.period.id, _to_seconds(record.timestamp)
+
+
+def _time_key(time: Time) -> Tuple[int, float]:
+    if not isinstance(time, Time):
+        raise KloppyParameterError(
+            f"Expected a Time object, but got {time.__class__.__name__}"
+        )
+    return time.period.id, _to_seconds(time.timestamp)
+
+
+class RecordsView(Sequence):
+    """
+    Read-only view on a subset of the records of a dataset.
+
+    The view holds the records of the parent dataset and the positions of
+    the records that are part of the view. Records are only looked up when
+    they are accessed, and views created from a view refer to the records
+    of the parent directly.
+
+    Examples:
+        >>> view = dataset.filter("pass").records
+        >>> events = view.to_list()
+    """
+
+    __slots__ = ("_records", "_indices")
+
+    def __init__(self, records: Sequence, indices: Sequence[int]):
+        self._records = records
+        self._indices = indices
+
+    @property
+    def indices(self) -> Sequence[int]:
+        """The positions of the records in the parent records."""
+        return self._indices
+
+    def view(self, indices: Sequence[int]) -> RecordsView:
+        """Return a view on the records at `indices` within this view."""
+        return RecordsView(self._records, [self._indices[i] for i in indices])
+
+    def to_list(self) -> list:
+        """Return the records in the view as a list."""
+        return list(self)
+
+    @property
+    def record_ids(self) -> list:
+        record_ids = self._records.record_ids
+        return [record_ids[i] for i in self._indices]
+
+    @property
+    def record_times(self) -> list:
+        record_times = self._records.record_times
+        return [record_times[i] for i in self._indices]
+
+    @property
+    def record_period_ids(self) -> list:
+        record_period_ids = self._records.record_period_ids
+        return [record_period_ids[i] for i in self._indices]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return RecordsView(self._records, self._indices[item])
+        return self._records[self._indices[item]]
+
+    def __iter__(self):
+        records = self._records
+        for index in self._indices:
+            yield records[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (RecordsView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} record_count={len(self)}>"
+
+
+class _Categorical(NamedTuple):
+    """
+    Column values stored as codes into a list of categories.
+
+    A code of `-1` is a missing value. The engines of `Dataset.to_df`
+    convert it to their categorical type.
+    """
+
+    codes: "np.ndarray"
+    categories: list
+
+    def to_list(self) -> list:
+        categories = self.categories + [None]
+        return [categories[code] for code in self.codes.tolist()]
+
+    def to_pandas(self):
+        from pandas import Categorical
+
+        return Categorical.from_codes(self.codes, categories=self.categories)
+
+    def to_arrow(self):
+        import pyarrow as pa
+
+        return pa.DictionaryArray.from_arrays(
+            pa.array(self.codes, mask=self.codes < 0),
+            pa.array(self.categories),
+        )
+
+    def to_polars(self):
+        from polars import Categorical, Series
+
+        return Series(values=self.to_list(), dtype=Categorical)
+
+
+def _column_to_list(values: Any) -> list:
+    """Convert a column of `Dataset._to_df_columns` to a list of values."""
+    if isinstance(values, _Categorical):
+        return values.to_list()
+    if hasattr(values, "dtype"):
+        if values.dtype.kind == "f":
+            return [
+                None if value != value else value for value in values.tolist()
+            ]
+        return values.tolist()
+    return list(values)
+
+
+def _column_to_arrow(values: Any) -> "pa.Array":
+    """Convert a column of `Dataset._to_df_columns` to an Arrow array."""
+    import pyarrow as pa
+
+    if isinstance(values, _Categorical):
+        return values.to_arrow()
+    if hasattr(values, "dtype"):
+        return pa.array(values, from_pandas=True)
+    return pa.array(values)
+
+
+def _columns_to_polars(data: Dict[str, Any]) -> "pl.DataFrame":
+    """Convert the columns of `Dataset._to_df_columns` to a polars DataFrame."""
+    from polars import DataFrame
+
+    return DataFrame(
+        {
+            name: (
+                values.to_polars()
+                if isinstance(values, _Categorical)
+                else values
+            )
+            for name, values in data.items()
+        },
+        nan_to_null=True,
+    )
+
+
+class _PolarsScan:
+    """
+    The source of the LazyFrame returned by `Dataset.to_polars_lazy`.
+
+    The columns of the schema are found by converting the first record of
+    each distinct row layout (see `Dataset._layout_sample`), so they are the
+    same as the columns of `to_df`. Function columns are called for every
+    record to find these layouts. Columns without any value in these
+    records are typed in a single pass over the dataset, which converts only
+    those columns and stops as soon as all of them have a value. While
+    scanning, only the projected columns are converted. A predicate is
+    evaluated on the columns it refers to first, and the other columns are
+    only converted for the records that match it.
+    """
+
+    def __init__(
+        self,
+        dataset: "Dataset",
+        columns: tuple,
+        named_columns: Dict[str, Any],
+        batch_size: int = 10_000,
+    ):
+        self.dataset = dataset
+        self.columns = columns
+        self.named_columns = named_columns
+        self.batch_size = batch_size
+        self._schema = None
+        # The output columns of each column spec
+        self._outputs: List[Tuple[Any, List[str]]] = []
+
+    def schema(self) -> "pl.Schema":
+        if self._schema is None:
+            self._schema = self._infer_schema()
+        return self._schema
+
+    def _infer_schema(self) -> "pl.Schema":
+        import polars as pl
+
+        sample = self.dataset._layout_sample(
+            *self.columns, **self.named_columns
+        )
+
+        if not self.columns and not self.named_columns:
+            schema = dict(_columns_to_polars(sample._to_df_columns()).schema)
+            self._outputs = [(name, [name]) for name in schema]
+        else:
+            schema = {}
+            for column in self.columns:
+                df = _columns_to_polars(sample._to_df_columns(column))
+                self._outputs.append((column, df.columns))
+                schema.update(df.schema)
+            for name, column in self.named_columns.items():
+                df = _columns_to_polars(
+                    sample._to_df_columns(**{name: column})
+                )
+                self._outputs.append(({name: column}, df.columns))
+                schema.update(df.schema)
+
+        # Type the columns without a value in the sample in one shared pass
+        untyped = [name for name, dtype in schema.items() if dtype == pl.Null]
+        for start in range(0, len(self.dataset.records), self.batch_size):
+            if not untyped:
+                break
+            batch = self.dataset[start : start + self.batch_size]
+            df = self._convert(batch, untyped, schema=None)
+            for name in untyped:
+                schema[name] = df[name].dtype
+            untyped = [name for name in untyped if schema[name] == pl.Null]
+
+        return pl.Schema(schema)
+
+    def _convert(
+        self,
+        dataset: "Dataset",
+        names: List[str],
+        schema: Optional["pl.Schema"],
+    ) -> "pl.DataFrame":
+        """Convert the records of `dataset` to the columns `names`."""
+        import polars as pl
+
+        columns = []
+        named_columns = {}
+        for column, outputs in self._outputs:
+            if any(name in names for name in outputs):
+                if isinstance(column, dict):
+                    named_columns.update(column)
+                else:
+                    columns.append(column)
+
+        if columns or named_columns:
+            df = _columns_to_polars(
+                dataset._to_df_columns(*columns, **named_columns)
+            )
+        else:
+            df = pl.DataFrame()
+        if not len(df.columns):
+            df = pl.DataFrame(
+                schema={
+                    name: pl.Null if schema is None else schema[name]
+                    for name in names
+                }
+            )
+        # Function columns only have the keys returned for these records
+        missing = [name for name in names if name not in df.columns]
+        if missing:
+            df = df.with_columns(pl.lit(None).alias(name) for name in missing)
+        if schema is None:
+            return df.select(names)
+        return df.select(names).cast({name: schema[name] for name in names})
+
+    def __call__(
+        self,
+        with_columns: Optional[List[str]],
+        predicate: Optional["pl.Expr"],
+        n_rows: Optional[int],
+        batch_size: Optional[int],
+    ) -> Iterator["pl.DataFrame"]:
+        schema = self.schema()
+        names = list(schema) if with_columns is None else with_columns
+        predicate_names = (
+            predicate.meta.root_names() if predicate is not None else []
+        )
+        other_names = [name for name in names if name not in predicate_names]
+        batch_size = batch_size or self.batch_size
+
+        for start in range(0, len(self.dataset.records), batch_size):
+            if n_rows is not None and n_rows <= 0:
+                return
+
+            batch = self.dataset[start : start + batch_size]
+            if predicate is not None:
+                df = self._convert(batch, predicate_names, schema)
+                mask = df.select(predicate).to_series().fill_null(False)
+                indices = mask.arg_true().to_list()
+                if not indices:
+                    continue
+                if len(indices) < len(mask):
+                    batch = batch._view(indices)
+                    df = df.filter(mask)
+                if other_names:
+                    df = df.hstack(self._convert(batch, other_names, schema))
+                df = df.select(names)
+            else:
+                df = self._convert(batch, names, schema)
+
+            if n_rows is not None:
+                df = df.head(n_rows)
+                n_rows -= len(df)
+            yield df
+
+
+# Maximum number of batches `Dataset.to_parquet` holds back while it looks
+# for the types of columns that only have nulls so far
+_MAX_BUFFERED_BATCHES = 10
+
+# Lazily built indexes that are only valid for the records they were built for
+_DATASET_INDEXES = (
+    "_record_index",
+    "_time_index",
+    "_position_index",
+    "_position_index_misses",
+)
+
+
 @dataclass
 class Dataset(ABC, Generic[T]):
     """
@@ -1697,20 +2081,28 @@ class Dataset(ABC, Generic[T]):
         return iter(self.records)
 
     def __getitem__(self, item):
+        """
+        Return the record at position `item`.
+
+        Slicing returns a view on the records, like `filter`, instead of a
+        list of records. Use `dataset[2:6].records` or `list(dataset[2:6])`
+        where a sequence of records is needed.
+        """
+        if isinstance(item, slice):
+            return self._view(range(len(self.records))[item])
         return self.records[item]
 
     def __len__(self):
         return len(self.records)
 
     def __post_init__(self):
-        for i, record in enumerate(self.records):
-            record.set_refs(
-                dataset=self,
-                prev=self.records[i - 1] if i > 0 else None,
-                next_=(
-                    self.records[i + 1] if i + 1 < len(self.records) else None
-                ),
-            )
+        if hasattr(self.records, "set_refs"):
+            # Lazily materialized records (e.g. `ColumnarFrames`) are
+            # linked when they are accessed
+            self.records.set_refs(self)
+        else:
+            for i, record in enumerate(self.records):
+                record.set_refs(dataset=self, index=i)
 
         self._init_player_positions()
         self._update_formations_and_positions()
@@ -1755,6 +2147,10 @@ class Dataset(ABC, Generic[T]):
         """
         Filter all records used `filter_`
 
+        The returned dataset is a view on the records of this dataset: the
+        records are neither copied nor re-linked. Use `materialize` to get
+        a dataset with its own list of records.
+
         Args:
             filter_: The filter to be used to filter the records. It can be a
                 callable that takes a record and returns a boolean, or a string
@@ -1766,11 +2162,86 @@ class Dataset(ABC, Generic[T]):
             >>> dataset = dataset.filter(lambda event: event.event_type == EventType.PASS)
             >>> dataset = dataset.filter('pass')
         """
-        return replace(
-            self,
-            records=self.find_all(filter_),
+        return self._view(
+            [
+                position
+                for position, record in enumerate(self.records)
+                if record.matches(filter_)
+            ]
+        )
+
+    def select_period(self, period: Union[Period, int]) -> Self:
+        """
+        Select the records of a single period.
+
+        Like `filter`, this returns a view on the records of this dataset.
+
+        Args:
+            period: The period or the identifier of the period.
+
+        Examples:
+            >>> first_half = dataset.select_period(1)
+        """
+        period_id = period.id if isinstance(period, Period) else period
+        period_ids = getattr(self.records, "record_period_ids", None)
+        if period_ids is None:
+            period_ids = [
+                record.period.id if record.period is not None else None
+                for record in self.records
+            ]
+        return self._view(
+            [
+                position
+                for position, period_id_ in enumerate(period_ids)
+                if period_id_ == period_id
+            ]
         )
 
+    def materialize(self) -> Self:
+        """
+        Return a dataset that holds its own list of records.
+
+        Datasets returned by `filter`, `select_period` or slicing are views
+        on the records of the dataset they were created from. Use this to
+        get a dataset with a plain list of records, for example before
+        adding or removing records. The records are copied and linked to the
+        new dataset, so navigating with `prev` and `next` stays within it.
+        """
+        if not isinstance(self.records, RecordsView):
+            return self
+        records = [copy(record) for record in self.records]
+        dataset = self._with_records(records)
+        for i, record in enumerate(records):
+            record.set_refs(dataset=dataset, index=i)
+        return dataset
+
+    def _view(self, indices: Sequence[int]) -> Self:
+        """
+        Return a dataset with a view on the records at `indices`.
+
+        The records are not copied and are still linked to the dataset that
+        owns them. The dataset is created without running `__post_init__`,
+        so player positions and formations are left untouched.
+        """
+        records = self.records
+        if isinstance(records, RecordsView):
+            return self._with_records(records.view(indices))
+        return self._with_records(RecordsView(records, indices))
+
+    def _with_records(self, records: Sequence[T]) -> Self:
+        dataset = copy(self)
+        for name in _DATASET_INDEXES:
+            dataset.__dict__.pop(name, None)
+        dataset.records = records
+        return dataset
+
+    def __getstate__(self):
+        # The indexes are rebuilt when they are needed after unpickling
+        state = self.__dict__.copy()
+        for name in _DATASET_INDEXES:
+            state.pop(name, None)
+        return state
+
     def map(self, mapper):
         return replace(
             self, records=[mapper(record) for record in self.records]
@@ -1819,15 +2290,227 @@ class Dataset(ABC, Generic[T]):
         )
 
     def get_record_by_id(self, record_id: Union[int, str]) -> Optional[T]:
-        for record in self.records:
+        """
+        Return the first record with the given identifier.
+
+        The lookup uses an index from record identifier to position that is
+        built on first use and rebuilt when `records` changes. When the
+        identifier is not found, or the record found has another identifier
+        because records were replaced in place, the index is rebuilt once.
+        """
+        record_index = getattr(self, "_record_index", None)
+        position = self._get_record_index().get(record_id)
+        if position is not None:
+            record = self.records[position]
             if record.record_id == record_id:
                 return record
+        if self._record_index is not record_index:
+            # The index was just built, so it's up to date
+            return None
+
+        # Records were replaced in place
+        self._record_index = None
+        position = self._get_record_index().get(record_id)
+        if position is None:
+            return None
+        return self.records[position]
+
+    def _get_record_index(self) -> Dict[Union[int, str], int]:
+        """
+        Return the index from record identifier to position in `records`.
+
+        The index is invalidated when `records` is replaced or its length
+        changes. The returned object is replaced on every rebuild, so it can
+        also be used as a version token by caches built on top of it.
+        """
+        key = (id(self.records), len(self.records))
+        record_index = getattr(self, "_record_index", None)
+        if record_index is None or self._record_index_key != key:
+            record_ids = getattr(self.records, "record_ids", None)
+            if record_ids is None:
+                record_ids = [record.record_id for record in self.records]
+
+            record_index = {}
+            for position, record_id in enumerate(record_ids):
+                # keep the first record when identifiers are not unique
+                record_index.setdefault(record_id, position)
+
+            self._record_index = record_index
+            self._record_index_key = key
+        return record_index
+
+    def at(self, time: Time) -> Optional[T]:
+        """
+        Return the record at `time`.
+
+        This is the last record at or before `time` within the same period.
+        The lookup uses an index sorted on period and timestamp, which is
+        built on first use.
+
+        Args:
+            time: The time to look up.
+
+        Examples:
+            >>> from datetime import timedelta
+            >>> from kloppy.domain import Time
+            >>> period = dataset.metadata.periods[1]
+            >>> frame = dataset.at(Time(period=period, timestamp=timedelta(minutes=12, seconds=30)))
+        """
+        keys, positions = self._get_time_index()
+        key = _time_key(time)
+        idx = bisect_right(keys, key) - 1
+        if idx < 0 or keys[idx][0] != key[0]:
+            return None
+        return self.records[positions[idx]]
+
+    def between(self, start_time: Time, end_time: Time) -> List[T]:
+        """
+        Return all records from `start_time` up to and including `end_time`.
+
+        The records are returned in chronological order.
+
+        Args:
+            start_time: The start of the time window.
+            end_time: The end of the time window.
+
+        Examples:
+            >>> from datetime import timedelta
+            >>> frames = dataset.between(event.time - timedelta(seconds=2), event.time)
+        """
+        keys, positions = self._get_time_index()
+        lo = bisect_left(keys, _time_key(start_time))
+        hi = bisect_right(keys, _time_key(end_time))
+        return [self.records[position] for position in positions[lo:hi]]
+
+    def nearest(
+        self,
+        time: Time,
+        tolerance: Optional[Union[timedelta, float]] = None,
+    ) -> Optional[T]:
+        """
+        Return the record closest to `time` within the same period.
+
+        When two records are equally close, the earliest one is returned.
+
+        Args:
+            time: The time to look up.
+            tolerance: The maximum time difference, as a timedelta or in
+                seconds. Returns `None` when the closest record is further
+                away.
+
+        Examples:
+            >>> frame = tracking_dataset.nearest(event.time, tolerance=0.1)
+        """
+        keys, positions = self._get_time_index()
+        period_id, seconds = _time_key(time)
+        idx = bisect_left(keys, (period_id, seconds))
+
+        best_idx, best_diff = None, None
+        for candidate in (idx - 1, idx):
+            if 0 <= candidate < len(keys) and keys[candidate][0] == period_id:
+                diff = abs(keys[candidate][1] - seconds)
+                if best_diff is None or diff < best_diff:
+                    best_idx, best_diff = candidate, diff
+
+        if best_idx is None:
+            return None
+        if isinstance(tolerance, timedelta):
+            tolerance = tolerance.total_seconds()
+        if tolerance is not None and best_diff > tolerance:
+            return None
+        return self.records[positions[best_idx]]
+
+    def _get_record_position(self, record: DataRecord) -> Optional[int]:
+        """
+        Return the position of `record` in `records`.
+
+        The position stored on the record is used when it is still valid.
+        When records were inserted, removed or reordered after the dataset
+        was created, the position is looked up in an index of positions by
+        record identity and stored on the record again.
+        Returns `None` when the record is no longer part of the dataset. This
+        is remembered until the records change, so removed records don't
+        rebuild the index on every call.
+        """
+        records = self.records
+        position = record._index
+        if hasattr(records, "set_refs"):
+            # Lazily materialized records never move
+            return position if position >= 0 else None
+        if 0 <= position < len(records) and records[position] is record:
+            return position
+
+        key = (id(records), len(records))
+        position_index = getattr(self, "_position_index", None)
+        if position_index is None or self._position_index_key != key:
+            position_index = None
+        else:
+            position = position_index.get(id(record))
+            if position is None:
+                missing = self._position_index_misses.get(id(record))
+                if missing is not None and missing() is record:
+                    # Already looked up since the records last changed
+                    return None
+                # Records were replaced in place
+                position_index = None
+            elif records[position] is not record:
+                # Records were reordered in place
+                position_index = None
+        if position_index is None:
+            position_index = {
+                id(record_): position_
+                for position_, record_ in enumerate(records)
+            }
+            self._position_index = position_index
+            self._position_index_key = key
+            self._position_index_misses = {}
+
+        position = position_index.get(id(record))
+        if position is not None:
+            record._index = position
+        else:
+            self._position_index_misses[id(record)] = weakref.ref(record)
+        return position
+
+    def _get_time_index(self) -> Tuple[List[Tuple[int, float]], List[int]]:
+        """
+        Return the (period id, seconds) keys of the records in chronological
+        order, together with the position of each record in `records`.
+
+        Records without a period or timestamp are left out. The index is
+        rebuilt when `records` is replaced or its length changes.
+        """
+        key = (id(self.records), len(self.records))
+        time_index = getattr(self, "_time_index", None)
+        if time_index is None or self._time_index_key != key:
+            record_times = getattr(self.records, "record_times", None)
+            if record_times is None:
+                record_times = [
+                    _record_time_key(record) for record in self.records
+                ]
+
+            positions = sorted(
+                (
+                    position
+                    for position, record_time in enumerate(record_times)
+                    if record_time is not None
+                ),
+                key=record_times.__getitem__,
+            )
+            time_index = (
+                [record_times[position] for position in positions],
+                positions,
+            )
+            self._time_index = time_index
+            self._time_index_key = key
+        return time_index
 
     @overload
     def to_records(
         self,
         *columns: Unpack[tuple[Column]],
         as_list: Literal[True] = True,
+        layout: Literal["wide", "long"] = "wide",
         **named_columns: NamedColumns,
     ) -> List[Dict[str, Any]]:
         ...
@@ -1837,6 +2520,7 @@ class Dataset(ABC, Generic[T]):
         self,
         *columns: Unpack[tuple[Column]],
         as_list: Literal[False] = False,
+        layout: Literal["wide", "long"] = "wide",
         **named_columns: NamedColumns,
     ) -> Iterable[Dict[str, Any]]:
         ...
@@ -1845,14 +2529,26 @@ class Dataset(ABC, Generic[T]):
         self,
         *columns: Unpack[tuple[Column]],
         as_list: bool = True,
+        layout: Literal["wide", "long"] = "wide",
         **named_columns: NamedColumns,
     ) -> Union[List[Dict[str, Any]], Iterable[Dict[str, Any]]]:
-        from ..services.transformers.data_record import get_transformer_cls
+        if layout != "wide":
+            data = self._to_df_columns(
+                *columns, layout=layout, **named_columns
+            )
+            iterator = (
+                dict(zip(data.keys(), row))
+                for row in zip(*map(_column_to_list, data.values()))
+            )
+        else:
+            from ..services.transformers.data_record import (
+                get_transformer_cls,
+            )
 
-        transformer = get_transformer_cls(self.dataset_type)(
-            *columns, **named_columns
-        )
-        iterator = map(transformer, self.records)
+            transformer = get_transformer_cls(self.dataset_type)(
+                *columns, **named_columns
+            )
+            iterator = map(transformer, self.records)
         if as_list:
             return list(iterator)
         else:
@@ -1884,6 +2580,53 @@ class Dataset(ABC, Generic[T]):
                 f"Orient {orient} is not supported. Only orient='list' is supported"
             )
 
+    def _to_df_columns(
+        self,
+        *columns: Unpack[tuple[Column]],
+        layout: Literal["wide", "long"] = "wide",
+        **named_columns: NamedColumns,
+    ) -> Dict[str, Any]:
+        """
+        Return the columns used by `to_df`.
+
+        Values are lists, NumPy arrays or categorical columns. Missing
+        values in float arrays are stored as `NaN` and converted to nulls by
+        the engines that support them.
+        """
+        if layout != "wide":
+            raise KloppyParameterError(
+                f"Layout {layout} is not supported for {self.dataset_type}"
+            )
+        return self.to_dict(*columns, orient="list", **named_columns)
+
+    def _layout_sample(
+        self,
+        *columns: Unpack[tuple[Column]],
+        **named_columns: NamedColumns,
+    ) -> Self:
+        """
+        Return a view on the first record of each distinct row layout.
+
+        Converting the view with `_to_df_columns` gives the same columns,
+        in the same order, as converting the full dataset. The layouts are
+        found with the `row_signature` of the transformer, which does not
+        create the default row of the records, but does call the function
+        columns of every record.
+        """
+        from ..services.transformers.data_record import get_transformer_cls
+
+        transformer = get_transformer_cls(self.dataset_type)(
+            *columns, **named_columns
+        )
+        signatures = set()
+        indices = []
+        for i, record in enumerate(self.records):
+            signature = transformer.row_signature(record)
+            if signature not in signatures:
+                signatures.add(signature)
+                indices.append(i)
+        return self._view(indices)
+
     def to_df(
         self,
         *columns: Unpack[tuple[Column]],
@@ -1894,8 +2637,27 @@ class Dataset(ABC, Generic[T]):
                 Literal["pandas[pyarrow]"],
             ]
         ] = None,
+        layout: Literal["wide", "long"] = "wide",
         **named_columns: NamedColumns,
     ):
+        """
+        Export the dataset to a DataFrame.
+
+        Args:
+            columns: The columns to export. Strings select columns of the
+                default export (wildcards are supported) or attributes of
+                the records. Callables return a dictionary of columns.
+            engine: The DataFrame library to use. Defaults to the
+                `dataframe.engine` config.
+            layout: `"wide"` exports one row per record. Tracking datasets
+                also support `"long"`, which exports one row per player per
+                frame.
+            named_columns: Columns to add, as a value or a callable.
+
+        Examples:
+            >>> df = dataset.to_df("timestamp", "ball_*", engine="polars")
+            >>> df = tracking_dataset.to_df(layout="long")
+        """
         from kloppy.config import get_config
 
         if not engine:
@@ -1926,7 +2688,12 @@ class Dataset(ABC, Generic[T]):
                 )
 
             table = pa.Table.from_pydict(
-                self.to_dict(*columns, orient="list", **named_columns)
+                {
+                    name: _column_to_arrow(values)
+                    for name, values in self._to_df_columns(
+                        *columns, layout=layout, **named_columns
+                    ).items()
+                }
             )
             return table.to_pandas(types_mapper=types_mapper)
 
@@ -1940,23 +2707,270 @@ class Dataset(ABC, Generic[T]):
                 )
 
             return DataFrame.from_dict(
-                self.to_dict(*columns, orient="list", **named_columns)
+                {
+                    name: (
+                        values.to_pandas()
+                        if isinstance(values, _Categorical)
+                        else values
+                    )
+                    for name, values in self._to_df_columns(
+                        *columns, layout=layout, **named_columns
+                    ).items()
+                }
             )
         elif engine == "polars":
             try:
-                from polars import from_dict
+                import polars  # noqa: F401
             except ImportError:
                 raise ImportError(
                     "Seems like you don't have polars installed. Please"
                     " install it using: pip install polars"
                 )
 
-            return from_dict(
-                self.to_dict(*columns, orient="list", **named_columns)
+            return _columns_to_polars(
+                self._to_df_columns(*columns, layout=layout, **named_columns)
             )
         else:
             raise KloppyParameterError(f"Engine {engine} is not valid")
 
+    def to_polars_lazy(
+        self,
+        *columns: Unpack[tuple[Column]],
+        **named_columns: NamedColumns,
+    ) -> "pl.LazyFrame":
+        """
+        Export the dataset to a polars LazyFrame.
+
+        The records are only converted when the LazyFrame is collected.
+        Column selections and filters are pushed down to the conversion:
+        only the selected columns are converted, and a filter is first
+        evaluated on the columns it refers to, so the other columns are only
+        converted for the matching records. Filters on the columns that
+        don't need the full default row, such as `period_id`, `timestamp`,
+        `event_type` or `team_id`, are the cheapest.
+
+        The schema has the same columns as
+        [`to_df`][kloppy.domain.Dataset.to_df]. It is inferred from the
+        first record of each distinct row layout (for example, each
+        combination of event type and qualifiers), so only a small part of
+        the dataset is converted. Function columns are the exception: the
+        keys they return can differ per record, so they are called for every
+        record to infer the schema, and again when the LazyFrame is
+        collected.
+
+        Args:
+            columns: The columns to export, like in
+                [`to_df`][kloppy.domain.Dataset.to_df].
+            named_columns: Columns to add, as a value or a callable.
+
+        Examples:
+            >>> import polars as pl
+            >>> shots = (
+            ...     event_dataset.to_polars_lazy()
+            ...     .filter(pl.col("event_type") == "SHOT")
+            ...     .select("player_id", "coordinates_x", "coordinates_y")
+            ...     .collect()
+            ... )
+        """
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have polars installed. Please"
+                " install it using: pip install polars"
+            )
+        try:
+            from polars.io.plugins import register_io_source
+        except ImportError:
+            raise ImportError(
+                "Seems like you have an older version of polars installed."
+                " Please upgrade it using: pip install --upgrade polars"
+            )
+
+        scan = _PolarsScan(self, columns, named_columns)
+        return register_io_source(scan, schema=scan.schema)
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        *columns: Unpack[tuple[Column]],
+        layout: Literal["wide", "long"] = "wide",
+        **named_columns: NamedColumns,
+    ) -> Iterator["pa.RecordBatch"]:
+        """
+        Export the dataset as a stream of Arrow record batches.
+
+        Only one batch of records is converted at a time, so memory use is
+        proportional to `batch_size` instead of the length of the dataset.
+        The columns are selected like in [`to_df`][kloppy.domain.Dataset.to_df].
+        Batches only contain the columns that have values in their records,
+        so the schema can differ between batches.
+
+        Args:
+            batch_size: The number of records per batch. With the long
+                layout, a batch contains a row per player for each frame.
+            columns: The columns to export.
+            layout: The layout of the export. See `to_df`.
+            named_columns: Columns to add, as a value or a callable.
+
+        Examples:
+            >>> for batch in dataset.iter_batches(10_000, "timestamp", "ball_*"):
+            ...     process(batch)
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pyarrow installed. Please"
+                " install it using: pip install pyarrow"
+            )
+
+        if batch_size < 1:
+            raise KloppyParameterError("batch_size should be at least 1")
+
+        for start in range(0, len(self.records), batch_size):
+            batch = self[start : start + batch_size]
+            yield pa.RecordBatch.from_pydict(
+                {
+                    name: _column_to_arrow(values)
+                    for name, values in batch._to_df_columns(
+                        *columns, layout=layout, **named_columns
+                    ).items()
+                }
+            )
+
+    def to_parquet(
+        self,
+        path: Union[str, "os.PathLike"],
+        *columns: Unpack[tuple[Column]],
+        row_group_size: int = 10_000,
+        partition_by: Optional[List[str]] = None,
+        layout: Literal["wide", "long"] = "wide",
+        **named_columns: NamedColumns,
+    ) -> None:
+        """
+        Write the dataset to Parquet without holding the export in memory.
+
+        The dataset is converted in batches of `row_group_size` records with
+        [`iter_batches`][kloppy.domain.Dataset.iter_batches], and each batch
+        is converted only once. The file has the same columns as
+        [`to_df`][kloppy.domain.Dataset.to_df]. They are found by converting
+        the first record of each distinct row layout. Columns that are
+        missing in a batch are written as nulls. The type of a column comes
+        from its first value. The first batches are held back until every
+        column has a type.
+
+        Args:
+            path: The file to write to. When `partition_by` is given, this is
+                the directory of a hive-partitioned dataset.
+            columns: The columns to export. See `to_df`.
+            row_group_size: The number of records per row group.
+            partition_by: The columns to partition the dataset by.
+            layout: The layout of the export. See `to_df`.
+            named_columns: Columns to add, as a value or a callable.
+
+        Examples:
+            >>> dataset.to_parquet("match.parquet")
+            >>> dataset.to_parquet("match", partition_by=["period_id"])
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pyarrow installed. Please"
+                " install it using: pip install pyarrow"
+            )
+
+        def to_batch(data: Dict[str, Any]) -> "pa.RecordBatch":
+            return pa.RecordBatch.from_pydict(
+                {
+                    name: _column_to_arrow(values)
+                    for name, values in data.items()
+                }
+            )
+
+        # The columns, in the order of `to_df`, come from the first record
+        # of each row layout. Columns without a value in those records get
+        # their type from the first batch that has one.
+        sample = self._layout_sample(*columns, **named_columns)
+        schema = to_batch(
+            sample._to_df_columns(*columns, layout=layout, **named_columns)
+        ).schema
+        untyped = {
+            field.name for field in schema if pa.types.is_null(field.type)
+        }
+
+        def resolve_types(batch: "pa.RecordBatch"):
+            nonlocal schema
+            for name in list(untyped):
+                if name in batch.schema.names:
+                    field = batch.schema.field(name)
+                    if not pa.types.is_null(field.type):
+                        schema = schema.set(
+                            schema.get_field_index(name), field
+                        )
+                        untyped.discard(name)
+
+        batches = self.iter_batches(
+            row_group_size, *columns, layout=layout, **named_columns
+        )
+        # Hold back the converted batches until all columns are typed
+        buffered = []
+        for batch in batches:
+            buffered.append(batch)
+            resolve_types(batch)
+            if not untyped or len(buffered) >= _MAX_BUFFERED_BATCHES:
+                break
+
+        if untyped and len(buffered) >= _MAX_BUFFERED_BATCHES:
+            # Look ahead for the remaining types instead of holding back
+            # more batches
+            rest = self[len(buffered) * row_group_size :]
+            for batch in rest.iter_batches(
+                row_group_size, *columns, layout=layout, **named_columns
+            ):
+                resolve_types(batch)
+                if not untyped:
+                    break
+
+        def conform(batch: "pa.RecordBatch") -> "pa.RecordBatch":
+            return pa.RecordBatch.from_arrays(
+                [
+                    (
+                        batch.column(field.name).cast(field.type)
+                        if field.name in batch.schema.names
+                        else pa.nulls(batch.num_rows, field.type)
+                    )
+                    for field in schema
+                ],
+                schema=schema,
+            )
+
+        batches = chain(buffered, batches)
+        if partition_by:
+            ds.write_dataset(
+                map(conform, batches),
+                path,
+                schema=schema,
+                format="parquet",
+                partitioning=partition_by,
+                partitioning_flavor="hive",
+                max_rows_per_group=row_group_size,
+                # unique file names, so several datasets can be written to
+                # the same directory
+                basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+        else:
+            with pq.ParquetWriter(path, schema) as writer:
+                for batch in batches:
+                    writer.write_table(
+                        pa.Table.from_batches([conform(batch)]),
+                        row_group_size=row_group_size,
+                    )
+
     def __repr__(self):
         return f"<{self.__class__.__name__} record_count={len(self.records)}>"
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass, fields
 from datetime import timedelta
 from enum import Enum
 from typing import (
@@ -332,6 +332,26 @@ class EventType(Enum):
         return self.value
 
 
+# Shared qualifier instances, keyed by qualifier class and value
+_QUALIFIER_INSTANCES: Dict[tuple, "Qualifier"] = {}
+# Whether the only field of a qualifier class is `value`
+_VALUE_ONLY_QUALIFIERS: Dict[type, bool] = {}
+
+
+def _shared_qualifier_key(cls: type, value: Any) -> Optional[tuple]:
+    """Return the key of the shared instance for a qualifier, if any."""
+    if not isinstance(value, (bool, Enum)):
+        return None
+    value_only = _VALUE_ONLY_QUALIFIERS.get(cls)
+    if value_only is None:
+        value_only = _VALUE_ONLY_QUALIFIERS[cls] = [
+            field_.name for field_ in fields(cls)
+        ] == ["value"]
+    if not value_only:
+        return None
+    return cls, value.__class__, value
+
+
 @dataclass
 class Qualifier(Generic[QualifierValueType], ABC):
     """
@@ -341,6 +361,9 @@ class Qualifier(Generic[QualifierValueType], ABC):
     about the specific event that occurred. Each event can have a series of
     qualifiers describing it.
 
+    Qualifiers with a boolean or enum value are shared: creating a qualifier
+    with the same class and value returns the same immutable instance.
+
     Attributes:
         name (str): The name of the qualifier.
         value (object): Contains any related information.
@@ -348,6 +371,42 @@ class Qualifier(Generic[QualifierValueType], ABC):
 
     value: QualifierValueType
 
+    def __new__(cls, *args, **kwargs):
+        if len(args) == 1 and not kwargs:
+            key = _shared_qualifier_key(cls, args[0])
+        elif not args and len(kwargs) == 1 and "value" in kwargs:
+            key = _shared_qualifier_key(cls, kwargs["value"])
+        else:
+            key = None
+
+        if key is None:
+            return super().__new__(cls)
+        instance = _QUALIFIER_INSTANCES.get(key)
+        if instance is None:
+            instance = _QUALIFIER_INSTANCES[key] = super().__new__(cls)
+        return instance
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self.__dict__ and self._is_shared():
+            # The dataclass __init__ assigns the value again when a shared
+            # instance is returned by __new__
+            if self.__dict__[name] == value:
+                return
+            raise FrozenInstanceError(
+                f"cannot assign to field '{name}' of a shared qualifier"
+            )
+        super().__setattr__(name, value)
+
+    def __reduce_ex__(self, protocol):
+        # Copies and unpickled qualifiers resolve to the shared instance
+        if self._is_shared():
+            return self.__class__, (self.value,)
+        return super().__reduce_ex__(protocol)
+
+    def _is_shared(self) -> bool:
+        key = _shared_qualifier_key(self.__class__, self.__dict__.get("value"))
+        return key is not None and _QUALIFIER_INSTANCES.get(key) is self
+
     @abstractmethod
     def to_dict(self) -> Dict[str, QualifierValueType]:
         """
@@ -676,6 +735,9 @@ class QualifierMixin(Generic[QualifierT]):
             >>> pass_event.get_qualifier_values(SetPieceQualifier)
             [<SetPieceType.GOAL_KICK: 'GOAL_KICK'>]
         """
+        if self.qualifiers is None:
+            return []
+
         return [
             qualifier.value
             for qualifier in self.qualifiers
@@ -761,11 +823,28 @@ class Event(DataRecord, ABC):
         if not self.dataset:
             raise OrphanedRecordError()
 
-        return [
+        # The resolved events are cached until the related event ids or the
+        # records of the dataset change
+        record_index = self.dataset._get_record_index()
+        cache = getattr(self, "_related_events_cache", None)
+        if (
+            cache is not None
+            and cache[0] is record_index
+            and cache[1] == self.related_event_ids
+        ):
+            return list(cache[2])
+
+        related_events = [
             event
             for event_id in self.related_event_ids
             if (event := self.dataset.get_record_by_id(event_id)) is not None
         ]
+        self._related_events_cache = (
+            record_index,
+            list(self.related_event_ids),
+            related_events,
+        )
+        return list(related_events)
 
     def get_related_event(
         self, type_: Union[str, EventType]
@@ -1403,6 +1482,10 @@ class PressureEvent(
         return "pressure"
 
 
+def _constant_row(row: Dict[str, Any]) -> Callable[[Event], Dict[str, Any]]:
+    return lambda _: row
+
+
 @dataclass(repr=False)
 @docstring_inherit_attributes(Dataset)
 class EventDataset(Dataset[Event]):
@@ -1497,6 +1580,72 @@ class EventDataset(Dataset[Event]):
 
         return add_state(self, *builder_keys)
 
+    def _to_df_columns(
+        self, *columns, layout: str = "wide", **named_columns
+    ) -> Dict[str, Any]:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            has_numpy = False
+        else:
+            has_numpy = True
+
+        if has_numpy and layout == "wide":
+            batch_columns = {
+                idx: column
+                for idx, column in enumerate(columns)
+                if callable(getattr(column, "transform_batch", None))
+            }
+            if batch_columns:
+                return self._to_df_batch_columns(
+                    columns, batch_columns, named_columns
+                )
+
+        if columns or named_columns or layout != "wide":
+            return super()._to_df_columns(
+                *columns, layout=layout, **named_columns
+            )
+
+        from ..services.transformers.attribute import DefaultEventTransformer
+
+        categorical = has_numpy
+
+        # Enum values are exported as categoricals when NumPy is available
+        return DefaultEventTransformer().transform_batch(
+            self.records, categorical=categorical
+        )
+
+    def _to_df_batch_columns(
+        self,
+        columns: tuple,
+        batch_columns: Dict[int, Any],
+        named_columns: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Return the `to_df` columns, computing the columns of transformers
+        with a `transform_batch` method for all events at once.
+
+        The other columns are converted event by event. The batch columns
+        are added at the position of their transformer.
+        """
+        batch_values = {
+            idx: column.transform_batch(self.records)
+            for idx, column in batch_columns.items()
+        }
+        # A placeholder keeps the position of the batch columns in the rows
+        columns = tuple(
+            (
+                _constant_row(dict.fromkeys(batch_values[idx]))
+                if idx in batch_values
+                else column
+            )
+            for idx, column in enumerate(columns)
+        )
+        data = self.to_dict(*columns, orient="list", **named_columns)
+        for values in batch_values.values():
+            data.update(values)
+        return data
+
     @deprecated(
         "to_pandas will be removed in the future. Please use to_df instead."
     )
@@ -1535,6 +1684,42 @@ class EventDataset(Dataset[Event]):
             map(generic_record_converter, self.records)
         )
 
+    def get_qualifier_column(
+        self, qualifier_type: Type[Qualifier]
+    ) -> List[Any]:
+        """
+        Return the value of a qualifier type for every event.
+
+        Args:
+            qualifier_type: The type of qualifier, for example
+                [`SetPieceQualifier`][kloppy.domain.models.event.SetPieceQualifier].
+
+        Returns:
+            A list with one value per event. The value is `None` for events
+            without a qualifier of this type.
+
+        Examples:
+            >>> from kloppy.domain import SetPieceQualifier
+            >>> set_pieces = dataset.get_qualifier_column(SetPieceQualifier)
+        """
+        # Whether a qualifier class matches is only checked once
+        matches: Dict[type, bool] = {}
+        column = []
+        for event in self.records:
+            value = None
+            qualifiers = event.qualifiers
+            if qualifiers and not isinstance(event, NoQualifierMixin):
+                for qualifier in qualifiers:
+                    cls = qualifier.__class__
+                    match = matches.get(cls)
+                    if match is None:
+                        match = matches[cls] = issubclass(cls, qualifier_type)
+                    if match:
+                        value = qualifier.value
+                        break
+            column.append(value)
+        return column
+
     def aggregate(self, type_: str, **aggregator_kwargs) -> List[Any]:
         if type_ == "minutes_played":
             from kloppy.domain.services.aggregators.minutes_played import (
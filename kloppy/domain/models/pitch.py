@@ -1,10 +1,13 @@
 import warnings
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from enum import Enum
 from math import sqrt
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 from kloppy.exceptions import MissingDimensionError
+from kloppy.utils import add_slots
 
 DEFAULT_PITCH_LENGTH = 105.0
 DEFAULT_PITCH_WIDTH = 68.0
@@ -59,6 +62,7 @@ class Unit(Enum):
         return value / factor_to_meter * factor_from_meter
 
 
+@add_slots()
 @dataclass(frozen=True)
 class Point:
     """
@@ -82,6 +86,7 @@ class Point:
         return sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
 
+@add_slots()
 @dataclass(frozen=True)
 class Point3D(Point):
     """
@@ -301,106 +306,12 @@ class PitchDimensions:
         Returns:
             The point in the IFAB pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise MissingDimensionError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
-
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
+        return CoordinateTransform.build(
+            from_dims=self,
+            to_dims=None,
             pitch_length=pitch_length,
             pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_from_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_from_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
-
-        def transform(v, from_zones, from_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > from_zones[-1][1]:
-                v = from_length - (v - from_zones[0][0]) + from_zones[0][0]
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(from_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in IFAB dimensions
-                    (ifab_zones[zone][1] - ifab_zones[zone][0])
-                    # length of the zone in the original dimensions
-                    / (from_zones[zone][1] - from_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                ifab = ifab_zones[zone][0] + (v - from_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                ifab = ifab_zones[0][0] + (v - from_zones[0][0]) * (
-                    ifab_length / from_length
-                )
-            if mirror:
-                ifab = ifab_length - ifab
-            return ifab
-
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    (
-                        point.z * 2.44 / self.goal_height
-                        if self.goal_height is not None
-                        else point.z
-                    )
-                    if point.z is not None
-                    else None
-                ),
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        ).apply_point(point)
 
     def from_metric_base(
         self,
@@ -417,106 +328,12 @@ class PitchDimensions:
         Returns:
             The point in the regular pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise MissingDimensionError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
-
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
+        return CoordinateTransform.build(
+            from_dims=None,
+            to_dims=self,
             pitch_length=pitch_length,
             pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_to_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_to_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
-
-        def transform(v, to_zones, to_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > ifab_length / 2:
-                v = ifab_length - v
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(ifab_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in the original dimensions
-                    (to_zones[zone][1] - to_zones[zone][0])
-                    # length of the zone in IFAB dimensions
-                    / (ifab_zones[zone][1] - ifab_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                v = to_zones[zone][0] + (v - ifab_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                v = to_zones[0][0] + (v - ifab_zones[0][0]) * (
-                    to_length / ifab_length
-                )
-            if mirror:
-                v = (to_length + to_zones[0][0] - v) + to_zones[0][0]
-            return v
-
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    (
-                        point.z * self.goal_height / 2.44
-                        if self.goal_height is not None
-                        else point.z
-                    )
-                    if point.z is not None
-                    else None
-                ),
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        ).apply_point(point)
 
     def distance_between(
         self, point1: Point, point2: Point, unit: Unit = Unit.METERS
@@ -699,3 +516,304 @@ class WyscoutPitchDimensions(PitchDimensions):
     corner_radius: float = 0.97  # inferred
     penalty_spot_distance: float = 10.0
     penalty_arc_radius: float = 7.74  # inferred
+
+
+class _AxisTransform:
+    """
+    Piecewise linear mapping of a single axis between two pitch dimensions.
+
+    The zones between the lines on one half of the pitch (see
+    `PitchDimensions._transformation_zones_x`) are mapped onto the
+    corresponding zones of the other pitch. Values in the other half are
+    mirrored around the center line first.
+    """
+
+    def __init__(
+        self,
+        from_zones: List[Tuple[float, float]],
+        from_length: float,
+        to_zones: List[Tuple[float, float]],
+        to_length: float,
+    ):
+        self.from_min = from_zones[0][0]
+        self.from_length = from_length
+        self.to_min = to_zones[0][0]
+        self.to_length = to_length
+        self.from_edges = [zone[0] for zone in from_zones] + [
+            from_zones[-1][1]
+        ]
+        self.to_starts = [zone[0] for zone in to_zones]
+        self.scales = [
+            (to_zone[1] - to_zone[0]) / (from_zone[1] - from_zone[0])
+            if from_zone[1] != from_zone[0]
+            else 0.0
+            for from_zone, to_zone in zip(from_zones, to_zones)
+        ]
+        self.outside_scale = to_length / from_length
+
+    def apply(self, v: float) -> float:
+        mirror = False
+        if v > self.from_edges[-1]:
+            v = self.from_length - (v - self.from_min) + self.from_min
+            mirror = True
+        if self.from_edges[0] <= v <= self.from_edges[-1]:
+            # first zone that contains v; boundaries belong to the lower zone
+            zone = bisect_left(self.from_edges, v) - 1
+            if zone < 0:
+                zone = 0
+            v = (
+                self.to_starts[zone]
+                + (v - self.from_edges[zone]) * self.scales[zone]
+            )
+        else:
+            # value is outside of the pitch dimensions
+            v = self.to_min + (v - self.from_min) * self.outside_scale
+        if mirror:
+            v = (self.to_length + self.to_min - v) + self.to_min
+        return v
+
+    def apply_array(self, values):
+        import numpy as np
+
+        values = np.asarray(values, dtype=float)
+        mirror = values > self.from_edges[-1]
+        values = np.where(
+            mirror,
+            self.from_length - (values - self.from_min) + self.from_min,
+            values,
+        )
+        inside = (values >= self.from_edges[0]) & (
+            values <= self.from_edges[-1]
+        )
+        zone = np.clip(
+            np.searchsorted(self.from_edges, values, side="left") - 1,
+            0,
+            len(self.scales) - 1,
+        )
+        values = np.where(
+            inside,
+            np.take(self.to_starts, zone)
+            + (values - np.take(self.from_edges, zone))
+            * np.take(self.scales, zone),
+            self.to_min + (values - self.from_min) * self.outside_scale,
+        )
+        return np.where(
+            mirror,
+            (self.to_length + self.to_min - values) + self.to_min,
+            values,
+        )
+
+
+class CoordinateTransform:
+    """
+    A precompiled transformation of coordinates between pitch dimensions.
+
+    Points are mapped from `from_dims` to the IFAB pitch dimensions and then
+    from the IFAB pitch dimensions to `to_dims`. When `from_dims` or
+    `to_dims` is `None`, the IFAB pitch dimensions are used. The zone
+    breakpoints and scales are computed once, so the transform can be
+    applied to many points at a low cost.
+
+    Use [`CoordinateTransform.build`][kloppy.domain.CoordinateTransform.build]
+    to get a memoized instance.
+
+    Arguments:
+        from_dims: The pitch dimensions of the input coordinates.
+        to_dims: The pitch dimensions of the output coordinates.
+        pitch_length: The real length of the pitch, in meters.
+        pitch_width: The real width of the pitch, in meters.
+        invert_y: Mirror the y coordinate in the IFAB pitch dimensions.
+            Used to change the vertical orientation.
+    """
+
+    _cache: "OrderedDict[tuple, CoordinateTransform]" = OrderedDict()
+    _cache_size = 256
+
+    def __init__(
+        self,
+        from_dims: Optional[PitchDimensions],
+        to_dims: Optional[PitchDimensions],
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+        invert_y: bool = False,
+    ):
+        for dims in (from_dims, to_dims):
+            if dims is not None and (
+                dims.x_dim.min is None
+                or dims.x_dim.max is None
+                or dims.y_dim.min is None
+                or dims.y_dim.max is None
+            ):
+                raise MissingDimensionError(
+                    "The pitch boundaries need to be fully specified to convert coordinates."
+                )
+
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        self.invert_y = invert_y
+
+        ifab_dims = MetricPitchDimensions(
+            x_dim=Dimension(0, pitch_length),
+            y_dim=Dimension(0, pitch_width),
+            pitch_length=pitch_length,
+            pitch_width=pitch_width,
+            standardized=False,
+        )
+        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
+        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
+
+        self._to_base = None
+        if from_dims is not None:
+            from_length = from_dims.x_dim.max - from_dims.x_dim.min
+            from_width = from_dims.y_dim.max - from_dims.y_dim.min
+            self._to_base = (
+                _AxisTransform(
+                    from_dims._transformation_zones_x(from_length),
+                    from_length,
+                    x_ifab_zones,
+                    pitch_length,
+                ),
+                _AxisTransform(
+                    from_dims._transformation_zones_y(from_width),
+                    from_width,
+                    y_ifab_zones,
+                    pitch_width,
+                ),
+            )
+        self._from_base = None
+        if to_dims is not None:
+            to_length = to_dims.x_dim.max - to_dims.x_dim.min
+            to_width = to_dims.y_dim.max - to_dims.y_dim.min
+            self._from_base = (
+                _AxisTransform(
+                    x_ifab_zones,
+                    pitch_length,
+                    to_dims._transformation_zones_x(to_length),
+                    to_length,
+                ),
+                _AxisTransform(
+                    y_ifab_zones,
+                    pitch_width,
+                    to_dims._transformation_zones_y(to_width),
+                    to_width,
+                ),
+            )
+
+        self._from_goal_height = (
+            from_dims.goal_height if from_dims is not None else None
+        )
+        self._to_goal_height = (
+            to_dims.goal_height if to_dims is not None else None
+        )
+
+    @classmethod
+    def build(
+        cls,
+        from_dims: Optional[PitchDimensions],
+        to_dims: Optional[PitchDimensions],
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+        invert_y: bool = False,
+    ) -> "CoordinateTransform":
+        """
+        Return a memoized transform for the given pitch dimensions.
+
+        Pitch dimensions are compared by value, so equal pitch dimensions
+        share the same transform.
+        """
+        key = (
+            _dims_key(from_dims),
+            _dims_key(to_dims),
+            pitch_length,
+            pitch_width,
+            invert_y,
+        )
+        transform = cls._cache.get(key)
+        if transform is None:
+            transform = cls(
+                from_dims, to_dims, pitch_length, pitch_width, invert_y
+            )
+            cls._cache[key] = transform
+            if len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return transform
+
+    def apply(self, x: float, y: float) -> Tuple[float, float]:
+        """Transform a single (x, y) coordinate."""
+        if self._to_base is not None:
+            x = self._to_base[0].apply(x)
+            y = self._to_base[1].apply(y)
+        if self.invert_y:
+            y = self.pitch_width - y
+        if self._from_base is not None:
+            x = self._from_base[0].apply(x)
+            y = self._from_base[1].apply(y)
+        return x, y
+
+    def apply_z(self, z: Optional[float]) -> Optional[float]:
+        """Transform a height coordinate."""
+        if z is None:
+            return None
+        if self._from_goal_height is not None:
+            z = z * 2.44 / self._from_goal_height
+        if self._to_goal_height is not None:
+            z = z * self._to_goal_height / 2.44
+        return z
+
+    def apply_point(
+        self, point: Union[Point, Point3D, None]
+    ) -> Union[Point, Point3D, None]:
+        """Transform a [`Point`][kloppy.domain.Point] or [`Point3D`][kloppy.domain.Point3D]."""
+        if point is None:
+            return None
+        x, y = self.apply(point.x, point.y)
+        if isinstance(point, Point3D):
+            return Point3D(x=x, y=y, z=self.apply_z(point.z))
+        return Point(x=x, y=y)
+
+    def apply_arrays(self, xs, ys):
+        """
+        Transform arrays of x and y coordinates at once.
+
+        Requires NumPy. Returns a tuple with the transformed x and y arrays.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have numpy installed. Please"
+                " install it using: pip install numpy"
+            )
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if self._to_base is not None:
+            xs = self._to_base[0].apply_array(xs)
+            ys = self._to_base[1].apply_array(ys)
+        if self.invert_y:
+            ys = self.pitch_width - ys
+        if self._from_base is not None:
+            xs = self._from_base[0].apply_array(xs)
+            ys = self._from_base[1].apply_array(ys)
+        return xs, ys
+
+    def apply_z_array(self, zs):
+        """Transform an array of height coordinates at once."""
+        import numpy as np
+
+        zs = np.asarray(zs, dtype=float)
+        if self._from_goal_height is not None:
+            zs = zs * 2.44 / self._from_goal_height
+        if self._to_goal_height is not None:
+            zs = zs * self._to_goal_height / 2.44
+        return zs
+
+
+def _dims_key(dims: Optional[PitchDimensions]) -> Optional[tuple]:
+    if dims is None:
+        return None
+    return (dims.__class__,) + tuple(
+        getattr(dims, field.name) for field in fields(dims)
+    )
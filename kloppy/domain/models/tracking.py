@@ -1,24 +1,78 @@
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Union
+from collections.abc import Mapping, Sequence
+from copy import copy
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from kloppy.domain.models.common import DatasetType
+from kloppy.domain.models.common import (
+    AttackingDirection,
+    BallState,
+    DatasetType,
+    Team,
+)
+from kloppy.exceptions import KloppyParameterError, OrientationError
 from kloppy.utils import (
+    add_slots,
     deprecated,
     docstring_inherit_attributes,
 )
 
-from .common import DataRecord, Dataset, Player
+from .common import DataRecord, Dataset, Player, _Categorical
 from .pitch import Point, Point3D
+from .time import Period
+
+
+class _EmptyMapping(Mapping):
+    """Immutable empty mapping, shared by all records without other data."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        raise KeyError(key)
 
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __hash__(self):
+        return 0
+
+    def __repr__(self):
+        return "{}"
 
+    def __reduce__(self):
+        # Unpickle to the shared instance
+        return "EMPTY_OTHER_DATA"
+
+
+EMPTY_OTHER_DATA: Mapping[str, Any] = _EmptyMapping()
+
+
+@add_slots()
 @dataclass
 class PlayerData:
+    """
+    Tracking data of a player in a frame.
+
+    Attributes:
+        coordinates: The coordinates of the player.
+        distance: The distance covered by the player.
+        speed: The speed of the player.
+        other_data: A dictionary containing additional data. Frames created
+            with `create_frame`, such as the frames of the deserializers,
+            share an immutable empty mapping when there is no additional
+            data. Assign a new dictionary to add data to those.
+    """
+
     coordinates: Point
     distance: Optional[float] = None
     speed: Optional[float] = None
     other_data: Dict[str, Any] = field(default_factory=dict)
 
 
+@add_slots()
 @docstring_inherit_attributes(DataRecord)
 @dataclass(repr=False)
 class Frame(DataRecord):
@@ -30,7 +84,11 @@ class Frame(DataRecord):
         ball_coordinates: The coordinates of the ball
         players_data: A dictionary containing the tracking data for each player.
         ball_speed: The speed of the ball
-        other_data: A dictionary containing additional data
+        attacking_direction: The attacking direction of the home team. The
+            team in possession of the ball is the action executing team.
+        other_data: A dictionary containing additional data. Frames created
+            with `create_frame` share an immutable empty mapping when there
+            is no additional data.
     """
 
     frame_id: int
@@ -43,6 +101,24 @@ class Frame(DataRecord):
     def record_id(self) -> int:
         return self.frame_id
 
+    @property
+    def attacking_direction(self) -> AttackingDirection:
+        if (
+            self.dataset
+            and self.dataset.metadata
+            and self.dataset.metadata.orientation is not None
+        ):
+            try:
+                return AttackingDirection.from_orientation(
+                    self.dataset.metadata.orientation,
+                    period=self.period,
+                    ball_owning_team=self.ball_owning_team,
+                    action_executing_team=self.ball_owning_team,
+                )
+            except OrientationError:
+                return AttackingDirection.NOT_SET
+        return AttackingDirection.NOT_SET
+
     @property
     def players_coordinates(self):
         return {
@@ -57,6 +133,513 @@ class Frame(DataRecord):
         return str(self)
 
 
+class ColumnarFrames(Sequence):
+    """
+    Columnar storage for the frames of a tracking dataset.
+
+    Instead of keeping a [`Frame`][kloppy.domain.Frame] object per frame,
+    all values are stored in contiguous NumPy arrays. `Frame` objects are
+    only created when the sequence is indexed or iterated. Missing values
+    are stored as `NaN` (coordinates, speed, distance) or `-1` (indices).
+    Ball coordinates are always materialized as a
+    [`Point3D`][kloppy.domain.Point3D].
+
+    Use [`TrackingDataset.to_columnar`][kloppy.domain.TrackingDataset.to_columnar]
+    to convert a dataset.
+
+    Attributes:
+        frame_id: The frame identifiers. Shape `(n_frames,)`.
+        period: Index of each frame's period in `periods`.
+        timestamp: Timestamp of each frame in seconds, relative to the
+            period kick-off.
+        ball_state: Index of each frame's ball state in `list(BallState)`.
+        ball_owning_team: Index of each frame's ball owning team in `teams`.
+        ball_x: x coordinate of the ball.
+        ball_y: y coordinate of the ball.
+        ball_z: z coordinate of the ball.
+        ball_speed: Speed of the ball.
+        player_present: Whether a player has data in a frame.
+            Shape `(n_frames, n_players)`.
+        player_x: x coordinate of each player. Shape `(n_frames, n_players)`.
+        player_y: y coordinate of each player. Shape `(n_frames, n_players)`.
+        player_speed: Speed of each player. Shape `(n_frames, n_players)`.
+        player_distance: Distance covered by each player.
+            Shape `(n_frames, n_players)`.
+        periods: The periods referenced by `period`.
+        teams: The teams referenced by `ball_owning_team`.
+        players: The players, in the order of the player columns.
+    """
+
+    def __init__(
+        self,
+        frame_id: "np.ndarray",
+        period: "np.ndarray",
+        timestamp: "np.ndarray",
+        ball_state: "np.ndarray",
+        ball_owning_team: "np.ndarray",
+        ball_x: "np.ndarray",
+        ball_y: "np.ndarray",
+        ball_z: "np.ndarray",
+        ball_speed: "np.ndarray",
+        player_present: "np.ndarray",
+        player_x: "np.ndarray",
+        player_y: "np.ndarray",
+        player_speed: "np.ndarray",
+        player_distance: "np.ndarray",
+        periods: List[Period],
+        teams: List[Team],
+        players: List[Player],
+        timedelta_timestamps: bool = True,
+        other_data: Optional[Dict[int, Dict[str, Any]]] = None,
+        player_other_data: Optional[Dict[tuple, Dict[str, Any]]] = None,
+        statistics: Optional[Dict[int, list]] = None,
+    ):
+        self.frame_id = frame_id
+        self.period = period
+        self.timestamp = timestamp
+        self.ball_state = ball_state
+        self.ball_owning_team = ball_owning_team
+        self.ball_x = ball_x
+        self.ball_y = ball_y
+        self.ball_z = ball_z
+        self.ball_speed = ball_speed
+        self.player_present = player_present
+        self.player_x = player_x
+        self.player_y = player_y
+        self.player_speed = player_speed
+        self.player_distance = player_distance
+        self.periods = periods
+        self.teams = teams
+        self.players = players
+
+        # Values that are rarely set are stored sparse, keyed by frame index
+        self._timedelta_timestamps = timedelta_timestamps
+        self._other_data = other_data or {}
+        self._player_other_data = player_other_data or {}
+        self._statistics = statistics or {}
+        self._dataset = None
+
+    @classmethod
+    def from_frames(cls, frames: List[Frame]) -> "ColumnarFrames":
+        """Convert a list of frames to columnar storage."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have numpy installed. Please"
+                " install it using: pip install numpy"
+            )
+
+        frames = list(frames)
+        n_frames = len(frames)
+
+        periods: Dict[Period, int] = {}
+        teams: Dict[Team, int] = {}
+        players: Dict[Player, int] = {}
+        for frame in frames:
+            if frame.period is not None and frame.period not in periods:
+                periods[frame.period] = len(periods)
+            if (
+                frame.ball_owning_team is not None
+                and frame.ball_owning_team not in teams
+            ):
+                teams[frame.ball_owning_team] = len(teams)
+            for player in frame.players_data:
+                if player not in players:
+                    players[player] = len(players)
+
+        ball_states = {ball_state: i for i, ball_state in enumerate(BallState)}
+        n_players = len(players)
+
+        frame_id = np.empty(n_frames, dtype=object)
+        period = np.full(n_frames, -1, dtype=np.int8)
+        timestamp = np.full(n_frames, np.nan)
+        ball_state = np.full(n_frames, -1, dtype=np.int8)
+        ball_owning_team = np.full(n_frames, -1, dtype=np.int8)
+        ball = np.full((3, n_frames), np.nan)
+        ball_speed = np.full(n_frames, np.nan)
+        player_present = np.zeros((n_frames, n_players), dtype=bool)
+        player_values = np.full((4, n_frames, n_players), np.nan)
+
+        timedelta_timestamps = True
+        other_data = {}
+        player_other_data = {}
+        statistics = {}
+        for i, frame in enumerate(frames):
+            frame_id[i] = frame.frame_id
+            if frame.period is not None:
+                period[i] = periods[frame.period]
+            if isinstance(frame.timestamp, timedelta):
+                timestamp[i] = frame.timestamp.total_seconds()
+            elif frame.timestamp is not None:
+                timedelta_timestamps = False
+                timestamp[i] = frame.timestamp
+            if frame.ball_state is not None:
+                ball_state[i] = ball_states[frame.ball_state]
+            if frame.ball_owning_team is not None:
+                ball_owning_team[i] = teams[frame.ball_owning_team]
+            if frame.ball_coordinates is not None:
+                ball[0, i] = frame.ball_coordinates.x
+                ball[1, i] = frame.ball_coordinates.y
+                z = getattr(frame.ball_coordinates, "z", None)
+                if z is not None:
+                    ball[2, i] = z
+            if frame.ball_speed is not None:
+                ball_speed[i] = frame.ball_speed
+            if frame.other_data != {}:
+                other_data[i] = frame.other_data
+            if frame.statistics:
+                statistics[i] = frame.statistics
+
+            for player, player_data in frame.players_data.items():
+                j = players[player]
+                player_present[i, j] = True
+                if player_data.coordinates is not None:
+                    player_values[0, i, j] = player_data.coordinates.x
+                    player_values[1, i, j] = player_data.coordinates.y
+                if player_data.speed is not None:
+                    player_values[2, i, j] = player_data.speed
+                if player_data.distance is not None:
+                    player_values[3, i, j] = player_data.distance
+                if player_data.other_data:
+                    player_other_data[(i, j)] = player_data.other_data
+
+        try:
+            frame_id = frame_id.astype(np.int64)
+        except (TypeError, ValueError):
+            # Some providers use non-numeric frame identifiers
+            pass
+
+        return cls(
+            frame_id=frame_id,
+            period=period,
+            timestamp=timestamp,
+            ball_state=ball_state,
+            ball_owning_team=ball_owning_team,
+            ball_x=np.ascontiguousarray(ball[0]),
+            ball_y=np.ascontiguousarray(ball[1]),
+            ball_z=np.ascontiguousarray(ball[2]),
+            ball_speed=ball_speed,
+            player_present=player_present,
+            player_x=np.ascontiguousarray(player_values[0]),
+            player_y=np.ascontiguousarray(player_values[1]),
+            player_speed=np.ascontiguousarray(player_values[2]),
+            player_distance=np.ascontiguousarray(player_values[3]),
+            periods=list(periods),
+            teams=list(teams),
+            players=list(players),
+            timedelta_timestamps=timedelta_timestamps,
+            other_data=other_data,
+            player_other_data=player_other_data,
+            statistics=statistics,
+        )
+
+    def replace(self, **changes) -> "ColumnarFrames":
+        """
+        Return a copy with some of the arrays replaced.
+
+        The arrays that are not replaced are shared with this instance.
+
+        Examples:
+            >>> frames = frames.replace(ball_x=frames.ball_x * 2)
+        """
+        frames = copy(self)
+        for name, value in changes.items():
+            if name.startswith("_") or not hasattr(self, name):
+                raise TypeError(f"ColumnarFrames has no attribute '{name}'")
+            setattr(frames, name, value)
+        frames._dataset = None
+        return frames
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the default columns of `TrackingDataset.to_df`.
+
+        The columns and their order are the same as the ones created by
+        [`DefaultFrameTransformer`][kloppy.domain.services.transformers.attribute.DefaultFrameTransformer].
+        Numeric columns are returned as NumPy arrays, using `NaN` for
+        missing values. Other columns, and numeric columns without any
+        value, are returned as lists.
+        """
+        import numpy as np
+
+        n_frames = len(self)
+
+        def numeric(values: "np.ndarray"):
+            if n_frames and np.isnan(values).all():
+                return [None] * n_frames
+            return values
+
+        def lookup(indices: "np.ndarray", values: list) -> list:
+            values = values + [None]
+            return [values[index] for index in indices.tolist()]
+
+        if (self.period >= 0).all():
+            period_id = np.array([period.id for period in self.periods] + [0])[
+                self.period
+            ]
+        else:
+            period_id = lookup(
+                self.period, [period.id for period in self.periods]
+            )
+
+        if self._timedelta_timestamps:
+            timestamp = [
+                timedelta(seconds=seconds) if seconds == seconds else None
+                for seconds in self.timestamp.tolist()
+            ]
+        else:
+            timestamp = numeric(self.timestamp)
+
+        # The sort key of each column mimics the order in which the
+        # columns are first seen when converting the frames one by one:
+        # (first frame, 0, player index, position) for player columns and
+        # (first frame, 1, position, 0) for other data of the frame.
+        columns = [
+            ((-1, 0, 0, 0), "period_id", period_id),
+            ((-1, 0, 0, 1), "timestamp", timestamp),
+            (
+                (-1, 0, 0, 2),
+                "frame_id",
+                (
+                    self.frame_id
+                    if self.frame_id.dtype != object
+                    else self.frame_id.tolist()
+                ),
+            ),
+            (
+                (-1, 0, 0, 3),
+                "ball_state",
+                lookup(self.ball_state, [state.value for state in BallState]),
+            ),
+            (
+                (-1, 0, 0, 4),
+                "ball_owning_team_id",
+                lookup(
+                    self.ball_owning_team,
+                    [team.team_id for team in self.teams],
+                ),
+            ),
+            ((-1, 0, 0, 5), "ball_x", numeric(self.ball_x)),
+            ((-1, 0, 0, 6), "ball_y", numeric(self.ball_y)),
+            ((-1, 0, 0, 7), "ball_z", numeric(self.ball_z)),
+            ((-1, 0, 0, 8), "ball_speed", numeric(self.ball_speed)),
+        ]
+
+        present = self.player_present.any(axis=0)
+        first_frames = self.player_present.argmax(axis=0).tolist()
+        for j, player in enumerate(self.players):
+            if not present[j]:
+                continue
+            for k, (suffix, values) in enumerate(
+                (
+                    ("x", self.player_x),
+                    ("y", self.player_y),
+                    ("d", self.player_distance),
+                    ("s", self.player_speed),
+                )
+            ):
+                columns.append(
+                    (
+                        (first_frames[j], 0, j, k),
+                        f"{player.player_id}_{suffix}",
+                        numeric(np.ascontiguousarray(values[:, j])),
+                    )
+                )
+
+        other_columns = {}
+        for (i, j), other_data in sorted(self._player_other_data.items()):
+            player_id = self.players[j].player_id
+            for k, (name, value) in enumerate(other_data.items()):
+                name = f"{player_id}_{name}"
+                if name not in other_columns:
+                    other_columns[name] = ((i, 0, j, 4 + k), [None] * n_frames)
+                other_columns[name][1][i] = value
+        for i, other_data in sorted(self._other_data.items()):
+            if not other_data:
+                continue
+            for k, (name, value) in enumerate(other_data.items()):
+                if name not in other_columns:
+                    other_columns[name] = ((i, 1, k, 0), [None] * n_frames)
+                other_columns[name][1][i] = value
+        columns.extend(
+            (sort_key, name, values)
+            for name, (sort_key, values) in other_columns.items()
+        )
+
+        columns.sort(key=lambda column: column[0])
+        return {name: values for _, name, values in columns}
+
+    @property
+    def record_ids(self) -> list:
+        """The identifiers of all frames, without materializing them."""
+        return self.frame_id.tolist()
+
+    @property
+    def record_times(self) -> list:
+        """The (period id, seconds) of all frames, without materializing them."""
+        period_ids = [period.id for period in self.periods]
+        return [
+            (period_ids[period], timestamp)
+            if period >= 0 and timestamp == timestamp
+            else None
+            for period, timestamp in zip(
+                self.period.tolist(), self.timestamp.tolist()
+            )
+        ]
+
+    @property
+    def record_period_ids(self) -> list:
+        """The period identifier of all frames, without materializing them."""
+        period_ids = [period.id for period in self.periods]
+        return [
+            period_ids[period] if period >= 0 else None
+            for period in self.period.tolist()
+        ]
+
+    def set_refs(self, dataset: Dataset):
+        """Link the frames that are materialized to `dataset`."""
+        self._dataset = dataset
+
+    def __len__(self) -> int:
+        return len(self.frame_id)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+
+        index = int(item)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+
+        frame = self._build_frame(index)
+        if self._dataset is not None:
+            frame.set_refs(self._dataset, index=index)
+        return frame
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _layout_indices(self) -> List[int]:
+        """
+        Return the index of the first frame of each distinct row layout.
+
+        The layout of a frame is given by the players that are present and
+        the keys of its other data, so no frames are created.
+        """
+        import numpy as np
+
+        n_frames = len(self)
+        if not n_frames:
+            return []
+        if self.players:
+            _, layouts = np.unique(
+                self.player_present, axis=0, return_inverse=True
+            )
+            layouts = layouts.reshape(-1).tolist()
+        else:
+            layouts = [0] * n_frames
+
+        other_keys = {}
+        for (i, j), other_data in self._player_other_data.items():
+            other_keys.setdefault(i, []).append((j, tuple(other_data)))
+        for i, other_data in self._other_data.items():
+            other_keys.setdefault(i, []).append((None, tuple(other_data)))
+
+        signatures = set()
+        indices = []
+        for i, layout in enumerate(layouts):
+            keys = other_keys.get(i)
+            signature = (layout, tuple(keys)) if keys else layout
+            if signature not in signatures:
+                signatures.add(signature)
+                indices.append(i)
+        return indices
+
+    def _build_frame(self, index: int) -> Frame:
+        import numpy as np
+
+        players_data = {}
+        if self.players:
+            xs = self.player_x[index].tolist()
+            ys = self.player_y[index].tolist()
+            speeds = self.player_speed[index].tolist()
+            distances = self.player_distance[index].tolist()
+            for j in np.flatnonzero(self.player_present[index]).tolist():
+                x, y = xs[j], ys[j]
+                players_data[self.players[j]] = PlayerData(
+                    coordinates=(
+                        Point(x=x, y=y) if x == x or y == y else None
+                    ),
+                    distance=_nan_to_none(distances[j]),
+                    speed=_nan_to_none(speeds[j]),
+                    other_data=self._player_other_data.get(
+                        (index, j), EMPTY_OTHER_DATA
+                    ),
+                )
+
+        ball_x = self.ball_x[index].item()
+        ball_y = self.ball_y[index].item()
+        if ball_x == ball_x or ball_y == ball_y:
+            ball_coordinates = Point3D(
+                x=ball_x, y=ball_y, z=_nan_to_none(self.ball_z[index].item())
+            )
+        else:
+            ball_coordinates = None
+
+        timestamp = _nan_to_none(self.timestamp[index].item())
+        if timestamp is not None and self._timedelta_timestamps:
+            timestamp = timedelta(seconds=timestamp)
+
+        period = self.period[index]
+        ball_state = self.ball_state[index]
+        ball_owning_team = self.ball_owning_team[index]
+        return Frame(
+            frame_id=self.frame_id[index : index + 1].tolist()[0],
+            period=self.periods[period] if period >= 0 else None,
+            timestamp=timestamp,
+            ball_state=(_BALL_STATES[ball_state] if ball_state >= 0 else None),
+            ball_owning_team=(
+                self.teams[ball_owning_team] if ball_owning_team >= 0 else None
+            ),
+            ball_coordinates=ball_coordinates,
+            ball_speed=_nan_to_none(self.ball_speed[index].item()),
+            players_data=players_data,
+            other_data=self._other_data.get(index, EMPTY_OTHER_DATA),
+            statistics=self._statistics.get(index, []),
+        )
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} frame_count={len(self)} "
+            f"player_count={len(self.players)}>"
+        )
+
+
+_BALL_STATES = list(BallState)
+
+# The columns of `TrackingDataset.to_df(layout="long")`
+LONG_COLUMNS = (
+    "period_id",
+    "timestamp",
+    "frame_id",
+    "team_id",
+    "player_id",
+    "x",
+    "y",
+    "distance",
+    "speed",
+)
+
+
+def _nan_to_none(value: Optional[float]) -> Optional[float]:
+    # NaN is the only value that is not equal to itself
+    return None if value != value else value
+
+
 @dataclass
 @docstring_inherit_attributes(Dataset)
 class TrackingDataset(Dataset[Frame]):
@@ -80,6 +663,191 @@ class TrackingDataset(Dataset[Frame]):
     def frame_rate(self):
         return self.metadata.frame_rate
 
+    def to_columnar(self) -> "TrackingDataset":
+        """
+        Return a copy of the dataset backed by [`ColumnarFrames`][kloppy.domain.ColumnarFrames].
+
+        The frames are stored as NumPy arrays and are only materialized
+        as [`Frame`][kloppy.domain.Frame] objects when they are accessed.
+
+        Examples:
+            >>> dataset = dataset.to_columnar()
+            >>> dataset.frames.ball_x.mean()
+        """
+        if isinstance(self.records, ColumnarFrames):
+            return self
+        return replace(self, records=ColumnarFrames.from_frames(self.records))
+
+    def _layout_sample(self, *columns, **named_columns) -> "TrackingDataset":
+        if (
+            isinstance(self.records, ColumnarFrames)
+            and not columns
+            and not named_columns
+        ):
+            return self._view(self.records._layout_indices())
+        return super()._layout_sample(*columns, **named_columns)
+
+    def _to_df_columns(
+        self, *columns, layout: str = "wide", **named_columns
+    ) -> Dict[str, Any]:
+        if layout == "long":
+            return self._to_long_columns(*columns, **named_columns)
+        if columns or named_columns:
+            return super()._to_df_columns(
+                *columns, layout=layout, **named_columns
+            )
+
+        # Fill the default columns in one pass, instead of converting
+        # every frame to a dictionary
+        if isinstance(self.records, ColumnarFrames):
+            return self.records.to_dict()
+
+        from ..services.transformers.attribute import DefaultFrameTransformer
+
+        return DefaultFrameTransformer().transform_batch(self.records)
+
+    def _to_long_columns(self, *columns, **named_columns) -> Dict[str, Any]:
+        """
+        Return the columns of the long layout: one row per player per frame.
+
+        Rows are ordered by frame and then by the order of the players in
+        the metadata. The rows are created in a single pass over the frames, or directly
+        from the arrays when the dataset is backed by `ColumnarFrames`.
+        Player and team identifiers are returned as categorical columns.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have numpy installed. Please"
+                " install it using: pip install numpy"
+            )
+
+        if named_columns or any(
+            column not in LONG_COLUMNS for column in columns
+        ):
+            raise KloppyParameterError(
+                f"The long layout only supports selecting the columns "
+                f"{', '.join(LONG_COLUMNS)}"
+            )
+
+        # Categories follow the order of the metadata, so they are the same
+        # for every selection of frames
+        teams: Dict[Team, int] = {}
+        players: Dict[Player, int] = {}
+        for team in self.metadata.teams:
+            teams.setdefault(team, len(teams))
+            for player in team.players:
+                players.setdefault(player, len(players))
+
+        records = self.records
+        if isinstance(records, ColumnarFrames):
+            frame_index, player_index = np.nonzero(records.player_present)
+            for player in records.players:
+                players.setdefault(player, len(players))
+            player_codes = np.array(
+                [players[player] for player in records.players],
+                dtype=np.int32,
+            )[player_index]
+            x = records.player_x[frame_index, player_index]
+            y = records.player_y[frame_index, player_index]
+            distance = records.player_distance[frame_index, player_index]
+            speed = records.player_speed[frame_index, player_index]
+
+            frame_id = records.frame_id
+            period_ids = [period.id for period in records.periods] + [None]
+            period_id = [period_ids[period] for period in records.period]
+            timestamp = records.timestamp
+            timedelta_timestamps = records._timedelta_timestamps
+        else:
+            frame_index, player_codes = [], []
+            x, y, distance, speed = [], [], [], []
+            frame_id, period_id, timestamp = [], [], []
+            timedelta_timestamps = True
+            for i, frame in enumerate(records):
+                frame_id.append(frame.frame_id)
+                period_id.append(frame.period.id if frame.period else None)
+                if isinstance(frame.timestamp, timedelta):
+                    timestamp.append(frame.timestamp.total_seconds())
+                else:
+                    if frame.timestamp is not None:
+                        timedelta_timestamps = False
+                    timestamp.append(frame.timestamp)
+
+                for player, player_data in frame.players_data.items():
+                    code = players.get(player)
+                    if code is None:
+                        code = players[player] = len(players)
+                    frame_index.append(i)
+                    player_codes.append(code)
+                    coordinates = player_data.coordinates
+                    x.append(coordinates.x if coordinates else None)
+                    y.append(coordinates.y if coordinates else None)
+                    distance.append(player_data.distance)
+                    speed.append(player_data.speed)
+
+            frame_index = np.array(frame_index, dtype=np.intp)
+            player_codes = np.array(player_codes, dtype=np.int32)
+            x, y, distance, speed = (
+                np.array(values, dtype=float)
+                for values in (x, y, distance, speed)
+            )
+            frame_id = np.array(frame_id)
+            timestamp = np.array(timestamp, dtype=float)
+
+        # Order the rows by frame, and by player within a frame
+        order = np.lexsort((player_codes, frame_index))
+        frame_index, player_codes, x, y, distance, speed = (
+            values[order]
+            for values in (frame_index, player_codes, x, y, distance, speed)
+        )
+
+        for player in players:
+            if player.team is not None:
+                teams.setdefault(player.team, len(teams))
+        team_codes = np.array(
+            [
+                teams[player.team] if player.team is not None else -1
+                for player in players
+            ],
+            dtype=np.int32,
+        )
+
+        if None in period_id:
+            period_id = np.array(period_id, dtype=object)
+        else:
+            period_id = np.array(period_id, dtype=np.int64)
+
+        timestamp = timestamp[frame_index]
+        if timedelta_timestamps:
+            missing = np.isnan(timestamp)
+            timestamp = (
+                np.round(np.where(missing, 0, timestamp) * 1e6)
+                .astype(np.int64)
+                .astype("timedelta64[us]")
+            )
+            timestamp[missing] = np.timedelta64("NaT")
+
+        data = {
+            "period_id": period_id[frame_index],
+            "timestamp": timestamp,
+            "frame_id": frame_id[frame_index],
+            "team_id": _Categorical(
+                team_codes[player_codes],
+                [team.team_id for team in teams],
+            ),
+            "player_id": _Categorical(
+                player_codes, [player.player_id for player in players]
+            ),
+            "x": x,
+            "y": y,
+            "distance": distance,
+            "speed": speed,
+        }
+        if columns:
+            return {column: data[column] for column in columns}
+        return data
+
     @deprecated(
         "to_pandas will be removed in the future. Please use to_df instead."
     )
@@ -120,4 +888,10 @@ class TrackingDataset(Dataset[Frame]):
         )
 
 
-__all__ = ["Frame", "TrackingDataset", "PlayerData"]
+__all__ = [
+    "Frame",
+    "TrackingDataset",
+    "PlayerData",
+    "ColumnarFrames",
+    "LONG_COLUMNS",
+]
@@ -1,6 +1,3 @@
-import dataclasses
-import warnings
-from dataclasses import fields
 from typing import TypeVar, Type
 
 from kloppy.domain import (
@@ -24,6 +21,7 @@ from kloppy.domain import (
     GoalkeeperEvent,
 )
 from kloppy.domain.models.event import PressureEvent
+from kloppy.utils import create_dataclass
 
 T = TypeVar("T")
 
@@ -39,11 +37,15 @@ def create_event(event_cls: Type[T], **kwargs) -> T:
        Events than data is passed for. E.g. `expected_goal` is passed
        to a regular `ShotEvent`.
        Normally this would break because of an 'Unexpected argument' exception,
-       but we filter those arguments out.
+       but we filter those arguments out. The accepted arguments are
+       looked up once per class, and a warning is raised once per class
+       and set of arguments.
     """
-    extra_kwargs = {"state": {}}
+    if "state" not in kwargs:
+        kwargs["state"] = {}
+
     if "related_event_ids" not in kwargs:
-        extra_kwargs["related_event_ids"] = []
+        kwargs["related_event_ids"] = []
 
     if "freeze_frame" not in kwargs:
         kwargs["freeze_frame"] = None
@@ -51,27 +53,7 @@ def create_event(event_cls: Type[T], **kwargs) -> T:
     if "statistics" not in kwargs:
         kwargs["statistics"] = []
 
-    all_kwargs = dict(**kwargs, **extra_kwargs)
-
-    relevant_kwargs = {
-        field.name: all_kwargs.get(field.name, field.default)
-        for field in fields(event_cls)
-        if field.init
-        and not (
-            field.default == dataclasses.MISSING
-            and field.name not in all_kwargs
-        )
-    }
-
-    if len(relevant_kwargs) < len(all_kwargs):
-        skipped_kwargs = set(all_kwargs.keys()) - set(relevant_kwargs.keys())
-        warnings.warn(
-            f"The following arguments were skipped: {skipped_kwargs}"
-        )
-
-    event = event_cls(**relevant_kwargs)
-
-    return event
+    return create_dataclass(event_cls, kwargs)
 
 
 class EventFactory:
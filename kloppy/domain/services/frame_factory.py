@@ -1,8 +1,6 @@
-import dataclasses
-import warnings
-from dataclasses import fields
-
 from kloppy.domain import Frame
+from kloppy.domain.models.tracking import EMPTY_OTHER_DATA
+from kloppy.utils import create_dataclass
 
 
 def create_frame(**kwargs) -> Frame:
@@ -11,26 +9,17 @@ def create_frame(**kwargs) -> Frame:
 
     This method does a couple of things:
     1. Fill in some arguments when not passed
-    2. Pass only arguments that are accepted by the Frame class.
+    2. Share a single empty mapping for the `other_data` of the frame and
+       its players when it's empty
+    3. Pass only arguments that are accepted by the Frame class.
     """
     if "statistics" not in kwargs:
         kwargs["statistics"] = []
 
-    relevant_kwargs = {
-        field.name: kwargs.get(field.name, field.default)
-        for field in fields(Frame)
-        if field.init
-        and not (
-            field.default == dataclasses.MISSING and field.name not in kwargs
-        )
-    }
-
-    if len(relevant_kwargs) < len(kwargs):
-        skipped_kwargs = set(kwargs.keys()) - set(relevant_kwargs.keys())
-        warnings.warn(
-            f"The following arguments were skipped: {skipped_kwargs}"
-        )
-
-    frame = Frame(**relevant_kwargs)
+    if kwargs.get("other_data") == {}:
+        kwargs["other_data"] = EMPTY_OTHER_DATA
+    for player_data in (kwargs.get("players_data") or {}).values():
+        if player_data.other_data == {}:
+            player_data.other_data = EMPTY_OTHER_DATA
 
-    return frame
+    return create_dataclass(Frame, kwargs)
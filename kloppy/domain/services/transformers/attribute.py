@@ -1,7 +1,22 @@
 import math
 import sys
+import warnings
+from functools import lru_cache
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from kloppy.domain import (
     BodyPartQualifier,
@@ -9,16 +24,25 @@ from kloppy.domain import (
     Event,
     Frame,
     Orientation,
+    Player,
     Point,
     QualifierMixin,
     ResultMixin,
 )
+from kloppy.domain.models.common import _Categorical
+from kloppy.domain.models.pitch import (
+    DEFAULT_PITCH_LENGTH,
+    DEFAULT_PITCH_WIDTH,
+    CoordinateTransform,
+)
 from kloppy.domain.models.event import (
+    BoolQualifier,
     CardEvent,
     CarryEvent,
     EnumQualifier,
     EventType,
     PassEvent,
+    Qualifier,
     ShotEvent,
 )
 from kloppy.exceptions import (
@@ -62,6 +86,32 @@ class EventAttributeTransformer(ABC):
         pass
 
 
+def _event_coordinates(events: Iterable[Event]):
+    """Return the x and y coordinates of the events as float arrays.
+
+    Events without coordinates get `NaN` coordinates.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have numpy installed. Please"
+            " install it using: pip install numpy"
+        )
+
+    xs = []
+    ys = []
+    for event in events:
+        coordinates = event.coordinates
+        if coordinates:
+            xs.append(coordinates.x)
+            ys.append(coordinates.y)
+        else:
+            xs.append(None)
+            ys.append(None)
+    return np.array(xs, dtype=float), np.array(ys, dtype=float)
+
+
 class AngleToGoalTransformer(EventAttributeTransformer):
     def __call__(self, event: Event) -> Dict[str, Any]:
         metadata = event.dataset.metadata
@@ -90,6 +140,69 @@ class AngleToGoalTransformer(EventAttributeTransformer):
 
         return {"angle_to_goal": math.atan2(delta_x, delta_y) / math.pi * 180}
 
+    def transform_batch(self, events: Sequence[Event]) -> Dict[str, Any]:
+        """
+        Compute the angle to goal of all events at once.
+
+        The coordinates are converted to meters with a single vectorized
+        transform. Events without coordinates get a `NaN` angle.
+
+        Returns:
+            A dictionary with an `angle_to_goal` NumPy array.
+        """
+        xs, ys = _event_coordinates(events)
+        if not len(events):
+            return {"angle_to_goal": xs}
+
+        metadata = events[0].dataset.metadata
+        if metadata.orientation != Orientation.ACTION_EXECUTING_TEAM:
+            raise OrientationError(
+                "Can only calculate Angle when dataset orientation is ACTION_EXECUTING_TEAM"
+            )
+
+        import numpy as np
+
+        pitch_dimensions = metadata.pitch_dimensions
+        if (
+            pitch_dimensions.pitch_length is None
+            or pitch_dimensions.pitch_width is None
+        ):
+            warnings.warn(
+                "The pitch length and width are not specified. "
+                "Assuming a standard pitch size of 105x68 meters. "
+                "This may lead to incorrect results.",
+                stacklevel=2,
+            )
+            pitch_length = DEFAULT_PITCH_LENGTH
+            pitch_width = DEFAULT_PITCH_WIDTH
+        else:
+            pitch_length = pitch_dimensions.pitch_length
+            pitch_width = pitch_dimensions.pitch_width
+
+        transform = CoordinateTransform.build(
+            from_dims=pitch_dimensions,
+            to_dims=None,
+            pitch_length=pitch_length,
+            pitch_width=pitch_width,
+        )
+        # The goal is always on the right for ACTION_EXECUTING_TEAM
+        goal_x, goal_y = transform.apply(
+            pitch_dimensions.x_dim.max,
+            (pitch_dimensions.y_dim.max + pitch_dimensions.y_dim.min) / 2,
+        )
+        xs, ys = transform.apply_arrays(xs, ys)
+        delta_x = np.abs(xs - goal_x)
+        delta_y = np.abs(ys - goal_y)
+
+        return {"angle_to_goal": np.arctan2(delta_x, delta_y) / np.pi * 180}
+
+
+def _distance_to_point(events: Sequence[Event], x: float, y: float):
+    import numpy as np
+
+    xs, ys = _event_coordinates(events)
+    return np.sqrt((x - xs) ** 2 + (y - ys) ** 2)
+
 
 class DistanceToGoalTransformer(EventAttributeTransformer):
     def __call__(self, event: Event) -> Dict[str, Any]:
@@ -111,6 +224,27 @@ class DistanceToGoalTransformer(EventAttributeTransformer):
             )
         }
 
+    def transform_batch(self, events: Sequence[Event]) -> Dict[str, Any]:
+        """
+        Compute the distance to goal of all events at once.
+
+        Events without coordinates get a `NaN` distance.
+
+        Returns:
+            A dictionary with a `distance_to_goal` NumPy array.
+        """
+        if not len(events):
+            return {"distance_to_goal": _event_coordinates(events)[0]}
+
+        pitch_dimensions = events[0].dataset.metadata.pitch_dimensions
+        return {
+            "distance_to_goal": _distance_to_point(
+                events,
+                pitch_dimensions.x_dim.max,
+                (pitch_dimensions.y_dim.max + pitch_dimensions.y_dim.min) / 2,
+            )
+        }
+
 
 class DistanceToOwnGoalTransformer(EventAttributeTransformer):
     def __call__(self, event: Event) -> Dict[str, Any]:
@@ -133,6 +267,27 @@ class DistanceToOwnGoalTransformer(EventAttributeTransformer):
             )
         }
 
+    def transform_batch(self, events: Sequence[Event]) -> Dict[str, Any]:
+        """
+        Compute the distance to the own goal of all events at once.
+
+        Events without coordinates get a `NaN` distance.
+
+        Returns:
+            A dictionary with a `distance_to_own_goal` NumPy array.
+        """
+        if not len(events):
+            return {"distance_to_own_goal": _event_coordinates(events)[0]}
+
+        pitch_dimensions = events[0].dataset.metadata.pitch_dimensions
+        return {
+            "distance_to_own_goal": _distance_to_point(
+                events,
+                pitch_dimensions.x_dim.min,
+                (pitch_dimensions.y_dim.max + pitch_dimensions.y_dim.min) / 2,
+            )
+        }
+
 
 def create_transformer_from_qualifier(
     qualifier_type: Type[EnumQualifier],
@@ -159,6 +314,133 @@ def create_transformer_from_qualifier(
     return _Transformer
 
 
+def _point_attribute(point_name: str, attribute: str):
+    def getter(event: Event):
+        point = getattr(event, point_name)
+        return getattr(point, attribute) if point else None
+
+    return getter
+
+
+# The columns that are part of every event row, in order
+_EVENT_COLUMNS: Dict[str, Callable[[Event], Any]] = {
+    "event_id": lambda event: event.event_id,
+    "event_type": lambda event: (
+        event.event_type.value
+        if event.event_type != EventType.GENERIC
+        else f"GENERIC:{event.event_name}"
+    ),
+    "period_id": lambda event: event.period.id,
+    "timestamp": lambda event: event.timestamp,
+    "end_timestamp": lambda event: None,
+    "ball_state": lambda event: (
+        event.ball_state.value if event.ball_state else None
+    ),
+    "ball_owning_team": lambda event: (
+        event.ball_owning_team.team_id if event.ball_owning_team else None
+    ),
+    "team_id": lambda event: event.team.team_id if event.team else None,
+    "player_id": lambda event: (
+        event.player.player_id if event.player else None
+    ),
+    "coordinates_x": _point_attribute("coordinates", "x"),
+    "coordinates_y": _point_attribute("coordinates", "y"),
+}
+
+# The columns that are added for specific event types
+_EVENT_TYPE_COLUMNS: List[Tuple[type, Dict[str, Callable[[Event], Any]]]] = [
+    (
+        PassEvent,
+        {
+            "end_timestamp": lambda event: event.receive_timestamp,
+            "end_coordinates_x": _point_attribute("receiver_coordinates", "x"),
+            "end_coordinates_y": _point_attribute("receiver_coordinates", "y"),
+            "receiver_player_id": lambda event: (
+                event.receiver_player.player_id
+                if event.receiver_player
+                else None
+            ),
+        },
+    ),
+    (
+        CarryEvent,
+        {
+            "end_timestamp": lambda event: event.end_timestamp,
+            "end_coordinates_x": _point_attribute("end_coordinates", "x"),
+            "end_coordinates_y": _point_attribute("end_coordinates", "y"),
+        },
+    ),
+    (
+        ShotEvent,
+        {
+            "end_coordinates_x": _point_attribute("result_coordinates", "x"),
+            "end_coordinates_y": _point_attribute("result_coordinates", "y"),
+        },
+    ),
+    (
+        CardEvent,
+        {
+            "card_type": lambda event: (
+                event.card_type.value if event.card_type else None
+            )
+        },
+    ),
+]
+
+# The columns that are added to every event row after the qualifiers
+_RESULT_COLUMNS: Dict[str, Callable[[Event], Any]] = {
+    "result": lambda event: (
+        event.result.value
+        if isinstance(event, ResultMixin) and event.result is not None
+        else None
+    ),
+    "success": lambda event: (
+        event.result.is_success
+        if isinstance(event, ResultMixin) and event.result is not None
+        else None
+    ),
+}
+
+# Columns with the value of an enum, which are exported as categoricals
+_EVENT_ENUM_COLUMNS = {"event_type", "ball_state", "card_type", "result"}
+
+
+@lru_cache(maxsize=None)
+def _get_event_type_columns(
+    event_cls: Type[Event],
+) -> Dict[str, Callable[[Event], Any]]:
+    for cls, columns in _EVENT_TYPE_COLUMNS:
+        if issubclass(event_cls, cls):
+            return columns
+    return {}
+
+
+_QUALIFIER_COLUMNS: Dict[type, Optional[Tuple[str, bool]]] = {}
+
+
+def _get_qualifier_column(qualifier: Qualifier) -> Optional[Tuple[str, bool]]:
+    """
+    Return the column of a qualifier and whether its values are enums.
+
+    Returns `None` when the qualifier class overrides `to_dict`, because the
+    columns can then only be known from the qualifier itself.
+    """
+    qualifier_cls = type(qualifier)
+    try:
+        return _QUALIFIER_COLUMNS[qualifier_cls]
+    except KeyError:
+        pass
+
+    if qualifier_cls.to_dict is BoolQualifier.to_dict:
+        column = f"is_{qualifier.name}", False
+    elif qualifier_cls.to_dict is EnumQualifier.to_dict:
+        column = f"{qualifier.name}_type", True
+    else:
+        column = None
+    _QUALIFIER_COLUMNS[qualifier_cls] = column
+    return column
+
+
 class DefaultEventTransformer(EventAttributeTransformer):
     def __init__(
         self,
@@ -173,107 +455,29 @@ class DefaultEventTransformer(EventAttributeTransformer):
         self.exclude = exclude or []
         self.include = include or []
 
+    @property
+    def static_columns(self) -> Dict[str, Callable[[Event], Any]]:
+        """The columns that are part of every row, with their getters."""
+        return {
+            name: getter
+            for name, getter in {**_EVENT_COLUMNS, **_RESULT_COLUMNS}.items()
+            # the end timestamp is overwritten for some event types
+            if name != "end_timestamp"
+            and (not self.include or name in self.include)
+            and name not in self.exclude
+        }
+
     def __call__(self, event: Event) -> Dict[str, Any]:
-        row = dict(
-            event_id=event.event_id,
-            event_type=(
-                event.event_type.value
-                if event.event_type != EventType.GENERIC
-                else f"GENERIC:{event.event_name}"
-            ),
-            period_id=event.period.id,
-            timestamp=event.timestamp,
-            end_timestamp=None,
-            ball_state=event.ball_state.value if event.ball_state else None,
-            ball_owning_team=(
-                event.ball_owning_team.team_id
-                if event.ball_owning_team
-                else None
-            ),
-            team_id=event.team.team_id if event.team else None,
-            player_id=event.player.player_id if event.player else None,
-            coordinates_x=event.coordinates.x if event.coordinates else None,
-            coordinates_y=event.coordinates.y if event.coordinates else None,
-        )
-        if isinstance(event, PassEvent):
-            row.update(
-                {
-                    "end_timestamp": event.receive_timestamp,
-                    "end_coordinates_x": (
-                        event.receiver_coordinates.x
-                        if event.receiver_coordinates
-                        else None
-                    ),
-                    "end_coordinates_y": (
-                        event.receiver_coordinates.y
-                        if event.receiver_coordinates
-                        else None
-                    ),
-                    "receiver_player_id": (
-                        event.receiver_player.player_id
-                        if event.receiver_player
-                        else None
-                    ),
-                }
-            )
-        elif isinstance(event, CarryEvent):
-            row.update(
-                {
-                    "end_timestamp": event.end_timestamp,
-                    "end_coordinates_x": (
-                        event.end_coordinates.x
-                        if event.end_coordinates
-                        else None
-                    ),
-                    "end_coordinates_y": (
-                        event.end_coordinates.y
-                        if event.end_coordinates
-                        else None
-                    ),
-                }
-            )
-        elif isinstance(event, ShotEvent):
-            row.update(
-                {
-                    "end_coordinates_x": (
-                        event.result_coordinates.x
-                        if event.result_coordinates
-                        else None
-                    ),
-                    "end_coordinates_y": (
-                        event.result_coordinates.y
-                        if event.result_coordinates
-                        else None
-                    ),
-                }
-            )
-        elif isinstance(event, CardEvent):
-            row.update(
-                {
-                    "card_type": (
-                        event.card_type.value if event.card_type else None
-                    )
-                }
-            )
+        row = {name: getter(event) for name, getter in _EVENT_COLUMNS.items()}
+        for name, getter in _get_event_type_columns(type(event)).items():
+            row[name] = getter(event)
 
         if isinstance(event, QualifierMixin) and event.qualifiers:
             for qualifier in event.qualifiers:
                 row.update(qualifier.to_dict())
 
-        if isinstance(event, ResultMixin) and event.result is not None:
-            row.update(
-                {
-                    "result": event.result.value,
-                    "success": event.result.is_success,
-                }
-            )
-        else:
-            row.update(
-                {
-                    "result": None,
-                    "success": None,
-                }
-            )
+        for name, getter in _RESULT_COLUMNS.items():
+            row[name] = getter(event)
 
         if self.include:
             return {k: row[k] for k in self.include}
@@ -282,6 +486,157 @@ class DefaultEventTransformer(EventAttributeTransformer):
         else:
             return row
 
+    def row_signature(self, event: Event) -> Hashable:
+        """
+        Return a value that is the same for events with the same row keys.
+
+        The keys of a row only depend on the type of the event and the types
+        of its qualifiers, so this is much cheaper than creating the row.
+        """
+        if isinstance(event, QualifierMixin) and event.qualifiers:
+            return type(event), tuple(
+                type(qualifier) for qualifier in event.qualifiers
+            )
+        return type(event), ()
+
+    def transform_batch(
+        self, events: Iterable[Event], categorical: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Convert events to a dictionary with the values per column.
+
+        The result is the same as calling the transformer on every event
+        and collecting the values per column. A first pass determines the
+        columns from the event types and qualifiers in `events`, so the
+        values can be written to preallocated columns without creating a
+        dictionary per event.
+
+        Args:
+            events: The events to convert.
+            categorical: Return the columns with enum values (event type,
+                result, qualifier types, ...) as categorical columns instead
+                of lists. Requires NumPy.
+        """
+        events = list(events)
+        n_events = len(events)
+
+        def qualifier_columns(event: Event) -> List[Tuple[str, bool]]:
+            if not isinstance(event, QualifierMixin) or not event.qualifiers:
+                return []
+            columns_ = []
+            for qualifier in event.qualifiers:
+                column = _get_qualifier_column(qualifier)
+                if column is not None:
+                    columns_.append(column)
+                else:
+                    columns_.extend(
+                        (name, False) for name in qualifier.to_dict()
+                    )
+            return columns_
+
+        # Determine the columns, in the order in which they are first seen
+        schema: Dict[str, bool] = {
+            name: name in _EVENT_ENUM_COLUMNS for name in _EVENT_COLUMNS
+        }
+        seen = set()
+        for event in events:
+            event_cls = type(event)
+            signature = self.row_signature(event)
+            if signature in seen:
+                continue
+            seen.add(signature)
+
+            for name in _get_event_type_columns(event_cls):
+                schema.setdefault(name, name in _EVENT_ENUM_COLUMNS)
+            for name, is_enum in qualifier_columns(event):
+                schema.setdefault(name, is_enum)
+            for name in _RESULT_COLUMNS:
+                schema.setdefault(name, name in _EVENT_ENUM_COLUMNS)
+
+        if not events:
+            return {}
+
+        static_columns = {**_EVENT_COLUMNS, **_RESULT_COLUMNS}
+        columns = {}
+        for name in schema:
+            getter = static_columns.get(name)
+            columns[name] = (
+                [getter(event) for event in events]
+                if getter is not None
+                else [None] * n_events
+            )
+
+        for i, event in enumerate(events):
+            for name, getter in _get_event_type_columns(type(event)).items():
+                columns[name][i] = getter(event)
+
+            if isinstance(event, QualifierMixin) and event.qualifiers:
+                for qualifier in event.qualifiers:
+                    column = _get_qualifier_column(qualifier)
+                    if column is None:
+                        for name, value in qualifier.to_dict().items():
+                            columns[name][i] = value
+                    elif column[1]:
+                        columns[column[0]][i] = qualifier.value.value
+                    else:
+                        columns[column[0]][i] = qualifier.value
+
+        if categorical:
+            columns = {
+                name: (_to_categorical(values) if schema.get(name) else values)
+                for name, values in columns.items()
+            }
+
+        if self.include:
+            return {k: columns[k] for k in self.include}
+        elif self.exclude:
+            return {k: v for k, v in columns.items() if k not in self.exclude}
+        else:
+            return columns
+
+
+def _to_categorical(values: List[Optional[str]]) -> _Categorical:
+    import numpy as np
+
+    categories: Dict[str, int] = {}
+    codes = np.fromiter(
+        (
+            -1
+            if value is None
+            else categories.setdefault(value, len(categories))
+            for value in values
+        ),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return _Categorical(codes, list(categories))
+
+
+# The columns that are part of every frame row, in order
+_FRAME_COLUMNS: Dict[str, Callable[[Frame], Any]] = {
+    "period_id": lambda frame: frame.period.id if frame.period else None,
+    "timestamp": lambda frame: frame.timestamp,
+    "frame_id": lambda frame: frame.frame_id,
+    "ball_state": lambda frame: (
+        frame.ball_state.value if frame.ball_state else None
+    ),
+    "ball_owning_team_id": lambda frame: (
+        frame.ball_owning_team.team_id if frame.ball_owning_team else None
+    ),
+    "ball_x": lambda frame: (
+        frame.ball_coordinates.x if frame.ball_coordinates else None
+    ),
+    "ball_y": lambda frame: (
+        frame.ball_coordinates.y if frame.ball_coordinates else None
+    ),
+    "ball_z": lambda frame: (
+        getattr(frame.ball_coordinates, "z", None)
+        if frame.ball_coordinates
+        else None
+    ),
+    "ball_speed": lambda frame: frame.ball_speed,
+}
+
 
 class DefaultFrameTransformer:
     def __init__(
@@ -296,48 +651,36 @@ class DefaultFrameTransformer:
 
         self.exclude = exclude or []
         self.include = include or []
+        self._player_keys: Dict[str, Tuple[str, str, str, str]] = {}
+
+    def _get_player_keys(self, player: Player) -> Tuple[str, str, str, str]:
+        keys = self._player_keys.get(player.player_id)
+        if keys is None:
+            keys = self._player_keys[player.player_id] = tuple(
+                f"{player.player_id}_{suffix}"
+                for suffix in ("x", "y", "d", "s")
+            )
+        return keys
+
+    @property
+    def static_columns(self) -> Dict[str, Callable[[Frame], Any]]:
+        """The columns that are part of every row, with their getters."""
+        return {
+            name: getter
+            for name, getter in _FRAME_COLUMNS.items()
+            if (not self.include or name in self.include)
+            and name not in self.exclude
+        }
 
     def __call__(self, frame: Frame) -> Dict[str, Any]:
-        row = dict(
-            period_id=frame.period.id if frame.period else None,
-            timestamp=frame.timestamp,
-            frame_id=frame.frame_id,
-            ball_state=frame.ball_state.value if frame.ball_state else None,
-            ball_owning_team_id=(
-                frame.ball_owning_team.team_id
-                if frame.ball_owning_team
-                else None
-            ),
-            ball_x=(
-                frame.ball_coordinates.x if frame.ball_coordinates else None
-            ),
-            ball_y=(
-                frame.ball_coordinates.y if frame.ball_coordinates else None
-            ),
-            ball_z=(
-                getattr(frame.ball_coordinates, "z", None)
-                if frame.ball_coordinates
-                else None
-            ),
-            ball_speed=frame.ball_speed,
-        )
+        row = {name: getter(frame) for name, getter in _FRAME_COLUMNS.items()}
         for player, player_data in frame.players_data.items():
-            row.update(
-                {
-                    f"{player.player_id}_x": (
-                        player_data.coordinates.x
-                        if player_data.coordinates
-                        else None
-                    ),
-                    f"{player.player_id}_y": (
-                        player_data.coordinates.y
-                        if player_data.coordinates
-                        else None
-                    ),
-                    f"{player.player_id}_d": player_data.distance,
-                    f"{player.player_id}_s": player_data.speed,
-                }
-            )
+            x_key, y_key, d_key, s_key = self._get_player_keys(player)
+            coordinates = player_data.coordinates
+            row[x_key] = coordinates.x if coordinates else None
+            row[y_key] = coordinates.y if coordinates else None
+            row[d_key] = player_data.distance
+            row[s_key] = player_data.speed
 
             if player_data.other_data:
                 for name, value in player_data.other_data.items():
@@ -362,6 +705,74 @@ class DefaultFrameTransformer:
         else:
             return row
 
+    def row_signature(self, frame: Frame) -> Hashable:
+        """Return a value that is the same for frames with the same row keys."""
+        return (
+            tuple(
+                (
+                    player.player_id,
+                    tuple(player_data.other_data)
+                    if player_data.other_data
+                    else (),
+                )
+                for player, player_data in frame.players_data.items()
+            ),
+            tuple(frame.other_data) if frame.other_data else (),
+        )
+
+    def transform_batch(self, frames: Iterable[Frame]) -> Dict[str, List[Any]]:
+        """
+        Convert frames to a dictionary with a list of values per column.
+
+        The result is the same as calling the transformer on every frame
+        and collecting the values per column, but no dictionary is created
+        per frame and the columns of each player are only looked up once.
+        """
+        frames = list(frames)
+        n_frames = len(frames)
+
+        columns = {
+            name: [getter(frame) for frame in frames]
+            for name, getter in _FRAME_COLUMNS.items()
+        }
+
+        def get_column(name: str) -> List[Any]:
+            values = columns.get(name)
+            if values is None:
+                values = columns[name] = [None] * n_frames
+            return values
+
+        player_columns = {}
+        for i, frame in enumerate(frames):
+            for player, player_data in frame.players_data.items():
+                player_column = player_columns.get(player)
+                if player_column is None:
+                    player_column = player_columns[player] = tuple(
+                        get_column(key)
+                        for key in self._get_player_keys(player)
+                    )
+                xs, ys, distances, speeds = player_column
+                if player_data.coordinates:
+                    xs[i] = player_data.coordinates.x
+                    ys[i] = player_data.coordinates.y
+                distances[i] = player_data.distance
+                speeds[i] = player_data.speed
+
+                if player_data.other_data:
+                    for name, value in player_data.other_data.items():
+                        get_column(f"{player.player_id}_{name}")[i] = value
+
+            if frame.other_data:
+                for name, value in frame.other_data.items():
+                    get_column(name)[i] = value
+
+        if self.include:
+            return {k: columns[k] for k in self.include}
+        elif self.exclude:
+            return {k: v for k, v in columns.items() if k not in self.exclude}
+        else:
+            return columns
+
 
 class DefaultCodeTransformer:
     def __init__(
@@ -394,5 +805,9 @@ class DefaultCodeTransformer:
         else:
             return row
 
+    def row_signature(self, code: Code) -> Hashable:
+        """Return a value that is the same for codes with the same row keys."""
+        return tuple(code.labels) if code.labels else ()
+
 
 BodyPartTransformer = create_transformer_from_qualifier(BodyPartQualifier)
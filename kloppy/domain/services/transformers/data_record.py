@@ -1,7 +1,19 @@
 import sys
 from abc import ABC, abstractmethod
 from fnmatch import fnmatch
-from typing import Any, Callable, Dict, Generic, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 if sys.version_info >= (3, 11):
     from typing import Unpack
@@ -21,7 +33,30 @@ Column = Union[str, Callable[[T], Any]]
 NamedColumns = Dict[str, Column]
 
 
+# Operations of a compiled column plan
+_COPY = 0  # copy keys from the default row
+_GET = 1  # get the value with a function of the record
+_ATTRIBUTE = 2  # get an attribute of the record
+_CALL = 3  # update the row with the dictionary returned by a function
+
+# Maximum number of plans kept per transformer. Rows of the default
+# transformer only have a handful of distinct key sets, so this is only
+# reached when almost every record has other keys.
+_MAX_PLANS = 1024
+
+
 class DataRecordToDictTransformer(ABC, Generic[T]):
+    """
+    Convert a data record to a dictionary with the requested columns.
+
+    The requested columns are compiled to a plan of operations. String
+    columns are resolved once against the keys of the default row: wildcard
+    patterns are expanded to a list of keys, and names that are not part of
+    the default row are read from the attributes of the record. Plans are
+    cached per set of default row keys. When no column needs it, the default
+    row is not created at all.
+    """
+
     @abstractmethod
     def default_transformer(self) -> Callable[[T], Dict]:
         ...
@@ -31,57 +66,126 @@ class DataRecordToDictTransformer(ABC, Generic[T]):
         *columns: Unpack[Tuple[Column]],
         **named_columns: NamedColumns,
     ):
+        self._default = self.default_transformer()
         if not columns and not named_columns:
-            converter = self.default_transformer()
+            converter = self._default
+            self._needs_default_row = True
         else:
-            default = self.default_transformer()
-            has_string_columns = any(
-                not callable(column) for column in columns
-            )
+            converter = self._compile(columns, named_columns)
+
+        self.converter = converter
+        # Function columns, of which the returned keys can differ per record
+        self._function_columns = [
+            column for column in columns if callable(column)
+        ]
+
+    def _compile(
+        self, columns: Tuple[Column, ...], named_columns: NamedColumns
+    ) -> Callable[[T], Dict[str, Any]]:
+        default = self._default
+        # Columns of the default row that can be computed without creating
+        # the full row
+        static_columns = getattr(default, "static_columns", {})
+
+        needs_default_row = any(
+            not callable(column) and column not in static_columns
+            for column in columns
+        )
+        self._needs_default_row = needs_default_row
+
+        def compile_plan(keys: Optional[Tuple[str, ...]]) -> List[tuple]:
+            plan = []
+
+            def copy(keys_: List[str]):
+                if plan and plan[-1][0] == _COPY:
+                    plan[-1][1].extend(keys_)
+                else:
+                    plan.append((_COPY, keys_))
+
+            for column in columns:
+                if callable(column):
+                    plan.append((_CALL, column))
+                elif column in static_columns:
+                    plan.append((_GET, column, static_columns[column]))
+                elif column == "*":
+                    copy(list(keys))
+                elif "*" in column:
+                    copy([key for key in keys if fnmatch(key, column)])
+                elif column in keys:
+                    copy([column])
+                else:
+                    plan.append((_ATTRIBUTE, column))
 
-            def converter(data_record: T) -> Dict[str, Any]:
-                if has_string_columns:
-                    default_row = default(data_record)
+            for name, column in named_columns.items():
+                if callable(column):
+                    plan.append((_GET, name, column))
                 else:
-                    default_row = {}
-
-                row = {}
-                for column in columns:
-                    if callable(column):
-                        res = column(data_record)
-                        if not isinstance(res, dict):
-                            raise KloppyError(
-                                "A function column should return a dictionary"
-                            )
-                        row.update(res)
-                    else:
-                        if column == "*":
-                            row.update(default_row)
-                        elif "*" in column:
-                            row.update(
-                                {
-                                    k: v
-                                    for k, v in default_row.items()
-                                    if fnmatch(k, column)
-                                }
-                            )
-                        elif column in default_row:
-                            row[column] = default_row[column]
-                        else:
-                            row[column] = getattr(data_record, column, None)
-
-                for name, column in named_columns.items():
-                    row[name] = (
-                        column(data_record) if callable(column) else column
+                    plan.append((_GET, name, lambda _, value=column: value))
+            return plan
+
+        plans: Dict[Tuple[str, ...], List[tuple]] = {}
+        static_plan = None if needs_default_row else compile_plan(None)
+
+        def converter(data_record: T) -> Dict[str, Any]:
+            if static_plan is not None:
+                plan = static_plan
+            else:
+                default_row = default(data_record)
+                keys = tuple(default_row)
+                plan = plans.get(keys)
+                if plan is None:
+                    plan = compile_plan(keys)
+                    if len(plans) < _MAX_PLANS:
+                        plans[keys] = plan
+
+            row = {}
+            for operation in plan:
+                op = operation[0]
+                if op == _COPY:
+                    for key in operation[1]:
+                        row[key] = default_row[key]
+                elif op == _GET:
+                    row[operation[1]] = operation[2](data_record)
+                elif op == _ATTRIBUTE:
+                    row[operation[1]] = getattr(
+                        data_record, operation[1], None
                     )
+                else:
+                    res = operation[1](data_record)
+                    if not isinstance(res, dict):
+                        raise KloppyError(
+                            "A function column should return a dictionary"
+                        )
+                    row.update(res)
+            return row
 
-                return row
-
-        self.converter = converter
+        return converter
 
     def __call__(self, data_record: T) -> Dict[str, Any]:
         return self.converter(data_record)
 
+    def row_signature(self, data_record: T) -> Hashable:
+        """
+        Return a value that is the same for records with the same row keys.
+
+        Records with the same signature are converted to rows with the same
+        keys, in the same order. The signature is derived from the default
+        transformer without creating the default row. Function columns are
+        called to get their keys, so the signature costs as much as those
+        columns.
+        """
+        signature = []
+        if self._needs_default_row:
+            row_signature = getattr(self._default, "row_signature", None)
+            signature.append(
+                row_signature(data_record)
+                if row_signature is not None
+                else tuple(self._default(data_record))
+            )
+        for column in self._function_columns:
+            signature.append(tuple(column(data_record)))
+        return tuple(signature)
+
 
 class EventToDictTransformer(DataRecordToDictTransformer[Event]):
     def default_transformer(self) -> Callable[[Event], Dict]:
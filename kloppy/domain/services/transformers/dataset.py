@@ -1,13 +1,27 @@
 import warnings
 from dataclasses import fields, replace
-from typing import Optional, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from kloppy.domain import (
     DEFAULT_PITCH_LENGTH,
     DEFAULT_PITCH_WIDTH,
     AttackingDirection,
     CoordinateSystem,
+    CoordinateTransform,
     CustomCoordinateSystem,
+    DataRecord,
     Dataset,
     DatasetFlag,
     DatasetType,
@@ -20,13 +34,79 @@ from kloppy.domain import (
     Point3D,
     Provider,
     ProviderCoordinateSystem,
+    RecordsView,
     Team,
     TrackingDataset,
     build_coordinate_system,
 )
 from kloppy.domain.models.event import Event
-from kloppy.domain.models.tracking import PlayerData
-from kloppy.exceptions import KloppyError
+from kloppy.domain.models.tracking import ColumnarFrames, PlayerData
+from kloppy.exceptions import KloppyError, KloppyParameterError
+
+T = TypeVar("T", bound=DataRecord)
+
+
+class _RecordPlan(NamedTuple):
+    init_fields: Tuple[str, ...]
+    coordinate_fields: Tuple[str, ...]
+    get_init_values: Callable[[DataRecord], tuple]
+
+
+@lru_cache(maxsize=None)
+def _get_record_plan(record_cls: Type[DataRecord]) -> _RecordPlan:
+    """The fields of a record class, resolved once per class."""
+    init_fields = tuple(
+        field.name for field in fields(record_cls) if field.init
+    )
+    return _RecordPlan(
+        init_fields=init_fields,
+        coordinate_fields=tuple(
+            name for name in init_fields if name.endswith("coordinates")
+        ),
+        get_init_values=attrgetter(*init_fields),
+    )
+
+
+def _copy_record(record: T, **changes) -> T:
+    """
+    Return a copy of `record` with `changes` applied.
+
+    Equivalent to `dataclasses.replace`, but copies the init fields directly
+    instead of calling `__init__`. Like `replace`, the copy is not linked to
+    a dataset.
+    """
+    plan = _get_record_plan(record.__class__)
+    record_copy = object.__new__(record.__class__)
+    for name, value in zip(plan.init_fields, plan.get_init_values(record)):
+        object.__setattr__(record_copy, name, changes.get(name, value))
+    return record_copy
+
+
+def _copy_unchanged_records(
+    records: List[T], original_records: Sequence[T]
+) -> List[T]:
+    """
+    Copy the records that were returned unchanged by a transformation.
+
+    The transformed dataset links its records to itself. Copying the records
+    that were not transformed leaves them linked to the original dataset.
+    """
+    return [
+        _copy_record(record) if record is original_record else record
+        for record, original_record in zip(records, original_records)
+    ]
+
+
+def _owns_records(dataset: Dataset) -> bool:
+    """Whether the records of `dataset` are linked to `dataset` itself."""
+    records = dataset.records
+    if isinstance(records, RecordsView):
+        return False
+    if isinstance(records, ColumnarFrames):
+        return records._dataset is dataset
+    return all(
+        getattr(record, "dataset", None) is dataset for record in records
+    )
 
 
 class DatasetTransformer:
@@ -87,6 +167,8 @@ class DatasetTransformer:
                 "You must specify both the source and target Orientation"
             )
 
+        self._coordinate_transform = None
+
     @property
     def _needs_coordinate_system_change(self):
         return self._from_coordinate_system != self._to_coordinate_system
@@ -99,31 +181,37 @@ class DatasetTransformer:
     def _needs_orientation_change(self):
         return self._from_orientation != self._to_orientation
 
+    @property
+    def coordinate_transform(self) -> CoordinateTransform:
+        """The compiled transform used to change the coordinates of points."""
+        if self._coordinate_transform is None:
+            invert_y = (
+                self._needs_coordinate_system_change
+                and self._from_coordinate_system.vertical_orientation
+                != self._to_coordinate_system.vertical_orientation
+            )
+            self._coordinate_transform = CoordinateTransform.build(
+                from_dims=self._from_pitch_dimensions,
+                to_dims=self._to_pitch_dimensions,
+                pitch_length=(
+                    self._from_pitch_dimensions.pitch_length
+                    or DEFAULT_PITCH_LENGTH
+                ),
+                pitch_width=(
+                    self._from_pitch_dimensions.pitch_width
+                    or DEFAULT_PITCH_WIDTH
+                ),
+                invert_y=invert_y,
+            )
+        return self._coordinate_transform
+
     def change_point_dimensions(
         self, point: Union[Point, Point3D, None]
     ) -> Union[Point, Point3D, None]:
         if point is None:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-        print(point_base)
-        print(self._to_pitch_dimensions.from_metric_base)
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point=point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self.coordinate_transform.apply_point(point)
 
     def flip_point(
         self, point: Union[Point, Point3D, None]
@@ -198,6 +286,234 @@ class DatasetTransformer:
 
         return frame
 
+    def transform_frames(
+        self, frames: Sequence[Frame], inplace: bool = False
+    ) -> Union[List[Frame], ColumnarFrames]:
+        """
+        Transform a sequence of frames at once.
+
+        All coordinates are collected in arrays and transformed with a
+        single vectorized operation. Whether a frame must be flipped is
+        determined once per combination of period and ball owning team.
+        [`ColumnarFrames`][kloppy.domain.ColumnarFrames] are transformed
+        without materializing any frame.
+
+        Falls back to [`transform_frame`][kloppy.domain.DatasetTransformer.transform_frame]
+        for each frame when NumPy is not installed.
+
+        Arguments:
+            frames: The frames to transform.
+            inplace: Update the coordinates of the given frames instead of
+                creating new frames. Only use this for frames that are not
+                shared with a dataset, for example while deserializing.
+        """
+        if isinstance(frames, ColumnarFrames):
+            return self.__transform_columnar_frames(frames, inplace)
+
+        try:
+            import numpy as np
+        except ImportError:
+            transformed_frames = [self.transform_frame(f) for f in frames]
+            if not inplace:
+                return transformed_frames
+            for frame, transformed_frame in zip(frames, transformed_frames):
+                frame.ball_coordinates = transformed_frame.ball_coordinates
+                for player, player_data in frame.players_data.items():
+                    player_data.coordinates = transformed_frame.players_data[
+                        player
+                    ].coordinates
+            return list(frames)
+
+        frames = list(frames)
+        needs_change = (
+            self._needs_coordinate_system_change
+            or self._needs_pitch_dimensions_change
+        )
+        flip_cache = {}
+
+        # Collect the coordinates of all frames
+        frame_flips = []
+        xs, ys, point_flips = [], [], []
+        for frame in frames:
+            flip = self.__needs_flip_cached(
+                flip_cache, frame.period, frame.ball_owning_team
+            )
+            frame_flips.append(flip)
+            if not (needs_change or flip):
+                continue
+
+            if frame.ball_coordinates is not None:
+                xs.append(frame.ball_coordinates.x)
+                ys.append(frame.ball_coordinates.y)
+                point_flips.append(flip)
+            for player_data in frame.players_data.values():
+                if player_data.coordinates is not None:
+                    xs.append(player_data.coordinates.x)
+                    ys.append(player_data.coordinates.y)
+                    point_flips.append(flip)
+
+        xs, ys = self.__transform_coordinate_arrays(
+            np.array(xs, dtype=float),
+            np.array(ys, dtype=float),
+            np.array(point_flips, dtype=bool),
+        )
+        xs, ys = xs.tolist(), ys.tolist()
+
+        # Write the results back
+        transformed_frames = []
+        idx = 0
+        for frame, flip in zip(frames, frame_flips):
+            if not (needs_change or flip):
+                transformed_frames.append(frame)
+                continue
+
+            ball_coordinates = frame.ball_coordinates
+            if ball_coordinates is not None:
+                ball_coordinates = self.__replace_point(
+                    ball_coordinates, xs[idx], ys[idx], needs_change
+                )
+                idx += 1
+
+            if inplace:
+                frame.ball_coordinates = ball_coordinates
+                for player_data in frame.players_data.values():
+                    if player_data.coordinates is not None:
+                        player_data.coordinates = self.__replace_point(
+                            player_data.coordinates,
+                            xs[idx],
+                            ys[idx],
+                            needs_change,
+                        )
+                        idx += 1
+                transformed_frames.append(frame)
+                continue
+
+            players_data = {}
+            for player, player_data in frame.players_data.items():
+                coordinates = player_data.coordinates
+                if coordinates is not None:
+                    coordinates = self.__replace_point(
+                        coordinates, xs[idx], ys[idx], needs_change
+                    )
+                    idx += 1
+                players_data[player] = PlayerData(
+                    coordinates=coordinates,
+                    distance=player_data.distance,
+                    speed=player_data.speed,
+                    other_data=player_data.other_data,
+                )
+
+            transformed_frames.append(
+                Frame(
+                    # doesn't change
+                    timestamp=frame.timestamp,
+                    frame_id=frame.frame_id,
+                    ball_owning_team=frame.ball_owning_team,
+                    ball_state=frame.ball_state,
+                    period=frame.period,
+                    ball_speed=frame.ball_speed,
+                    other_data=frame.other_data,
+                    statistics=frame.statistics,
+                    # changes
+                    ball_coordinates=ball_coordinates,
+                    players_data=players_data,
+                )
+            )
+
+        return transformed_frames
+
+    def __replace_point(
+        self, point: Union[Point, Point3D], x: float, y: float, needs_change
+    ) -> Union[Point, Point3D]:
+        if isinstance(point, Point3D):
+            z = point.z
+            if needs_change:
+                z = self.coordinate_transform.apply_z(z)
+            return Point3D(x=x, y=y, z=z)
+        return Point(x=x, y=y)
+
+    def __transform_columnar_frames(
+        self, frames: ColumnarFrames, inplace: bool
+    ) -> ColumnarFrames:
+        import numpy as np
+
+        # Determine the flip once per (period, ball owning team) pair
+        pairs, inverse = np.unique(
+            np.stack([frames.period, frames.ball_owning_team], axis=1),
+            axis=0,
+            return_inverse=True,
+        )
+        flip_cache = {}
+        unique_flips = np.array(
+            [
+                self.__needs_flip_cached(
+                    flip_cache,
+                    frames.periods[period] if period >= 0 else None,
+                    frames.teams[team] if team >= 0 else None,
+                )
+                for period, team in pairs.tolist()
+            ],
+            dtype=bool,
+        )
+        flips = unique_flips[inverse.reshape(-1)]
+
+        ball_x, ball_y = self.__transform_coordinate_arrays(
+            frames.ball_x, frames.ball_y, flips
+        )
+        player_x, player_y = self.__transform_coordinate_arrays(
+            frames.player_x, frames.player_y, flips[:, None]
+        )
+        ball_z = frames.ball_z
+        if (
+            self._needs_coordinate_system_change
+            or self._needs_pitch_dimensions_change
+        ):
+            ball_z = self.coordinate_transform.apply_z_array(ball_z)
+
+        changes = dict(
+            ball_x=ball_x,
+            ball_y=ball_y,
+            ball_z=ball_z,
+            player_x=player_x,
+            player_y=player_y,
+        )
+        if inplace:
+            for name, values in changes.items():
+                setattr(frames, name, values)
+            return frames
+        return frames.replace(**changes)
+
+    def __transform_coordinate_arrays(self, xs, ys, flips):
+        import numpy as np
+
+        if (
+            self._needs_coordinate_system_change
+            or self._needs_pitch_dimensions_change
+        ):
+            xs, ys = self.coordinate_transform.apply_arrays(xs, ys)
+
+        if np.any(flips):
+            x_dim = self._to_pitch_dimensions.x_dim
+            y_dim = self._to_pitch_dimensions.y_dim
+            xs = np.where(flips, x_dim.from_base(1 - x_dim.to_base(xs)), xs)
+            ys = np.where(flips, y_dim.from_base(1 - y_dim.to_base(ys)), ys)
+        return xs, ys
+
+    def __needs_flip_cached(
+        self,
+        cache: dict,
+        period: Period,
+        ball_owning_team: Optional[Team] = None,
+    ) -> bool:
+        if not self._needs_orientation_change:
+            return False
+        key = (period, ball_owning_team)
+        if key not in cache:
+            cache[key] = self.__needs_flip(
+                period=period, ball_owning_team=ball_owning_team
+            )
+        return cache[key]
+
     def __change_frame_coordinate_system(self, frame: Frame):
         return Frame(
             # doesn't change
@@ -259,33 +575,7 @@ class DatasetTransformer:
         if not point:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-
-        if (
-            self._from_coordinate_system.vertical_orientation
-            != self._to_coordinate_system.vertical_orientation
-        ):
-            point_base = replace(
-                point_base,
-                y=base_pitch_width - point_base.y,
-            )
-
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self.coordinate_transform.apply_point(point)
 
     def __flip_frame(self, frame: Frame):
         players_data = {}
@@ -311,14 +601,25 @@ class DatasetTransformer:
             statistics=frame.statistics,
         )
 
-    def transform_event(self, event: Event) -> Event:
+    def transform_event(self, event: Event, inplace: bool = False) -> Event:
+        """
+        Transform the coordinates of an event.
+
+        Arguments:
+            event: The event to transform.
+            inplace: Update the coordinates of the given event instead of
+                creating a copy. Only use this for events that are not
+                shared with another dataset.
+        """
         # Change coordinate system
         if self._needs_coordinate_system_change:
-            event = self.__change_event_coordinate_system(event)
+            event = self.__change_event_coordinate_system(event, inplace)
+            inplace = True
 
         # Change dimensions
         elif self._needs_pitch_dimensions_change:
-            event = self.__change_event_dimensions(event)
+            event = self.__change_event_dimensions(event, inplace)
+            inplace = True
 
         # Flip event based on orientation
         if self._needs_orientation_change:
@@ -327,46 +628,48 @@ class DatasetTransformer:
                 ball_owning_team=event.ball_owning_team,
                 action_executing_team=event.team,
             ):
-                event = self.__flip_event(event)
+                event = self.__flip_event(event, inplace)
+                inplace = True
 
             if event.freeze_frame:
-                event.freeze_frame = self.transform_frame(event.freeze_frame)
+                freeze_frame = self.transform_frame(event.freeze_frame)
+                if inplace:
+                    event.freeze_frame = freeze_frame
+                else:
+                    event = _copy_record(event, freeze_frame=freeze_frame)
 
         return event
 
-    def __change_event_coordinate_system(self, event: Event):
-        position_changes = {
-            field.name: self.__change_point_coordinate_system(
-                getattr(event, field.name)
-            )
-            for field in fields(event)
-            if field.name.endswith("coordinates")
-            and getattr(event, field.name)
-        }
-
-        return replace(event, **position_changes)
-
-    def __change_event_dimensions(self, event: Event):
-        position_changes = {
-            field.name: self.change_point_dimensions(
-                getattr(event, field.name)
-            )
-            for field in fields(event)
-            if field.name.endswith("coordinates")
-            and getattr(event, field.name)
-        }
-
-        return replace(event, **position_changes)
+    def __change_event_coordinate_system(self, event: Event, inplace: bool):
+        return self.__update_event_coordinates(
+            event, self.__change_point_coordinate_system, inplace
+        )
 
-    def __flip_event(self, event: Event):
-        position_changes = {
-            field.name: self.flip_point(getattr(event, field.name))
-            for field in fields(event)
-            if field.name.endswith("coordinates")
-            and getattr(event, field.name)
-        }
+    def __change_event_dimensions(self, event: Event, inplace: bool):
+        return self.__update_event_coordinates(
+            event, self.change_point_dimensions, inplace
+        )
 
-        return replace(event, **position_changes)
+    def __flip_event(self, event: Event, inplace: bool):
+        return self.__update_event_coordinates(event, self.flip_point, inplace)
+
+    @staticmethod
+    def __update_event_coordinates(
+        event: Event,
+        transform_point: Callable[[Point], Point],
+        inplace: bool,
+    ) -> Event:
+        position_changes = {}
+        for name in _get_record_plan(event.__class__).coordinate_fields:
+            point = getattr(event, name)
+            if point:
+                position_changes[name] = transform_point(point)
+
+        if inplace:
+            for name, point in position_changes.items():
+                setattr(event, name, point)
+            return event
+        return _copy_record(event, **position_changes)
 
     def get_to_coordinate_system(self) -> Optional[CoordinateSystem]:
         return self._to_coordinate_system
@@ -378,6 +681,7 @@ class DatasetTransformer:
         to_pitch_dimensions: Optional[PitchDimensions] = None,
         to_orientation: Optional[Orientation] = None,
         to_coordinate_system: Optional[CoordinateSystem] = None,
+        inplace: bool = False,
     ) -> Dataset:
         if (
             to_pitch_dimensions is None
@@ -386,6 +690,14 @@ class DatasetTransformer:
         ):
             return dataset
 
+        if inplace and not _owns_records(dataset):
+            raise KloppyParameterError(
+                "Cannot transform a dataset inplace when it doesn't own its "
+                "records, for example a view returned by `filter`, "
+                "`select_period` or slicing. Use `materialize()` first or "
+                "set `inplace=False`."
+            )
+
         if to_orientation is None:
             to_orientation = dataset.metadata.orientation
         elif to_orientation == Orientation.BALL_OWNING_TEAM:
@@ -467,20 +779,35 @@ class DatasetTransformer:
                 orientation=to_orientation,
             )
 
+        if inplace:
+            # Update the records and metadata of the dataset itself
+            if isinstance(dataset, TrackingDataset):
+                transformer.transform_frames(dataset.records, inplace=True)
+            elif isinstance(dataset, EventDataset):
+                for event in dataset.records:
+                    transformer.transform_event(event, inplace=True)
+            else:
+                raise KloppyError("Unknown Dataset type")
+            dataset.metadata = metadata
+            return dataset
+
         if isinstance(dataset, TrackingDataset):
-            frames = [
-                transformer.transform_frame(record)
-                for record in dataset.records
-            ]
+            frames = transformer.transform_frames(dataset.records)
+            if not isinstance(frames, ColumnarFrames):
+                frames = _copy_unchanged_records(frames, dataset.records)
 
             return TrackingDataset(
                 metadata=metadata,
                 records=frames,
             )
         elif isinstance(dataset, EventDataset):
-            events = [
-                transformer.transform_event(event) for event in dataset.records
-            ]
+            events = _copy_unchanged_records(
+                [
+                    transformer.transform_event(event)
+                    for event in dataset.records
+                ],
+                dataset.records,
+            )
 
             return EventDataset(
                 metadata=metadata,
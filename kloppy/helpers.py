@@ -18,7 +18,24 @@ def transform(
     to_coordinate_system: Optional[
         Union[CoordinateSystem, Provider, str]
     ] = None,
+    inplace: bool = False,
 ) -> Dataset:
+    """
+    Transform the coordinates of a dataset.
+
+    Args:
+        dataset: The dataset to transform.
+        to_orientation: The orientation to transform to.
+        to_pitch_dimensions: The pitch dimensions to transform to.
+        to_coordinate_system: The coordinate system to transform to.
+        inplace: Update the records and metadata of `dataset` instead of
+            returning a transformed copy. Only use this for a dataset you
+            own, as all references to its records see the change.
+
+    Raises:
+        KloppyParameterError: If `inplace` is set for a dataset that doesn't
+            own its records, for example a view returned by `filter`.
+    """
     # convert raw orientation to object
     if to_orientation is not None and isinstance(to_orientation, str):
         to_orientation = Orientation[to_orientation.upper()]
@@ -43,4 +60,5 @@ def transform(
         to_orientation=to_orientation,
         to_coordinate_system=to_coordinate_system,
         to_pitch_dimensions=to_pitch_dimensions,
+        inplace=inplace,
     )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from io import BytesIO
 from typing import BinaryIO, List
 
 
@@ -19,6 +20,18 @@ class Adapter(ABC):
     def read_to_stream(self, url: str, output: BinaryIO):
         pass
 
+    def open(self, url: str) -> BinaryIO:
+        """
+        Open a binary stream to the given URL.
+
+        Adapters that can stream the content should override this. By
+        default, the content is read into memory with `read_to_stream`.
+        """
+        stream = BytesIO()
+        self.read_to_stream(url, stream)
+        stream.seek(0)
+        return stream
+
     @abstractmethod
     def list_directory(self, url: str, recursive: bool = True) -> List[str]:
         pass
@@ -7,7 +7,7 @@ class FileAdapter(FSSpecAdapter):
     def supports(self, url: str) -> bool:
         return self._infer_protocol(url) == "file"
 
-    def _get_filesystem(
-        self, url: str, no_cache: bool = False
-    ) -> fsspec.AbstractFileSystem:
-        return fsspec.filesystem("file")
+    def _get_filesystem(self, url: str) -> fsspec.AbstractFileSystem:
+        return self._get_pooled_filesystem(
+            None, lambda: fsspec.filesystem("file")
+        )
@@ -1,16 +1,83 @@
+import io
 import re
+import shutil
+import threading
 from abc import ABC, abstractmethod
-from typing import BinaryIO, List, Optional
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Hashable, List, Optional
 
 import fsspec
+from fsspec.compression import compr
 
-from kloppy.config import get_config
 from kloppy.exceptions import InputNotFoundError
+from kloppy.infra.io.cache import get_cache
 
 from .adapter import Adapter
 
+# Filesystems are pooled per adapter and set of options, so that open
+# connections, directory listings and cache metadata are reused between
+# calls instead of being set up again for every file.
+FILESYSTEM_POOL_SIZE = 32
+
+_filesystem_pool: "OrderedDict[Hashable, fsspec.AbstractFileSystem]" = (
+    OrderedDict()
+)
+_filesystem_pool_lock = threading.Lock()
+
+
+class DecompressedFile(io.BufferedIOBase):
+    """
+    A read-only file that decompresses another file on the fly.
+
+    Unlike the file objects of the compression libraries, closing it also
+    closes the compressed file.
+    """
+
+    def __init__(self, fileobj: BinaryIO, compression: str):
+        self._fileobj = fileobj
+        self._stream = compr[compression](fileobj, mode="r")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._stream.read(size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self._stream.read1(size)
+
+    def readinto(self, b) -> int:
+        return self._stream.readinto(b)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        return self._stream.readline(size)
+
+    def peek(self, size: int = 0) -> bytes:
+        return self._stream.peek(size)
+
+    def seekable(self) -> bool:
+        return self._stream.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._stream.close()
+        finally:
+            self._fileobj.close()
+            super().close()
+
 
 class FSSpecAdapter(Adapter, ABC):
+    # Whether files are downloaded to the cache before they are read
+    cache_downloads = False
+
     def _infer_protocol(self, url: str) -> str:
         """
         Infer the protocol based on the URL prefix.
@@ -23,21 +90,45 @@ class FSSpecAdapter(Adapter, ABC):
             ]  # Remove '://' from the matched protocol
         return "file"  # Default to 'file' for local paths
 
-    def _get_filesystem(
-        self, url: str, no_cache: bool = False
+    def _get_pooled_filesystem(
+        self,
+        options: Hashable,
+        create: Callable[[], fsspec.AbstractFileSystem],
     ) -> fsspec.AbstractFileSystem:
         """
-        Get the appropriate fsspec filesystem for the given URL, with caching enabled.
+        Get a filesystem from the pool, or create it if it is not pooled yet.
+
+        Args:
+            options: The options the filesystem is created with. Together with
+                the adapter type, they identify the filesystem in the pool.
+            create: A callable that creates the filesystem.
         """
-        protocol = self._infer_protocol(url)
+        key = (type(self), options)
+        try:
+            with _filesystem_pool_lock:
+                fs = _filesystem_pool.get(key)
+                if fs is not None:
+                    _filesystem_pool.move_to_end(key)
+                    return fs
+        except TypeError:
+            # The options are not hashable; don't pool the filesystem
+            return create()
 
-        if no_cache:
-            return fsspec.filesystem(protocol)
+        fs = create()
+        with _filesystem_pool_lock:
+            fs = _filesystem_pool.setdefault(key, fs)
+            _filesystem_pool.move_to_end(key)
+            while len(_filesystem_pool) > FILESYSTEM_POOL_SIZE:
+                _filesystem_pool.popitem(last=False)
+        return fs
 
-        return fsspec.filesystem(
-            "simplecache",
-            target_protocol=protocol,
-            cache_storage=get_config("cache"),
+    def _get_filesystem(self, url: str) -> fsspec.AbstractFileSystem:
+        """
+        Get the appropriate fsspec filesystem for the given URL.
+        """
+        protocol = self._infer_protocol(url)
+        return self._get_pooled_filesystem(
+            protocol, lambda: fsspec.filesystem(protocol)
         )
 
     def _detect_compression(self, url: str) -> Optional[str]:
@@ -62,20 +153,46 @@ class FSSpecAdapter(Adapter, ABC):
         Check if the adapter can handle the URL.
         """
 
-    def read_to_stream(self, url: str, output: BinaryIO):
+    def open(self, url: str) -> BinaryIO:
         """
-        Reads content from the given URL and writes it to the provided binary stream.
-        Uses caching for remote files.
+        Opens a binary stream to the given URL.
+
+        Remote files are downloaded to the cache first and read from disk,
+        unless the cache is disabled. Compressed files are decompressed while
+        they are read.
         """
         fs = self._get_filesystem(url)
         compression = self._detect_compression(url)
+        cache = get_cache() if self.cache_downloads else None
+
+        def fetch(output: BinaryIO):
+            with fs.open(url, "rb") as remote_file:
+                shutil.copyfileobj(remote_file, output)
 
         try:
-            with fs.open(url, "rb", compression=compression) as source_file:
-                output.write(source_file.read())
+            if cache is None:
+                source_file = fs.open(url, "rb")
+            else:
+                source_file = cache.open(url, fetch)
         except FileNotFoundError as e:
             raise InputNotFoundError(f"Input file not found: {url}") from e
 
+        if compression is None:
+            return source_file
+        try:
+            return DecompressedFile(source_file, compression)
+        except Exception:
+            source_file.close()
+            raise
+
+    def read_to_stream(self, url: str, output: BinaryIO):
+        """
+        Reads content from the given URL and writes it to the provided binary stream.
+        Uses the cache for remote files.
+        """
+        with self.open(url) as source_file:
+            shutil.copyfileobj(source_file, output)
+
     def list_directory(self, url: str, recursive: bool = True) -> List[str]:
         """
         Lists the contents of a directory.
@@ -30,12 +30,12 @@ def check_requests_patch():
 
 
 class HTTPAdapter(FSSpecAdapter):
+    cache_downloads = True
+
     def supports(self, url: str) -> bool:
         return url.startswith("http://") or url.startswith("https://")
 
-    def _get_filesystem(
-        self, url: str, no_cache: bool = False
-    ) -> fsspec.AbstractFileSystem:
+    def _get_filesystem(self, url: str) -> fsspec.AbstractFileSystem:
         try:
             import aiohttp
         except ImportError:
@@ -48,23 +48,15 @@ class HTTPAdapter(FSSpecAdapter):
 
         basic_authentication = get_config("adapters.http.basic_authentication")
 
-        client_kwargs = {}
         if basic_authentication:
-            client_kwargs["auth"] = aiohttp.BasicAuth(*basic_authentication)
-
-        if no_cache:
+            basic_authentication = tuple(basic_authentication)
+
+        def create():
+            client_kwargs = {}
+            if basic_authentication:
+                client_kwargs["auth"] = aiohttp.BasicAuth(
+                    *basic_authentication
+                )
             return fsspec.filesystem("http", client_kwargs=client_kwargs)
-        else:
-            return fsspec.filesystem(
-                "simplecache",
-                target_protocol="http",
-                target_options={"client_kwargs": client_kwargs},
-                cache_storage=get_config("cache"),
-            )
 
-    def is_directory(self, url: str) -> bool:
-        """
-        Check if the given URL points to a directory.
-        """
-        fs = self._get_filesystem(url, no_cache=True)
-        return fs.isdir(url)
+        return self._get_pooled_filesystem(basic_authentication, create)
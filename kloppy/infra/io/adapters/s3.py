@@ -7,12 +7,12 @@ from .fsspec import FSSpecAdapter
 
 
 class S3Adapter(FSSpecAdapter):
+    cache_downloads = True
+
     def supports(self, url: str) -> bool:
         return url.startswith("s3://")
 
-    def _get_filesystem(
-        self, url: str, no_cache: bool = False
-    ) -> fsspec.AbstractFileSystem:
+    def _get_filesystem(self, url: str) -> fsspec.AbstractFileSystem:
         try:
             import s3fs
         except ImportError:
@@ -21,12 +21,7 @@ class S3Adapter(FSSpecAdapter):
                 " install it using: pip install s3fs"
             )
 
-        s3_fs = get_config("adapters.s3.s3fs") or s3fs.S3FileSystem()
-
-        if no_cache:
-            return s3_fs
-        return fsspec.filesystem(
-            "simplecache",
-            fs=s3_fs,
-            cache_storage=get_config("cache"),
-        )
+        configured_fs = get_config("adapters.s3.s3fs")
+        if configured_fs is not None:
+            return configured_fs
+        return self._get_pooled_filesystem(None, s3fs.S3FileSystem)
@@ -18,18 +18,22 @@ class ZipAdapter(FSSpecAdapter):
     def supports(self, url: str) -> bool:
         return url.startswith("zip://")
 
-    def _get_filesystem(
-        self, url: str, no_cache: bool = False
-    ) -> fsspec.AbstractFileSystem:
+    def _get_filesystem(self, url: str) -> fsspec.AbstractFileSystem:
         fo = get_config("adapters.zip.fo")
         if fo is None:
             raise AdapterError(
                 "No zip archive provided for the zip adapter."
                 " Please provide one using the 'adapters.zip.fo' config."
             )
-        return fsspec.filesystem(
-            protocol="zip",
-            fo=fo,
+        # The pool keeps the filesystem of the archive alive, which matters
+        # because the archive is closed when the filesystem is deleted and
+        # that would break streams opened on it.
+        return self._get_pooled_filesystem(
+            fo,
+            lambda: fsspec.filesystem(
+                protocol="zip",
+                fo=fo,
+            ),
         )
 
     def list_directory(self, url: str, recursive: bool = True) -> List[str]:
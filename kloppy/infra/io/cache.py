@@ -0,0 +1,513 @@
+"""A size-bounded cache for files downloaded by the remote adapters.
+
+Downloaded files are stored in the configured `cache` directory, next to a
+SQLite index with the size, modification time, content hash and last
+access time of each file. A cached file is only used when its size matches
+the index. When its modification time changed, its content hash is
+verified first. When the `cache.max_size` config is set, the least
+recently used files are evicted once the cache grows beyond that size.
+
+Files are written to a temporary file first and moved into place when the
+download is complete, and all changes to the index are done in a
+transaction. This makes it safe to share one cache directory between
+concurrent processes on the same machine.
+
+Example:
+
+    >>> from kloppy.io import cache
+    >>> cache.stats().hit_rate
+    >>> cache.prune(max_size=10 * 1024**3)
+"""
+
+import contextlib
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, Optional, Set
+
+from kloppy.config import get_config
+from kloppy.exceptions import KloppyError
+
+INDEX_FILENAME = "kloppy_cache.db"
+TEMP_PREFIX = ".tmp-"
+
+# Temporary files older than this are left behind by interrupted downloads
+STALE_TEMP_AGE = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# The index files of which the schema was created by this process
+_initialized_indexes: Set[str] = set()
+_initialize_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Statistics of the download cache.
+
+    Attributes:
+        directory: The directory of the cache.
+        entries: The number of cached files.
+        size: The total size of the cached files in bytes.
+        max_size: The maximum size of the cache in bytes, or None if the
+            size is not bounded.
+        hits: The number of times a file was read from the cache.
+        misses: The number of times a file had to be downloaded.
+        bytes_saved: The number of bytes that were read from the cache
+            instead of being downloaded.
+    """
+
+    directory: str
+    entries: int
+    size: int
+    max_size: Optional[int]
+    hits: int
+    misses: int
+    bytes_saved: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of reads that were served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _HashingWriter:
+    """Computes the hash and size of the data written to a file."""
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.hash.update(data)
+        self.size += len(data)
+        return self._fp.write(data)
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as fp:
+        return _hash_stream(fp)
+
+
+def _hash_stream(fp: BinaryIO) -> str:
+    content_hash = hashlib.sha256()
+    for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+        content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def _remove(path: str) -> bool:
+    """Remove a file, returning whether it is gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        # The file is in use (Windows); leave it for a later prune
+        return False
+    return True
+
+
+class DownloadCache:
+    """A size-bounded LRU cache of downloaded files.
+
+    Args:
+        directory: The directory in which the files are stored.
+        max_size: The maximum total size of the cached files in bytes. If
+            None, the size of the cache is not bounded.
+    """
+
+    def __init__(self, directory: str, max_size: Optional[int] = None):
+        self.directory = directory
+        self.max_size = max_size
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        index_path = os.path.join(self.directory, INDEX_FILENAME)
+        # The schema is created once per index, or again when the cache
+        # directory was removed in the meantime
+        initialize = index_path not in _initialized_indexes or (
+            not os.path.exists(index_path)
+        )
+        if initialize:
+            os.makedirs(self.directory, exist_ok=True)
+        conn = sqlite3.connect(index_path, timeout=60, isolation_level=None)
+        try:
+            if initialize:
+                with _initialize_lock:
+                    conn.executescript(_SCHEMA)
+                    self._migrate(conn)
+                    _initialized_indexes.add(index_path)
+            yield conn
+        finally:
+            conn.close()
+
+    @classmethod
+    def _migrate(cls, conn: sqlite3.Connection):
+        with cls._transaction(conn):
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(entries)")
+            }
+            if "mtime_ns" not in columns:
+                # An unknown modification time makes the next hit verify
+                # the content hash
+                conn.execute(
+                    "ALTER TABLE entries"
+                    " ADD COLUMN mtime_ns INTEGER NOT NULL DEFAULT 0"
+                )
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+        # Take the write lock up front, so that concurrent processes can not
+        # interleave their reads and writes of the index
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _increment(conn: sqlite3.Connection, name: str, value: int):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            (name, value),
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def open(self, url: str, fetch: Callable[[BinaryIO], None]) -> BinaryIO:
+        """Open the cached file of an URL, downloading it on a cache miss.
+
+        Args:
+            url: The URL of the file.
+            fetch: A callable that writes the content of the file to the
+                binary stream it is given. It is only called on a miss.
+
+        Returns:
+            BinaryIO: A binary stream to the cached file.
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        path = self._path(key)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, sha256 FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                size, mtime_ns, sha256 = row
+                fp = self._open_entry(path, size, mtime_ns, sha256)
+                if fp is not None:
+                    try:
+                        with self._transaction(conn):
+                            conn.execute(
+                                "UPDATE entries SET last_access = ?,"
+                                " mtime_ns = ? WHERE key = ?",
+                                (
+                                    time.time(),
+                                    os.fstat(fp.fileno()).st_mtime_ns,
+                                    key,
+                                ),
+                            )
+                            self._increment(conn, "hits", 1)
+                            self._increment(conn, "bytes_saved", size)
+                    except BaseException:
+                        fp.close()
+                        raise
+                    return fp
+
+            fp = self._download(conn, key, url, fetch)
+            try:
+                self._evict(conn, self.max_size, keep=key)
+            except BaseException:
+                fp.close()
+                raise
+            return fp
+
+    @staticmethod
+    def _open_entry(
+        path: str, size: int, mtime_ns: int, sha256: str
+    ) -> Optional[BinaryIO]:
+        """Open a cached file, or return None when it is not valid."""
+        try:
+            fp = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            stat = os.fstat(fp.fileno())
+            if stat.st_size != size:
+                # The file was modified outside of the cache
+                fp.close()
+                return None
+            if stat.st_mtime_ns != mtime_ns:
+                # The file was touched outside of the cache, so verify
+                # that its content did not change
+                valid = _hash_stream(fp) == sha256
+                fp.seek(0)
+                if not valid:
+                    fp.close()
+                    return None
+        except BaseException:
+            fp.close()
+            raise
+        return fp
+
+    def _download(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        url: str,
+        fetch: Callable[[BinaryIO], None],
+    ) -> BinaryIO:
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=TEMP_PREFIX
+        )
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                writer = _HashingWriter(temp_file)
+                fetch(writer)  # type: ignore
+
+            # Keep a handle on the file, so that it can be read even if it
+            # is evicted by another process right after it was moved
+            fp = open(temp_path, "rb")
+            try:
+                os.replace(temp_path, self._path(key))
+                mtime_ns = os.fstat(fp.fileno()).st_mtime_ns
+            except BaseException:
+                fp.close()
+                raise
+        except BaseException:
+            _remove(temp_path)
+            raise
+
+        now = time.time()
+        try:
+            with self._transaction(conn):
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries"
+                    " (key, url, size, mtime_ns, sha256, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        url,
+                        writer.size,
+                        mtime_ns,
+                        writer.hash.hexdigest(),
+                        now,
+                        now,
+                    ),
+                )
+                self._increment(conn, "misses", 1)
+        except BaseException:
+            fp.close()
+            raise
+        return fp
+
+    def _evict(
+        self,
+        conn: sqlite3.Connection,
+        max_size: Optional[int],
+        keep: Optional[str] = None,
+    ) -> int:
+        """Remove the least recently used files until the cache fits."""
+        if max_size is None:
+            return 0
+
+        removed = 0
+        with self._transaction(conn):
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            if total <= max_size:
+                return 0
+
+            rows = conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access"
+            ).fetchall()
+            for key, size in rows:
+                if total <= max_size:
+                    break
+                if key == keep or not _remove(self._path(key)):
+                    continue
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                removed += size
+        return removed
+
+    def prune(
+        self, max_size: Optional[int] = None, verify: bool = False
+    ) -> int:
+        """Remove invalid and least recently used files from the cache.
+
+        Entries of which the file is missing or was modified are removed
+        from the index. The content hash of a file is verified when its
+        modification time changed. Temporary files of interrupted downloads
+        are removed too. Next, the least recently used files are removed
+        until the cache fits in `max_size`.
+
+        Args:
+            max_size: The maximum size of the cache in bytes. Defaults to
+                the maximum size of the cache.
+            verify: Whether to verify the content hash of each file. This
+                reads all cached files.
+
+        Returns:
+            int: The number of bytes that were removed.
+        """
+        removed = 0
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, size, mtime_ns, sha256 FROM entries"
+            )
+            for key, size, mtime_ns, sha256 in rows.fetchall():
+                path = self._path(key)
+                try:
+                    stat = os.stat(path)
+                    valid = stat.st_size == size and (
+                        (stat.st_mtime_ns == mtime_ns and not verify)
+                        or _hash_file(path) == sha256
+                    )
+                except FileNotFoundError:
+                    valid = False
+                if not valid:
+                    with self._transaction(conn):
+                        conn.execute(
+                            "DELETE FROM entries WHERE key = ?", (key,)
+                        )
+                    _remove(path)
+                    removed += size
+
+            for entry in os.scandir(self.directory):
+                if (
+                    entry.name.startswith(TEMP_PREFIX)
+                    and entry.is_file()
+                    and time.time() - entry.stat().st_mtime > STALE_TEMP_AGE
+                    and _remove(entry.path)
+                ):
+                    removed += entry.stat().st_size
+
+            removed += self._evict(
+                conn, self.max_size if max_size is None else max_size
+            )
+        return removed
+
+    def clear(self):
+        """Remove all files from the cache and reset the statistics."""
+        with self._connect() as conn:
+            with self._transaction(conn):
+                keys = conn.execute("SELECT key FROM entries").fetchall()
+                for (key,) in keys:
+                    if _remove(self._path(key)):
+                        conn.execute(
+                            "DELETE FROM entries WHERE key = ?", (key,)
+                        )
+                conn.execute("DELETE FROM counters")
+
+    def stats(self) -> CacheStats:
+        """Get the statistics of the cache."""
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(
+                conn.execute("SELECT name, value FROM counters").fetchall()
+            )
+        return CacheStats(
+            directory=self.directory,
+            entries=entries,
+            size=size,
+            max_size=self.max_size,
+            hits=counters.get("hits", 0),
+            misses=counters.get("misses", 0),
+            bytes_saved=counters.get("bytes_saved", 0),
+        )
+
+
+def _get_max_size() -> Optional[int]:
+    max_size = get_config("cache.max_size")
+    if max_size is None or isinstance(max_size, int):
+        return max_size
+    # Set from the KLOPPY_CACHE_MAX_SIZE environment variable
+    try:
+        return int(max_size)
+    except ValueError:
+        raise KloppyError(
+            f"Invalid cache size {max_size!r}. The 'cache.max_size' config"
+            " and the KLOPPY_CACHE_MAX_SIZE environment variable should be"
+            " a number of bytes."
+        )
+
+
+def get_cache() -> Optional[DownloadCache]:
+    """Get the download cache, or None if the cache is disabled.
+
+    The cache is configured with the `cache` and `cache.max_size` config.
+    """
+    directory = get_config("cache")
+    if not directory:
+        return None
+    return DownloadCache(os.fspath(directory), max_size=_get_max_size())
+
+
+def _require_cache() -> DownloadCache:
+    cache = get_cache()
+    if cache is None:
+        raise KloppyError(
+            "The cache is disabled. Please set a cache directory using the"
+            " 'cache' config."
+        )
+    return cache
+
+
+def prune(max_size: Optional[int] = None, verify: bool = False) -> int:
+    """Remove invalid and least recently used files from the cache.
+
+    See [`DownloadCache.prune`][kloppy.infra.io.cache.DownloadCache.prune].
+    """
+    return _require_cache().prune(max_size=max_size, verify=verify)
+
+
+def stats() -> CacheStats:
+    """Get the statistics of the cache, such as the hit rate."""
+    return _require_cache().stats()
+
+
+def clear():
+    """Remove all files from the cache."""
+    _require_cache().clear()
+
+
+__all__ = [
+    "CacheStats",
+    "DownloadCache",
+    "get_cache",
+    "prune",
+    "stats",
+    "clear",
+]
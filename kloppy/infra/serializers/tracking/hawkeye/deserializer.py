@@ -1,4 +1,5 @@
 import json
+from contextlib import closing
 import logging
 from datetime import datetime, timedelta, timezone
 from dateutil.parser import parse
@@ -17,7 +18,7 @@ from typing import (
     Iterable,
     Callable,
 )
-from itertools import zip_longest
+from itertools import chain, zip_longest
 
 from kloppy.domain import (
     AttackingDirection,
@@ -36,7 +37,12 @@ from kloppy.domain import (
     attacking_direction_from_frame,
 )
 from kloppy.utils import performance_logging
-from kloppy.io import FileLike, open_as_file, get_file_extension
+from kloppy.io import (
+    FileLike,
+    get_file_extension,
+    open_as_file,
+    prefetch_inputs,
+)
 from kloppy.exceptions import DeserializationError
 
 from ..deserializer import TrackingDataDeserializer
@@ -255,6 +261,8 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
         frame_rate = None
 
         it = list(zip_longest(inputs.ball_feeds, inputs.player_centroid_feeds))
+        # The next feeds are opened while the current ones are parsed
+        opened_feeds = prefetch_inputs(chain.from_iterable(it))
         if inputs.show_progress:
             if tqdm is None:
                 warnings.warn(
@@ -263,144 +271,151 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
             else:
                 it = tqdm.tqdm(it)
 
-        for ball_feed, player_centroid_feed in it:
-            # Read the ball and player tracking data feeds.
-            with open_as_file(ball_feed) as ball_data_fp:
-                ball_tracking_data = json.load(ball_data_fp)
-            with open_as_file(player_centroid_feed) as player_centroid_data_fp:
-                player_tracking_data = json.load(player_centroid_data_fp)
+        with closing(opened_feeds):
+            for ball_feed, player_centroid_feed in it:
+                # Read the ball and player tracking data feeds.
+                with next(opened_feeds) as ball_data_fp:
+                    ball_tracking_data = json.load(ball_data_fp)
+                with next(opened_feeds) as player_centroid_data_fp:
+                    player_tracking_data = json.load(player_centroid_data_fp)
+
+                self.object_id = (
+                    HawkEyeObjectIdentifier.get_identifier_variable(
+                        player_tracking_data
+                    )
+                )
 
-            self.object_id = HawkEyeObjectIdentifier.get_identifier_variable(
-                player_tracking_data
-            )
+                if frame_rate is None:
+                    frame_rate = self.__infer_frame_rate(ball_tracking_data)
 
-            if frame_rate is None:
-                frame_rate = self.__infer_frame_rate(ball_tracking_data)
-
-            if not self._game_id:
-                self._game_id = ball_tracking_data["details"]["match"]["id"][
-                    self.object_id
-                ]
-
-            # Parse the teams, players and periods. A value can be added by
-            # later feeds, but we will not overwrite existing values.
-            with performance_logging("Parsing meta data", logger=logger):
-                parsed_teams = {
-                    **self.__parse_teams(
-                        ball_tracking_data["details"]["teams"]
-                    ),
-                    **parsed_teams,
-                }
-                parsed_players = {
-                    **self.__parse_players(
-                        player_tracking_data["details"]["players"],
-                        parsed_teams,
-                    ),
-                    **parsed_players,
-                }
-                parsed_periods = {
-                    **self.__parse_periods(ball_tracking_data["segments"]),
-                    **parsed_periods,
-                }
-
-            # Parse the ball tracking data
-            period_id = ball_tracking_data["sequences"]["segment"]
-            minute = ball_tracking_data["sequences"]["match-minute"] - 1
-
-            period_minute = (
-                minute
-                if period_id == 1
-                else (minute - 45)
-                if period_id == 2
-                else (minute - 90)
-                if period_id == 3
-                else (minute - 105)
-                if period_id == 4
-                else (minute - 120)
-            )
+                if not self._game_id:
+                    self._game_id = ball_tracking_data["details"]["match"][
+                        "id"
+                    ][self.object_id]
 
-            with performance_logging(
-                "Parsing ball tracking data", logger=logger
-            ):
-                for detection in ball_tracking_data["samples"]["ball"]:
-                    frame_id = int(
-                        (minute * 60 + float(detection["time"])) * frame_rate
-                    )
-                    parsed_frames[frame_id] = Frame(
-                        frame_id=frame_id,
-                        timestamp=timedelta(
-                            minutes=period_minute, seconds=detection["time"]
+                # Parse the teams, players and periods. A value can be added by
+                # later feeds, but we will not overwrite existing values.
+                with performance_logging("Parsing meta data", logger=logger):
+                    parsed_teams = {
+                        **self.__parse_teams(
+                            ball_tracking_data["details"]["teams"]
                         ),
-                        ball_coordinates=Point3D(
-                            x=detection["pos"][0],
-                            y=detection["pos"][1],
-                            z=detection["pos"][2],
+                        **parsed_teams,
+                    }
+                    parsed_players = {
+                        **self.__parse_players(
+                            player_tracking_data["details"]["players"],
+                            parsed_teams,
                         ),
-                        ball_speed=detection["speed"]["mps"],
-                        ball_state=None,
-                        ball_owning_team=None,
-                        players_data={},
-                        period=parsed_periods[period_id],
-                        other_data={},
-                        statistics=[],
-                    )
-
-            # Parse the player tracking data
-            _period_id = player_tracking_data["sequences"]["segment"]
-            _minute = player_tracking_data["sequences"]["match-minute"] - 1
-
-            if _period_id != period_id or _minute != minute:
-                raise DeserializationError(
-                    "The feed for ball tracking and player tracking are not in sync"
+                        **parsed_players,
+                    }
+                    parsed_periods = {
+                        **self.__parse_periods(ball_tracking_data["segments"]),
+                        **parsed_periods,
+                    }
+
+                # Parse the ball tracking data
+                period_id = ball_tracking_data["sequences"]["segment"]
+                minute = ball_tracking_data["sequences"]["match-minute"] - 1
+
+                period_minute = (
+                    minute
+                    if period_id == 1
+                    else (minute - 45)
+                    if period_id == 2
+                    else (minute - 90)
+                    if period_id == 3
+                    else (minute - 105)
+                    if period_id == 4
+                    else (minute - 120)
                 )
-            with performance_logging(
-                "Parsing player tracking data", logger=logger
-            ):
-                for detection in player_tracking_data["samples"]["people"]:
-                    if detection["role"]["name"] not in [
-                        "Outfielder",
-                        "Goalkeeper",
-                    ]:
-                        continue
-                    player = parsed_players[
-                        detection["personId"][self.object_id]
-                    ]
-                    for centroid in detection["centroid"]:
+
+                with performance_logging(
+                    "Parsing ball tracking data", logger=logger
+                ):
+                    for detection in ball_tracking_data["samples"]["ball"]:
                         frame_id = int(
-                            (minute * 60 + centroid["time"]) * frame_rate
+                            (minute * 60 + float(detection["time"]))
+                            * frame_rate
                         )
-                        player_data = PlayerData(
-                            coordinates=Point(
-                                x=centroid["pos"][0],
-                                y=centroid["pos"][1],
+                        parsed_frames[frame_id] = Frame(
+                            frame_id=frame_id,
+                            timestamp=timedelta(
+                                minutes=period_minute,
+                                seconds=detection["time"],
                             ),
-                            distance=centroid["distance"]["metres"],
-                            speed=centroid["speed"]["mps"],
+                            ball_coordinates=Point3D(
+                                x=detection["pos"][0],
+                                y=detection["pos"][1],
+                                z=detection["pos"][2],
+                            ),
+                            ball_speed=detection["speed"]["mps"],
+                            ball_state=None,
+                            ball_owning_team=None,
+                            players_data={},
+                            period=parsed_periods[period_id],
+                            other_data={},
+                            statistics=[],
                         )
-                        if frame_id in parsed_frames:
-                            parsed_frames[frame_id].players_data[
-                                player
-                            ] = player_data
-                        else:
-                            parsed_frames[frame_id] = Frame(
-                                frame_id=frame_id,
-                                timestamp=timedelta(
-                                    minutes=period_minute,
-                                    seconds=centroid["time"],
-                                ),
-                                ball_coordinates=Point3D(
-                                    float("nan"), float("nan"), float("nan")
+
+                # Parse the player tracking data
+                _period_id = player_tracking_data["sequences"]["segment"]
+                _minute = player_tracking_data["sequences"]["match-minute"] - 1
+
+                if _period_id != period_id or _minute != minute:
+                    raise DeserializationError(
+                        "The feed for ball tracking and player tracking are not in sync"
+                    )
+                with performance_logging(
+                    "Parsing player tracking data", logger=logger
+                ):
+                    for detection in player_tracking_data["samples"]["people"]:
+                        if detection["role"]["name"] not in [
+                            "Outfielder",
+                            "Goalkeeper",
+                        ]:
+                            continue
+                        player = parsed_players[
+                            detection["personId"][self.object_id]
+                        ]
+                        for centroid in detection["centroid"]:
+                            frame_id = int(
+                                (minute * 60 + centroid["time"]) * frame_rate
+                            )
+                            player_data = PlayerData(
+                                coordinates=Point(
+                                    x=centroid["pos"][0],
+                                    y=centroid["pos"][1],
                                 ),
-                                ball_state=None,
-                                ball_owning_team=None,
-                                players_data={player: player_data},
-                                period=parsed_periods[period_id],
-                                other_data={},
-                                statistics=[],
+                                distance=centroid["distance"]["metres"],
+                                speed=centroid["speed"]["mps"],
                             )
-
-            if self.limit and len(parsed_frames) >= self.limit:
-                break
+                            if frame_id in parsed_frames:
+                                parsed_frames[frame_id].players_data[
+                                    player
+                                ] = player_data
+                            else:
+                                parsed_frames[frame_id] = Frame(
+                                    frame_id=frame_id,
+                                    timestamp=timedelta(
+                                        minutes=period_minute,
+                                        seconds=centroid["time"],
+                                    ),
+                                    ball_coordinates=Point3D(
+                                        float("nan"),
+                                        float("nan"),
+                                        float("nan"),
+                                    ),
+                                    ball_state=None,
+                                    ball_owning_team=None,
+                                    players_data={player: player_data},
+                                    period=parsed_periods[period_id],
+                                    other_data={},
+                                    statistics=[],
+                                )
+
+                if self.limit and len(parsed_frames) >= self.limit:
+                    break
 
         # Convert the parsed frames to a list
         frame_ts = sorted(parsed_frames.keys())
@@ -408,12 +423,13 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
         sample = 1.0 / self.sample_rate
         for i, ts in enumerate(frame_ts):
             if ts % sample == 0:
-                frame = transformer.transform_frame(parsed_frames[ts])
-                frames.append(frame)
+                frames.append(parsed_frames[ts])
 
                 if self.limit and i * (self.sample_rate) + 1 >= self.limit:
                     break
 
+        frames = transformer.transform_frames(frames, inplace=True)
+
         # Add player list to teams
         for team in parsed_teams.values():
             for player in parsed_players.values():
@@ -204,8 +204,6 @@ class MetricaCSVTrackingDataDeserializer(
                     other_data={},
                 )
 
-                frame = transformer.transform_frame(frame)
-
                 frames.append(frame)
 
                 if not periods or period.id != periods[-1].id:
@@ -218,6 +216,8 @@ class MetricaCSVTrackingDataDeserializer(
                 if self.limit and n + 1 >= (self.limit / self.sample_rate):
                     break
 
+        frames = transformer.transform_frames(frames, inplace=True)
+
         try:
             first_frame = next(
                 frame for frame in frames if frame.period.id == 1
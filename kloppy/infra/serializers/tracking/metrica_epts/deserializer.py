@@ -9,7 +9,6 @@ from kloppy.domain import (
     Point3D,
     Provider,
     PlayerData,
-    DatasetTransformer,
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.utils import performance_logging
@@ -34,9 +33,7 @@ class MetricaEPTSTrackingDataDeserializer(
         return Provider.METRICA
 
     @staticmethod
-    def _frame_from_row(
-        row: dict, metadata: EPTSMetadata, transformer: DatasetTransformer
-    ) -> Frame:
+    def _frame_from_row(row: dict, metadata: EPTSMetadata) -> Frame:
         timestamp = row["timestamp"]
         if metadata.periods and row["period_id"]:
             # might want to search for it instead
@@ -93,9 +90,6 @@ class MetricaEPTSTrackingDataDeserializer(
             ),
         )
 
-        if transformer:
-            frame = transformer.transform_frame(frame)
-
         return frame
 
     def deserialize(
@@ -115,7 +109,7 @@ class MetricaEPTSTrackingDataDeserializer(
         with performance_logging("Loading data", logger=logger):
             # assume they are sorted
             frames = [
-                self._frame_from_row(row, metadata, transformer)
+                self._frame_from_row(row, metadata)
                 for row in read_raw_data(
                     raw_data=inputs.raw_data,
                     metadata=metadata,
@@ -127,6 +121,9 @@ class MetricaEPTSTrackingDataDeserializer(
                 )
             ]
 
+            if transformer:
+                frames = transformer.transform_frames(frames, inplace=True)
+
         if transformer:
             metadata = replace(
                 metadata,
@@ -2,6 +2,8 @@ import re
 from datetime import timedelta
 from typing import IO, Iterator, List
 
+from kloppy.io import iter_lines
+
 from .models import (
     DataFormatSpecification,
     EPTSMetadata,
@@ -80,7 +82,7 @@ def read_raw_data(
     n = 0
     sample = 1.0 / sample_rate
 
-    for i, line in enumerate(raw_data):
+    for i, line in enumerate(iter_lines(raw_data)):
         if i % sample != 0:
             continue
 
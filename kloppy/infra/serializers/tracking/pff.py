@@ -362,15 +362,13 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
         n_frames = 0
 
         for _frame, _frame_period in _iter():
-            # Create and transform Frame object
-            frame = transformer.transform_frame(
-                self._get_frame_data(
-                    players,
-                    periods,
-                    self._ball_owning_team,
-                    self._ball_state,
-                    _frame,
-                )
+            # Create Frame object
+            frame = self._get_frame_data(
+                players,
+                periods,
+                self._ball_owning_team,
+                self._ball_state,
+                _frame,
             )
 
             # if Regular Time
@@ -386,6 +384,9 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
             if self.limit and n_frames >= self.limit:
                 break
 
+        frames = transformer.transform_frames(frames, inplace=True)
+        et_frames = transformer.transform_frames(et_frames, inplace=True)
+
         first_frame_p1 = next(
             frame for frame in frames if frame.period.id == 1
         )
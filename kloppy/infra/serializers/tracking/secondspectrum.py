@@ -27,6 +27,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 
+from kloppy.io import iter_lines
 from kloppy.utils import Readable, performance_logging
 
 from .deserializer import TrackingDataDeserializer
@@ -279,7 +280,7 @@ class SecondSpectrumDeserializer(
                 n = 0
                 sample = 1 / self.sample_rate
 
-                for line_ in inputs.raw_data.readlines():
+                for line_ in iter_lines(inputs.raw_data):
                     line_ = line_.strip().decode("ascii")
                     if not line_:
                         continue
@@ -301,7 +302,6 @@ class SecondSpectrumDeserializer(
                 period = periods[frame_data["period"] - 1]
 
                 frame = self._frame_from_framedata(teams, period, frame_data)
-                frame = transformer.transform_frame(frame)
                 frames.append(frame)
 
                 n_frames += 1
@@ -309,6 +309,8 @@ class SecondSpectrumDeserializer(
                 if self.limit and n_frames >= self.limit:
                     break
 
+            frames = transformer.transform_frames(frames, inplace=True)
+
         try:
             first_frame = next(
                 frame for frame in frames if frame.period.id == 1
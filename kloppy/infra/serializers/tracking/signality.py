@@ -1,4 +1,5 @@
 import logging
+from contextlib import closing
 from datetime import timedelta, datetime, timezone
 import warnings
 from typing import List, Dict, NamedTuple, IO, Optional, Union, Iterable
@@ -25,7 +26,7 @@ from kloppy.domain.services.frame_factory import create_frame
 from kloppy.infra.serializers.tracking.deserializer import (
     TrackingDataDeserializer,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, prefetch_inputs
 from kloppy.utils import performance_logging
 
 logger = logging.getLogger(__name__)
@@ -209,22 +210,23 @@ class SignalityDeserializer(TrackingDataDeserializer[SignalityInputs]):
                     if frame.players_data and frame.timestamp > timedelta(
                         seconds=0
                     ):
-                        frame = transformer.transform_frame(frame)
                         frames.append(frame)
                 n += 1
                 if self.limit and n >= self.limit:
-                    return frames
+                    return transformer.transform_frames(frames, inplace=True)
 
-        return frames
+        return transformer.transform_frames(frames, inplace=True)
 
     def deserialize(self, inputs: SignalityInputs) -> TrackingDataset:
         metadata = json.load(inputs.meta_data)
         venue_information = json.load(inputs.venue_information)
         raw_data_feeds = []
-        for input_raw_data_feed in inputs.raw_data_feeds:
-            with open_as_file(input_raw_data_feed) as raw_data_feed_fp:
-                raw_data_feed = json.load(raw_data_feed_fp)
-                raw_data_feeds.append(raw_data_feed)
+        opened_feeds = prefetch_inputs(inputs.raw_data_feeds)
+        with closing(opened_feeds):
+            for input_raw_data_feed in opened_feeds:
+                with input_raw_data_feed as raw_data_feed_fp:
+                    raw_data_feed = json.load(raw_data_feed_fp)
+                    raw_data_feeds.append(raw_data_feed)
         p1_raw_data = raw_data_feeds[0]
 
         with performance_logging("Loading metadata", logger=logger):
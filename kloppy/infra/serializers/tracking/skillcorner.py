@@ -559,7 +559,6 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
                 )
                 if frame is None:
                     continue
-                frame = transformer.transform_frame(frame)
 
                 frames.append(frame)
                 n_frames += 1
@@ -569,6 +568,8 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
                 ):
                     break
 
+        frames = transformer.transform_frames(frames, inplace=True)
+
         attacking_directions = attacking_directions_from_multi_frames(
             frames, list(periods.values())
         )
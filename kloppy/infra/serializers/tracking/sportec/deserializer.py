@@ -427,13 +427,15 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
                             ball_speed=float(ball_data.get("S", 0)),
                             other_data={},
                         )
-                        frames.append(transformer.transform_frame(frame))
+                        frames.append(frame)
                         frame_count += 1
                     except KeyError as e:
                         logger.warning(
                             f"Skipping frame {frame_id} due to missing data: {e}"
                         )
 
+        frames = transformer.transform_frames(frames, inplace=True)
+
         # Determine orientation
         try:
             first_frame = next(
@@ -1,7 +1,9 @@
 import logging
+from collections import Counter
 from datetime import timedelta
+from itertools import islice
 import warnings
-from typing import IO, NamedTuple, Optional, Union
+from typing import IO, Iterable, Iterator, NamedTuple, Optional, Union
 
 
 from kloppy.domain import (
@@ -21,6 +23,7 @@ from kloppy.domain import (
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.domain import PositionType
 from kloppy.exceptions import DeserializationError
+from kloppy.io import iter_lines
 from kloppy.utils import performance_logging
 from kloppy.infra.serializers.event.statsperform.parsers import get_parser
 
@@ -29,6 +32,11 @@ from .deserializer import TrackingDataDeserializer
 logger = logging.getLogger(__name__)
 
 
+def _decode_lines(raw_data: IO[bytes]) -> Iterator[str]:
+    for line in iter_lines(raw_data):
+        yield line.rstrip(b"\r\n").decode("ascii")
+
+
 class StatsPerformInputs(NamedTuple):
     meta_data: IO[bytes]
     raw_data: IO[bytes]
@@ -54,19 +62,18 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         return self._provider
 
     @classmethod
-    def __get_frame_rate(cls, tracking):
+    def __get_frame_rate(cls, tracking: Iterable[str]):
         """Infer the frame rate of the tracking data."""
 
-        frame_numbers = [
-            int(line.split(";")[1].split(",")[0]) for line in tracking[1:]
-        ]
+        deltas = Counter()
+        previous_frame_number = None
+        for line in islice(tracking, 1, None):
+            frame_number = int(line.split(";")[1].split(",")[0])
+            if previous_frame_number is not None:
+                deltas[frame_number - previous_frame_number] += 1
+            previous_frame_number = frame_number
 
-        deltas = [
-            frame_numbers[i + 1] - frame_numbers[i]
-            for i in range(len(frame_numbers) - 1)
-        ]
-
-        most_common_delta = max(set(deltas), key=deltas.count)
+        most_common_delta = max(set(deltas), key=deltas.get)
         frame_rate = 1000 / most_common_delta
 
         return frame_rate
@@ -159,8 +166,17 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             game_id = meta_data_parser.extract_game_id()
 
         with performance_logging("Loading tracking data", logger=logger):
-            tracking_data = inputs.raw_data.read().decode("ascii").splitlines()
-            frame_rate = self.__get_frame_rate(tracking_data)
+            raw_data = inputs.raw_data
+            if raw_data.seekable():
+                # Infer the frame rate in a first pass over the lines, and
+                # parse the frames lazily in a second pass
+                start = raw_data.tell()
+                frame_rate = self.__get_frame_rate(_decode_lines(raw_data))
+                raw_data.seek(start)
+                tracking_data = _decode_lines(raw_data)
+            else:
+                tracking_data = list(_decode_lines(raw_data))
+                frame_rate = self.__get_frame_rate(tracking_data)
 
             transformer = self.get_transformer(
                 pitch_length=inputs.pitch_length,
@@ -186,7 +202,6 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                 frame = self._frame_from_framedata(
                     teams_list, period, frame_data
                 )
-                frame = transformer.transform_frame(frame)
                 if not frame.players_data or (
                     self.only_alive and frame.ball_state == BallState.DEAD
                 ):
@@ -198,6 +213,8 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                 if self.limit and n_frames >= self.limit:
                     break
 
+            frames = transformer.transform_frames(frames, inplace=True)
+
         try:
             first_frame = next(
                 frame for frame in frames if frame.period.id == 1
@@ -67,12 +67,13 @@ class TRACABDeserializer(TrackingDataDeserializer[TRACABInputs]):
                     self.sample_rate, self.only_alive
                 )
             ):
-                frame = transformer.transform_frame(frame)
                 frames.append(frame)
 
                 if self.limit and n + 1 >= (self.limit / self.sample_rate):
                     break
 
+            frames = transformer.transform_frames(frames, inplace=True)
+
         if orientation is None:
             try:
                 first_frame = next(
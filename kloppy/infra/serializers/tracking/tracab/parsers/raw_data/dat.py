@@ -13,6 +13,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.io import iter_lines
 
 from .base import TracabDataParser
 
@@ -25,7 +26,7 @@ class TracabDatParser(TracabDataParser):
         teams: Tuple[Team, Team],
         frame_rate: int,
     ) -> None:
-        self.root = feed.readlines()
+        self.feed = feed
         self.periods = periods
         self.teams = teams
         self.frame_rate = frame_rate
@@ -36,7 +37,7 @@ class TracabDatParser(TracabDataParser):
         n = 0
         sample = 1.0 / sample_rate
 
-        for line in self.root:
+        for line in iter_lines(self.feed):
             line = line.strip().decode("ascii")
             if not line:
                 continue
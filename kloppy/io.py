@@ -2,12 +2,17 @@
 
 import bz2
 import contextlib
+import itertools
 import gzip
 import logging
 import lzma
+import mmap
 import os
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from io import BufferedWriter, BytesIO, TextIOWrapper
 from typing import (
     IO,
@@ -24,7 +29,9 @@ from typing import (
     Union,
 )
 
+from kloppy.config import get_config
 from kloppy.exceptions import AdapterError, InputNotFoundError
+from kloppy.infra.io import cache
 from kloppy.infra.io.adapters import get_adapter
 
 logger = logging.getLogger(__name__)
@@ -358,7 +365,8 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
         [Adapter](`kloppy.io.adapters.Adapter`) class.
 
         If the given file path or URL ends with '.gz', '.xz', or '.bz2', the
-        file will be decompressed before being read.
+        file is decompressed while it is read. Files are streamed instead of
+        being loaded into memory at once.
     """
     if isinstance(input_, Source):
         if input_.data is None and input_.optional:
@@ -390,12 +398,8 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
 
         adapter = get_adapter(uri)
         if adapter:
-            stream = BytesIO()
-            adapter.read_to_stream(uri, stream)
-            stream.seek(0)
-        else:
-            raise AdapterError(f"No adapter found for {uri}")
-        return stream
+            return adapter.open(uri)
+        raise AdapterError(f"No adapter found for {uri}")
 
     if isinstance(input_, TextIOWrapper):
         # If file_or_path is a TextIOWrapper, return its underlying binary buffer
@@ -408,6 +412,137 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
     raise TypeError(f"Unsupported input type: {type(input_)}")
 
 
+def map_file(stream: BinaryIO) -> Optional[mmap.mmap]:
+    """Memory-map the file behind a binary stream.
+
+    A read-only memory map is returned when the stream reads an
+    uncompressed local file. Parsers can scan the map with `bytes.find` or
+    a `memoryview` without copying the file into memory. For all other
+    streams (in-memory buffers, decompressed files, remote files) and for
+    empty files, None is returned.
+
+    Args:
+        stream (BinaryIO): A binary stream, as returned by `open_as_file`.
+
+    Returns:
+        mmap.mmap: A read-only memory map of the whole file, or None. The
+            caller is responsible for closing the map.
+
+    Example:
+
+        >>> with open_as_file("tracking.dat") as f:
+        ...     data = map_file(f)
+        ...     if data is not None:
+        ...         first_line = data[: data.find(b"\\n")]
+    """
+    if isinstance(stream, (gzip.GzipFile, bz2.BZ2File, lzma.LZMAFile)):
+        # The file descriptor of these refers to the compressed file
+        return None
+
+    try:
+        fileno = stream.fileno()
+        if os.fstat(fileno).st_size == 0:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def iter_lines(stream: BinaryIO) -> Iterator[bytes]:
+    """Iterate over the lines of a binary stream.
+
+    Lines are read from the current position of the stream and include
+    the line ending, like iterating over the stream itself. When the
+    stream reads an uncompressed local file, the lines are sliced from a
+    memory map of the file (see `map_file`) instead of going through the
+    buffered reader. Lines are read lazily, so a parser that stops early
+    does not read the remainder of the file.
+
+    Args:
+        stream (BinaryIO): A binary stream, as returned by `open_as_file`.
+
+    Yields:
+        bytes: The lines of the stream.
+    """
+    data = map_file(stream)
+    if data is None:
+        yield from stream
+        return
+
+    try:
+        data.seek(stream.tell())
+        yield from iter(data.readline, b"")
+    finally:
+        if not stream.closed:
+            stream.seek(data.tell())
+        data.close()
+
+
+def prefetch_inputs(
+    inputs: Iterable[FileLike], concurrency: Optional[int] = None
+) -> Iterator[ContextManager[Optional[BinaryIO]]]:
+    """Open multiple inputs concurrently, ahead of their use.
+
+    While an input is being parsed, the next inputs are opened with
+    [`open_as_file`][kloppy.io.open_as_file] on a pool of threads. For
+    remote inputs, this downloads them to the cache, which hides the
+    latency of loading data that is split over many files. The opened
+    inputs are yielded in the same order as the given inputs.
+
+    Args:
+        inputs: The inputs to open, for example as returned by
+            [`expand_inputs`][kloppy.io.expand_inputs].
+        concurrency: The maximum number of inputs that are opened ahead of
+            the input that is being used. Defaults to the
+            `prefetch.concurrency` config. Use 0 to open the inputs one
+            after another.
+
+    Yields:
+        The opened inputs, as returned by `open_as_file`. They should be
+        used as a context manager, which closes the input.
+
+    Example:
+
+        >>> for input_ in prefetch_inputs(expand_inputs("s3://bucket/feeds/")):
+        ...     with input_ as fp:
+        ...         data = json.load(fp)
+    """
+    if concurrency is None:
+        concurrency = get_config("prefetch.concurrency") or 0
+
+    if concurrency <= 0:
+        for input_ in inputs:
+            yield open_as_file(input_)
+        return
+
+    inputs = iter(inputs)
+    pending: "deque[Future]" = deque()
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="kloppy-prefetch"
+    ) as executor:
+        try:
+            for input_ in itertools.islice(inputs, concurrency):
+                pending.append(executor.submit(open_as_file, input_))
+
+            while pending:
+                future = pending.popleft()
+                for input_ in itertools.islice(inputs, 1):
+                    pending.append(executor.submit(open_as_file, input_))
+                yield future.result()
+        finally:
+            # Close the inputs that were opened but will not be used
+            for future in pending:
+                if future.cancel():
+                    continue
+                try:
+                    opened = future.result()
+                except Exception:
+                    continue
+                close = getattr(opened, "close", None)
+                if close is not None:
+                    close()
+
+
 def _natural_sort_key(path: str) -> List[Union[int, str]]:
     # Split string into list of chunks for natural sorting
     return [
@@ -445,17 +580,22 @@ def expand_inputs(
         An iterator over the resolved file paths or stream content.
     """
 
-    def is_file(uri):
+    # Lookups are memoized for the duration of a single call, so that each
+    # path is checked at most once, even when it is listed multiple times.
+    @lru_cache(maxsize=None)
+    def get_uri_adapter(uri):
         adapter = get_adapter(uri)
         if adapter:
-            return adapter.is_file(uri)
+            return adapter
         raise AdapterError(f"No adapter found for {uri}")
 
+    @lru_cache(maxsize=None)
+    def is_file(uri):
+        return get_uri_adapter(uri).is_file(uri)
+
+    @lru_cache(maxsize=None)
     def is_directory(uri):
-        adapter = get_adapter(uri)
-        if adapter:
-            return adapter.is_directory(uri)
-        raise AdapterError(f"No adapter found for {uri}")
+        return get_uri_adapter(uri).is_directory(uri)
 
     def process_expansion(files):
         """
@@ -480,13 +620,9 @@ def expand_inputs(
         uri = _filepath_from_path_or_filelike(inputs)
 
         if is_directory(uri):
-            adapter = get_adapter(uri)
-            if adapter:
-                yield from process_expansion(
-                    adapter.list_directory(uri, recursive=True)
-                )
-            else:
-                raise AdapterError(f"No adapter found for {uri}")
+            yield from process_expansion(
+                get_uri_adapter(uri).list_directory(uri, recursive=True)
+            )
         elif is_file(uri):
             yield uri
         else:
@@ -499,13 +635,11 @@ def expand_inputs(
                 if is_file(uri):
                     yield uri
                 elif is_directory(uri):
-                    adapter = get_adapter(uri)
-                    if adapter:
-                        yield from process_expansion(
-                            adapter.list_directory(uri, recursive=True)
+                    yield from process_expansion(
+                        get_uri_adapter(uri).list_directory(
+                            uri, recursive=True
                         )
-                    else:
-                        raise AdapterError(f"No adapter found for {uri}")
+                    )
                 else:
                     raise InputNotFoundError(f"Invalid path or file: {item}")
             else:
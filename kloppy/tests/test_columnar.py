@@ -0,0 +1,177 @@
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from kloppy import tracab
+from kloppy.domain import (
+    LONG_COLUMNS,
+    BallState,
+    ColumnarFrames,
+    Point,
+    Point3D,
+    TrackingDataset,
+)
+from kloppy.exceptions import KloppyParameterError
+
+
+@pytest.fixture(scope="module")
+def dataset(base_dir: Path) -> TrackingDataset:
+    return tracab.load(
+        meta_data=base_dir / "files/tracab_meta.xml",
+        raw_data=base_dir / "files/tracab_raw.dat",
+        coordinates="tracab",
+        only_alive=False,
+    )
+
+
+class TestColumnarFrames:
+    def test_to_columnar(self, dataset: TrackingDataset):
+        columnar_dataset = dataset.to_columnar()
+
+        assert isinstance(columnar_dataset.records, ColumnarFrames)
+        assert len(columnar_dataset) == len(dataset)
+        assert columnar_dataset.metadata == dataset.metadata
+        assert columnar_dataset.to_columnar() is columnar_dataset
+
+    def test_arrays(self, dataset: TrackingDataset):
+        frames = dataset.to_columnar().frames
+
+        assert frames.frame_id.tolist() == [
+            frame.frame_id for frame in dataset.frames
+        ]
+        assert frames.ball_x[0] == 2710
+        assert frames.ball_y[0] == 3722
+        assert frames.ball_z[0] == 11
+        assert frames.timestamp[0] == 0.0
+        assert frames.periods[frames.period[-1]].id == 2
+        assert frames.player_x.shape == (len(dataset), len(frames.players))
+        assert frames.player_present.sum() == sum(
+            len(frame.players_data) for frame in dataset.frames
+        )
+        assert list(BallState)[frames.ball_state[0]] == dataset[0].ball_state
+
+        # numeric work on the full match can be done on the arrays
+        player_idx = frames.players.index(
+            dataset.metadata.teams[1].get_player_by_jersey_number(9)
+        )
+        assert np.nanmax(frames.player_x[:, player_idx]) == 390
+
+    def test_materialized_frames(self, dataset: TrackingDataset):
+        columnar_dataset = dataset.to_columnar()
+
+        for frame, columnar_frame in zip(dataset, columnar_dataset):
+            assert columnar_frame.frame_id == frame.frame_id
+            assert columnar_frame.period == frame.period
+            assert columnar_frame.timestamp == frame.timestamp
+            assert columnar_frame.ball_state == frame.ball_state
+            assert columnar_frame.ball_owning_team == frame.ball_owning_team
+            assert columnar_frame.ball_coordinates == frame.ball_coordinates
+            assert columnar_frame.players_data == frame.players_data
+
+        frame = columnar_dataset[-1]
+        assert isinstance(frame.timestamp, timedelta)
+        assert frame.dataset is columnar_dataset
+        assert frame.next_record is None
+        assert frame.prev_record.frame_id == dataset[-2].frame_id
+        assert columnar_dataset[0].prev_record is None
+        assert [frame.frame_id for frame in columnar_dataset[1:3]] == [
+            frame.frame_id for frame in dataset[1:3]
+        ]
+
+    def test_missing_values(self, dataset: TrackingDataset):
+        frame = dataset[0]
+        player, player_data = next(iter(frame.players_data.items()))
+        frame = frame.replace(
+            ball_coordinates=Point(x=1, y=2),
+            players_data={
+                player: player_data.__class__(coordinates=None, speed=None)
+            },
+        )
+
+        frames = ColumnarFrames.from_frames([frame])
+        columnar_frame = frames[0]
+
+        assert np.isnan(frames.ball_z[0])
+        assert columnar_frame.ball_coordinates == Point3D(x=1, y=2, z=None)
+        assert columnar_frame.players_data[player].coordinates is None
+        assert columnar_frame.players_data[player].speed is None
+
+    def test_to_df(self, dataset: TrackingDataset):
+        assert dataset.to_columnar().to_df().equals(dataset.to_df())
+
+    @pytest.mark.parametrize("engine", ["pandas", "pandas[pyarrow]", "polars"])
+    def test_to_df_engines(self, dataset: TrackingDataset, engine: str):
+        # the per-frame conversion is used when columns are passed
+        expected = dataset.to_df("*", engine=engine)
+
+        assert dataset.to_df(engine=engine).equals(expected)
+        assert dataset.to_columnar().to_df(engine=engine).equals(expected)
+
+    def test_transform(self, dataset: TrackingDataset):
+        columnar_dataset = dataset.to_columnar()
+
+        transformed = dataset.transform(
+            to_coordinate_system="secondspectrum",
+            to_orientation="BALL_OWNING_TEAM",
+        )
+        columnar_transformed = columnar_dataset.transform(
+            to_coordinate_system="secondspectrum",
+            to_orientation="BALL_OWNING_TEAM",
+        )
+
+        assert isinstance(columnar_transformed.records, ColumnarFrames)
+        assert columnar_transformed.metadata == transformed.metadata
+        for frame, columnar_frame in zip(transformed, columnar_transformed):
+            assert columnar_frame.ball_coordinates == frame.ball_coordinates
+            assert columnar_frame.players_data == frame.players_data
+
+        # the original frames are left untouched
+        assert columnar_dataset.frames.ball_x[0] == 2710
+
+    @pytest.mark.parametrize("engine", ["pandas", "pandas[pyarrow]", "polars"])
+    def test_to_df_long(self, dataset: TrackingDataset, engine: str):
+        df = dataset.to_df(layout="long", engine=engine)
+
+        assert df.shape == (
+            sum(len(frame.players_data) for frame in dataset.frames),
+            len(LONG_COLUMNS),
+        )
+        assert list(df.columns) == list(LONG_COLUMNS)
+        assert (
+            dataset.to_columnar()
+            .to_df(layout="long", engine=engine)
+            .equals(df)
+        )
+
+    def test_to_records_long(self, dataset: TrackingDataset):
+        records = dataset.to_records(layout="long")
+
+        # rows of a frame follow the order of the players in the metadata
+        frame = dataset[0]
+        player = next(
+            player
+            for team in dataset.metadata.teams
+            for player in team.players
+            if player in frame.players_data
+        )
+        player_data = frame.players_data[player]
+        assert records[0] == {
+            "period_id": frame.period.id,
+            "timestamp": frame.timestamp,
+            "frame_id": frame.frame_id,
+            "team_id": player.team.team_id,
+            "player_id": player.player_id,
+            "x": player_data.coordinates.x,
+            "y": player_data.coordinates.y,
+            "distance": None,
+            "speed": player_data.speed,
+        }
+        assert dataset.to_records("frame_id", "x", layout="long")[0] == {
+            "frame_id": frame.frame_id,
+            "x": player_data.coordinates.x,
+        }
+
+        with pytest.raises(KloppyParameterError):
+            dataset.to_records("ball_x", layout="long")
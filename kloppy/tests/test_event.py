@@ -1,7 +1,19 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from kloppy import statsbomb
-from kloppy.domain import EventDataset
+from kloppy.domain import (
+    BodyPart,
+    BodyPartQualifier,
+    EnumQualifier,
+    EventDataset,
+    Qualifier,
+    SetPieceQualifier,
+    SetPieceType,
+)
 
 
 class TestEvent:
@@ -87,3 +99,64 @@ class TestEvent:
         assert goals[0].next("shot.goal") == goals[1]
         assert goals[0].next("shot.goal") == goals[2].prev("shot.goal")
         assert goals[2].next("shot.goal") is None
+
+    def test_qualifiers(self, dataset: EventDataset):
+        """
+        Test looking up qualifiers by type, on events and on the dataset
+        """
+        pass_event = dataset.get_event_by_id(
+            "cc6749e4-7cd8-474a-8ccd-6177a1488a72"
+        )
+        assert pass_event.get_qualifier_value(BodyPartQualifier) is None
+        assert pass_event.get_qualifier_values(Qualifier) == [True]
+
+        # Qualifiers added after the first lookup are found
+        pass_event.qualifiers.append(
+            BodyPartQualifier(value=BodyPart.RIGHT_FOOT)
+        )
+        assert pass_event.get_qualifier_value(BodyPartQualifier) == (
+            BodyPart.RIGHT_FOOT
+        )
+        assert pass_event.get_qualifier_values(EnumQualifier) == [
+            BodyPart.RIGHT_FOOT
+        ]
+        assert pass_event.get_qualifier_value(
+            (SetPieceQualifier, BodyPartQualifier)
+        ) == (BodyPart.RIGHT_FOOT)
+
+        # Qualifiers replaced in place are found
+        pass_event.qualifiers[-1] = BodyPartQualifier(value=BodyPart.LEFT_FOOT)
+        assert pass_event.get_qualifier_values(BodyPartQualifier) == [
+            BodyPart.LEFT_FOOT
+        ]
+
+        set_pieces = dataset.get_qualifier_column(SetPieceQualifier)
+        assert len(set_pieces) == len(dataset)
+        assert set_pieces == [
+            event.get_qualifier_value(SetPieceQualifier) for event in dataset
+        ]
+        assert set_pieces.count(SetPieceType.CORNER_KICK) == 7
+
+    def test_shared_qualifiers(self, dataset: EventDataset):
+        """
+        Test qualifiers with the same class and value are shared
+        """
+        qualifier = SetPieceQualifier(value=SetPieceType.CORNER_KICK)
+        assert SetPieceQualifier(SetPieceType.CORNER_KICK) is qualifier
+        assert SetPieceQualifier(value=SetPieceType.THROW_IN) is not qualifier
+        assert copy.deepcopy(qualifier) is qualifier
+        assert pickle.loads(pickle.dumps(qualifier)) is qualifier
+
+        corner_kicks = [
+            qualifier_
+            for event in dataset
+            if event.qualifiers
+            for qualifier_ in event.qualifiers
+            if qualifier_ == qualifier
+        ]
+        assert len(corner_kicks) == 7
+        assert all(qualifier_ is qualifier for qualifier_ in corner_kicks)
+
+        with pytest.raises(FrozenInstanceError):
+            qualifier.value = SetPieceType.THROW_IN
+        assert qualifier.value == SetPieceType.CORNER_KICK
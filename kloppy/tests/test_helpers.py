@@ -1,13 +1,19 @@
+import pickle
 import sys
+import warnings
+import weakref
+from dataclasses import replace
+from datetime import timedelta
 
 import pytest
-from pandas import DataFrame
+from pandas import CategoricalDtype, DataFrame
 from pandas.testing import assert_frame_equal
 
 from kloppy import opta, statsbomb, tracab
 from kloppy.config import config_context
 from kloppy.domain import (
     AttackingDirection,
+    DatasetTransformer,
     DatasetFlag,
     Dimension,
     Ground,
@@ -21,9 +27,12 @@ from kloppy.domain import (
     Point,
     Point3D,
     Provider,
+    RecordsView,
     Team,
+    Time,
     TrackingDataset,
 )
+from kloppy.exceptions import KloppyParameterError
 from kloppy.domain.services.frame_factory import create_frame
 
 
@@ -101,6 +110,266 @@ class TestHelpers:
         )
         return tracking_data
 
+    def test_frame_slots(self):
+        tracking_data = self._get_tracking_dataset()
+        frame = tracking_data.frames[1]
+        player_data = next(iter(frame.players_data.values()))
+
+        # records don't carry a per-instance __dict__
+        for obj in (frame, player_data, frame.ball_coordinates):
+            assert not hasattr(obj, "__dict__")
+
+        # frames without other data share the same empty mapping
+        empty_frame = create_frame(
+            frame_id=3,
+            timestamp=0.3,
+            ball_owning_team=None,
+            ball_state=None,
+            period=frame.period,
+            players_data={},
+            other_data={},
+            ball_coordinates=None,
+        )
+        assert empty_frame.other_data == {}
+        player = next(iter(frame.players_data))
+        frame_with_player = create_frame(
+            frame_id=4,
+            timestamp=0.4,
+            ball_owning_team=None,
+            ball_state=None,
+            period=frame.period,
+            players_data={player: PlayerData(coordinates=Point(0, 0))},
+            other_data={},
+            ball_coordinates=None,
+        )
+        assert (
+            frame_with_player.players_data[player].other_data
+            is empty_frame.other_data
+        )
+        with pytest.raises(TypeError):
+            empty_frame.other_data["key"] = "value"
+        assert (
+            pickle.loads(pickle.dumps(empty_frame)).other_data
+            is empty_frame.other_data
+        )
+
+        # player data created outside of the deserializers has its own
+        # mutable other data
+        player_data = PlayerData(coordinates=Point(0, 0))
+        player_data.other_data["key"] = "value"
+        assert PlayerData(coordinates=Point(0, 0)).other_data == {}
+
+        # slotted records can be weakly referenced
+        for obj in (frame, player_data, frame.ball_coordinates):
+            assert weakref.ref(obj)() is obj
+
+        unpickled_frame = pickle.loads(pickle.dumps(frame))
+        assert unpickled_frame.ball_coordinates == frame.ball_coordinates
+        assert unpickled_frame.players_data == frame.players_data
+        assert unpickled_frame.dataset.metadata == tracking_data.metadata
+
+    def test_create_frame_skipped_arguments(self):
+        frame = self._get_tracking_dataset().frames[0]
+        kwargs = dict(
+            frame_id=3,
+            timestamp=0.3,
+            ball_owning_team=None,
+            ball_state=None,
+            period=frame.period,
+            players_data={},
+            other_data={},
+            ball_coordinates=None,
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert create_frame(**kwargs).frame_id == 3
+
+        # unexpected arguments are skipped, with a warning once per set of
+        # arguments
+        with pytest.warns(UserWarning, match="unknown_argument"):
+            create_frame(unknown_argument=1, **kwargs)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert create_frame(unknown_argument=2, **kwargs).frame_id == 3
+
+    def test_time_index(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        period1, period2 = dataset.metadata.periods[:2]
+        frame = dataset.frames[2]
+
+        assert dataset.at(frame.time) is frame
+        assert dataset.at(frame.time + timedelta(milliseconds=10)) is frame
+        assert (
+            dataset.at(Time(period=period2, timestamp=timedelta(0)))
+            is dataset.frames[4]
+        )
+
+        assert (
+            dataset.between(dataset.frames[1].time, dataset.frames[3].time)
+            == dataset.frames[1:4]
+        )
+        assert dataset.between(
+            Time(period=period1, timestamp=timedelta(0)),
+            Time(period=period2, timestamp=timedelta(hours=1)),
+        ) == list(dataset.frames)
+
+        assert (
+            dataset.nearest(
+                dataset.frames[1].time + timedelta(milliseconds=30)
+            )
+            is frame
+        )
+        assert (
+            dataset.nearest(
+                frame.time + timedelta(seconds=10),
+                tolerance=timedelta(seconds=1),
+            )
+            is None
+        )
+        assert (
+            dataset.nearest(
+                Time(period=period2, timestamp=timedelta(milliseconds=30))
+            )
+            is dataset.frames[5]
+        )
+
+        with pytest.raises(KloppyParameterError):
+            dataset.at(frame.timestamp)
+
+        columnar_dataset = dataset.to_columnar()
+        assert columnar_dataset.at(frame.time).frame_id == frame.frame_id
+
+    def test_record_navigation(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        first, second, third = dataset.frames[:3]
+
+        # records of a derived dataset navigate within the owning dataset
+        filtered = dataset.filter(lambda frame: frame is not second)
+        assert filtered.frames[1] is third
+        assert third.prev_record is second
+
+        # navigation follows changes to the records of the dataset
+        del dataset.records[1]
+        assert first.next_record is third
+        assert third.prev_record is first
+        assert second.prev_record is None
+        assert second.next_record is None
+        # a removed record doesn't rebuild the index until the records change
+        position_index = dataset._position_index
+        assert second.next_record is None
+        assert dataset._position_index is position_index
+
+        dataset.records.insert(0, second)
+        assert first.prev_record is second
+        assert second.next_record is first
+        assert dataset.frames[-1].next_record is None
+
+    def test_dataset_views(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+
+        second_half = dataset.select_period(2)
+        assert isinstance(second_half.records, RecordsView)
+        assert second_half.records == dataset.frames[4:]
+        assert second_half[0] is dataset.frames[4]
+        assert second_half.metadata is dataset.metadata
+
+        # views on views refer to the records of the parent dataset
+        view = second_half.filter(lambda frame: frame.frame_id != 1942115)
+        assert view.records.indices == [4, 6]
+        assert [frame.frame_id for frame in view[::-1]] == [
+            2017933,
+            1942114,
+        ]
+        assert view.get_record_by_id(2017933) is dataset.frames[6]
+        assert view[0].next_record is dataset.frames[5]
+
+        # materialized records navigate within the new dataset
+        materialized = view.materialize()
+        assert isinstance(materialized.records, list)
+        assert [frame.frame_id for frame in materialized] == [
+            frame.frame_id for frame in view
+        ]
+        first, second = materialized.records
+        assert first is not view[0]
+        assert first.dataset is materialized
+        assert first.prev_record is None
+        assert first.next_record is second
+        assert second.next_record is None
+        assert view[0].next_record is dataset.frames[5]
+
+        columnar_view = dataset.to_columnar().select_period(2)
+        assert [frame.frame_id for frame in columnar_view] == [
+            frame.frame_id for frame in second_half
+        ]
+
+    def test_dataset_from_owned_records(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        metadata = replace(dataset.metadata, orientation=Orientation.NOT_SET)
+
+        # records are shared with and linked to the new dataset
+        new_dataset = TrackingDataset(
+            metadata=metadata, records=dataset.records[4:6]
+        )
+        first, second = new_dataset.records
+        assert first is dataset.frames[4]
+        assert first.dataset is new_dataset
+        assert first.prev_record is None
+        assert first.next_record is second
+        assert second.next_record is None
+        assert first.attacking_direction == AttackingDirection.NOT_SET
+
+        # transforming a dataset leaves its records linked to it
+        transformed = dataset.transform(
+            to_orientation=Orientation.STATIC_HOME_AWAY
+        )
+        assert all(frame.dataset is dataset for frame in dataset.frames[:4])
+        assert all(frame.dataset is transformed for frame in transformed)
+        assert (
+            dataset.frames[0].attacking_direction
+            != transformed.frames[0].attacking_direction
+        )
+
+    def test_set_refs_without_index(self):
+        tracking_data = self._get_tracking_dataset()
+        last_frame = tracking_data.frames[-1]
+        frame = create_frame(
+            frame_id=3,
+            timestamp=0.3,
+            ball_owning_team=None,
+            ball_state=None,
+            period=last_frame.period,
+            players_data={},
+            other_data={},
+            ball_coordinates=None,
+        )
+        tracking_data.records.append(frame)
+
+        # the previous calling convention still works, but the neighbouring
+        # records are derived from the position in the dataset
+        with pytest.warns(DeprecationWarning, match="set_refs"):
+            frame.set_refs(tracking_data, last_frame, None)
+        assert frame.dataset is tracking_data
+        assert frame.prev_record is last_frame
+        assert frame.next_record is None
+        assert last_frame.next_record is frame
+
     def test_transform(self):
         tracking_data = self._get_tracking_dataset()
 
@@ -163,6 +432,31 @@ class TestHelpers:
             )
         )
 
+    def test_transform_frames_inplace(self):
+        tracking_data = self._get_tracking_dataset()
+        frames = [frame.replace() for frame in tracking_data.frames]
+        transformer = DatasetTransformer(
+            from_pitch_dimensions=tracking_data.metadata.pitch_dimensions,
+            from_orientation=Orientation.HOME_AWAY,
+            to_pitch_dimensions=NormalizedPitchDimensions(
+                x_dim=Dimension(min=0, max=1),
+                y_dim=Dimension(min=0, max=1),
+                pitch_length=105,
+                pitch_width=68,
+            ),
+            to_orientation=Orientation.AWAY_HOME,
+        )
+
+        copied_frames = transformer.transform_frames(frames)
+        transformed_frames = transformer.transform_frames(frames, inplace=True)
+
+        assert transformed_frames[0] is frames[0]
+        assert copied_frames[0] is not frames[0]
+        assert frames[0].ball_coordinates == Point3D(x=0, y=1, z=0)
+        for frame, copied_frame in zip(transformed_frames, copied_frames):
+            assert frame.ball_coordinates == copied_frame.ball_coordinates
+            assert frame.players_data == copied_frame.players_data
+
     def test_transform_to_orientation(self):
         to_pitch_dimensions = NormalizedPitchDimensions(
             x_dim=Dimension(min=0, max=1),
@@ -390,6 +684,104 @@ class TestHelpers:
             == transformed_receipt_event.coordinates.y
         )
 
+    def test_transform_event_data_inplace(self, base_dir):
+        dataset = opta.load(
+            f7_data=base_dir / "files/opta_f7.xml",
+            f24_data=base_dir / "files/opta_f24.xml",
+        )
+        pass_event = dataset.find("pass")
+        coordinates = pass_event.coordinates
+        receiver_coordinates = pass_event.receiver_coordinates
+
+        to_pitch_dimensions = NormalizedPitchDimensions(
+            x_dim=Dimension(min=-1, max=1),
+            y_dim=Dimension(min=-1, max=1),
+            pitch_length=105,
+            pitch_width=68,
+        )
+        transformed_dataset = dataset.transform(
+            to_pitch_dimensions=to_pitch_dimensions
+        )
+        transformed_pass_event = transformed_dataset.find("pass")
+
+        # by default the original dataset is not modified
+        assert transformed_pass_event is not pass_event
+        assert transformed_pass_event.dataset is transformed_dataset
+        assert transformed_pass_event.raw_event is pass_event.raw_event
+        assert pass_event.coordinates == coordinates
+
+        inplace_dataset = dataset.transform(
+            to_pitch_dimensions=to_pitch_dimensions, inplace=True
+        )
+
+        assert inplace_dataset is dataset
+        assert dataset.metadata.pitch_dimensions == to_pitch_dimensions
+        assert dataset.find("pass") is pass_event
+        assert pass_event.coordinates == transformed_pass_event.coordinates
+        assert (
+            pass_event.receiver_coordinates
+            == transformed_pass_event.receiver_coordinates
+        )
+        assert pass_event.receiver_coordinates != receiver_coordinates
+
+    def test_transform_view_inplace(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        columnar_dataset = dataset.to_columnar()
+        ball_coordinates = dataset.frames[0].ball_coordinates
+
+        # views don't own their records, so the parent dataset is left
+        # untouched
+        for parent in (dataset, columnar_dataset):
+            with pytest.raises(KloppyParameterError):
+                parent[0:3].transform(
+                    to_coordinate_system="secondspectrum", inplace=True
+                )
+            assert parent.frames[0].ball_coordinates == ball_coordinates
+
+        # a materialized view can be transformed inplace
+        view = dataset[0:3].materialize()
+        assert (
+            view.transform(to_coordinate_system="secondspectrum", inplace=True)
+            is view
+        )
+        assert view.frames[0].ball_coordinates != ball_coordinates
+        assert dataset.frames[0].ball_coordinates == ball_coordinates
+
+    def test_get_record_by_id(self, base_dir):
+        dataset = opta.load(
+            f7_data=base_dir / "files/opta_f7.xml",
+            f24_data=base_dir / "files/opta_f24.xml",
+        )
+        first_event, second_event, third_event = dataset.records[:3]
+
+        assert dataset.get_record_by_id(second_event.event_id) is second_event
+        assert dataset.get_record_by_id("unknown") is None
+
+        # the index follows changes to the records
+        new_event = second_event.replace(event_id="new")
+        dataset.records.append(new_event)
+        assert dataset.get_record_by_id("new") is new_event
+        dataset.records[1] = third_event.replace(event_id="replaced")
+        assert dataset.get_record_by_id(second_event.event_id) is None
+        assert dataset.get_record_by_id("replaced") is dataset.records[1]
+
+        # a record replaced in place is found without looking up the
+        # identifier it replaced first
+        dataset.records[5] = replace(dataset.records[5], event_id="other")
+        assert dataset.get_record_by_id("other") is dataset.records[5]
+        assert dataset.get_record_by_id("unknown") is None
+
+        # related events are resolved once and cached
+        first_event.related_event_ids = [third_event.event_id, "new"]
+        assert first_event.get_related_events() == [third_event, new_event]
+        assert first_event.get_related_events()[1] is new_event
+        first_event.related_event_ids.pop()
+        assert first_event.get_related_events() == [third_event]
+
     def test_transform_event_data_freeze_frame(self, base_dir):
         """Make sure the freeze frame within event data is transformed too"""
         dataset = statsbomb.load(
@@ -454,6 +846,32 @@ class TestHelpers:
         dataframe = dataframe[dataframe.event_type == "BALL_OUT"]
         assert dataframe.shape[0] == 2
 
+    def test_event_dataset_to_df_schema(self, base_dir):
+        dataset = opta.load(
+            f7_data=base_dir / "files/opta_f7.xml",
+            f24_data=base_dir / "files/opta_f24.xml",
+        )
+
+        df = dataset.to_df(engine="pandas")
+
+        # the columns and values match the conversion per event, but enum
+        # values are categorical
+        expected = DataFrame.from_dict(dataset.to_dict("*"))
+        categorical_columns = [
+            column
+            for column in df.columns
+            if isinstance(df[column].dtype, CategoricalDtype)
+        ]
+        assert {"event_type", "result", "pass_type"} <= set(
+            categorical_columns
+        )
+        assert_frame_equal(
+            df.astype({column: object for column in categorical_columns}),
+            expected.astype(
+                {column: object for column in categorical_columns}
+            ),
+        )
+
     def test_to_pandas_incomplete_pass(self, base_dir):
         dataset = statsbomb.load(
             lineup_data=base_dir / "files/statsbomb_lineup.json",
@@ -519,6 +937,76 @@ class TestHelpers:
         c = df.select(pl.col("event_id").count())[0, 0]
         assert c == 4061
 
+    def test_to_polars_lazy(self, base_dir):
+        """
+        Make sure filters and column selections on the lazy export give the
+        same result as on the full export
+        """
+        import polars as pl
+        from polars.testing import assert_frame_equal
+
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+            event_data=base_dir / "files/statsbomb_event.json",
+        )
+        df = dataset.to_df(engine="polars")
+        lf = dataset.to_polars_lazy()
+
+        assert isinstance(lf, pl.LazyFrame)
+        assert_frame_equal(lf.collect(), df, check_column_order=False)
+
+        shots = (
+            lf.filter(pl.col("event_type") == "SHOT")
+            .select("player_id", "coordinates_x")
+            .collect()
+        )
+        assert len(shots) == 29
+        assert_frame_equal(
+            shots,
+            df.filter(pl.col("event_type") == "SHOT").select(
+                "player_id", "coordinates_x"
+            ),
+        )
+
+        second_half = (
+            lf.filter(
+                (pl.col("period_id") == 2)
+                & (pl.col("timestamp") < timedelta(minutes=1))
+            )
+            .head(5)
+            .collect()
+        )
+        assert second_half["period_id"].to_list() == [2] * 5
+
+        lf = dataset.to_polars_lazy("event_id", "coordinates_*", match_id=1234)
+        assert lf.collect_schema().names() == [
+            "event_id",
+            "coordinates_x",
+            "coordinates_y",
+            "match_id",
+        ]
+        assert lf.filter(pl.col("coordinates_x") > 200).collect().is_empty()
+
+        # A column that only appears, and only has a value, in the last
+        # records is part of the schema too
+        *_, second_to_last, last = dataset.records
+
+        def late_column(event):
+            if event is last:
+                return {"late": 1}
+            if event is second_to_last:
+                return {"late": None}
+            return {}
+
+        lf = dataset.to_polars_lazy("event_id", late_column)
+        assert lf.collect_schema() == pl.Schema(
+            {"event_id": pl.String, "late": pl.Int64}
+        )
+        assert_frame_equal(
+            lf.collect(),
+            dataset.to_df("event_id", late_column, engine="polars"),
+        )
+
     def test_tracking_dataset_to_polars(self):
         """
         Make sure a tracking dataset can be exported as a Polars DataFrame
@@ -562,3 +1050,68 @@ class TestHelpers:
         df = dataset.to_df(engine="pandas[pyarrow]")
         assert isinstance(df, pd.DataFrame)
         assert isinstance(df.dtypes["ball_x"], pd.ArrowDtype)
+
+    def test_iter_batches(self):
+        dataset = self._get_tracking_dataset()
+
+        batches = list(dataset.iter_batches(1, "frame_id", "ball_x"))
+        assert [batch.num_rows for batch in batches] == [1, 1]
+        assert batches[1].to_pydict() == {"frame_id": [2], "ball_x": [0]}
+
+        # player columns are only part of batches with data for the player
+        batches = list(dataset.iter_batches(1))
+        assert "home_1_x" not in batches[0].schema.names
+        assert "home_1_x" in batches[1].schema.names
+
+    def test_to_parquet(self, tmp_path):
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        dataset = self._get_tracking_dataset()
+
+        dataset.to_parquet(tmp_path / "frames.parquet", row_group_size=1)
+        parquet_file = pq.ParquetFile(tmp_path / "frames.parquet")
+        assert parquet_file.metadata.num_row_groups == 2
+        table = parquet_file.read()
+        assert table.num_rows == 2
+        assert table.column("home_1_x").to_pylist() == [None, 15.0]
+
+        dataset.to_parquet(
+            tmp_path / "partitioned",
+            "frame_id",
+            partition_by=["period_id"],
+            period_id=lambda frame: frame.period.id,
+        )
+        table = ds.dataset(
+            tmp_path / "partitioned", partitioning="hive"
+        ).to_table()
+        assert sorted(table.column("period_id").to_pylist()) == [1, 2]
+
+    def test_to_parquet_converts_once(self, base_dir, tmp_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        last_frame = dataset.records[-1]
+        converted = []
+
+        def late_value(frame):
+            converted.append(frame)
+            return frame.frame_id if frame is last_frame else None
+
+        dataset.to_parquet(
+            tmp_path / "frames.parquet", row_group_size=1, late=late_value
+        )
+        # every batch is converted once, besides the records that are
+        # converted to find the columns
+        assert len(converted) < 2 * len(dataset.records)
+
+        table = pq.read_table(tmp_path / "frames.parquet")
+        assert table.schema.field("late").type == pa.int64()
+        assert table.column("late").to_pylist() == [None] * (
+            len(dataset.records) - 1
+        ) + [last_frame.frame_id]
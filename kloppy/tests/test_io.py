@@ -7,14 +7,26 @@ import sys
 import zipfile
 from io import BytesIO
 from pathlib import Path
+from typing import List
 
 import pytest
 from botocore.session import Session
 from moto.moto_server.threaded_moto_server import ThreadedMotoServer
 
-from kloppy.config import set_config
-from kloppy.exceptions import InputNotFoundError
-from kloppy.io import expand_inputs, get_file_extension, open_as_file
+import kloppy.io
+from kloppy.config import config_context, set_config
+from kloppy.exceptions import InputNotFoundError, KloppyError
+from kloppy.infra.io.cache import DownloadCache
+from kloppy.infra.io.adapters import FileAdapter, HTTPAdapter
+from kloppy.io import (
+    cache,
+    expand_inputs,
+    get_file_extension,
+    iter_lines,
+    map_file,
+    open_as_file,
+    prefetch_inputs,
+)
 
 
 @pytest.fixture()
@@ -105,6 +117,53 @@ class TestOpenAsFile:
             assert fp is not None
             assert fp.read() == b"Hello, world!"
 
+    def test_path_streaming(self, filesystem_content: Path):
+        """It should stream a file instead of reading it into memory."""
+        path = filesystem_content / "testfile.txt.gz"
+        with gzip.open(path, "wb") as f_out:
+            f_out.write(b"line 1\nline 2\n")
+
+        with open_as_file(path) as fp:
+            assert not isinstance(fp, BytesIO)
+            assert fp.readline() == b"line 1\n"
+            assert list(fp) == [b"line 2\n"]
+            fp.seek(0)
+            assert fp.read(4) == b"line"
+        assert fp.closed
+        assert fp._fileobj.closed
+
+    def test_map_file(self, filesystem_content: Path):
+        """It should memory-map uncompressed local files only."""
+        with open_as_file(filesystem_content / "testfile.txt") as fp:
+            data = map_file(fp)
+            assert data is not None
+            assert data.find(b"Hello") == 0
+            data.close()
+
+            fp.readline()
+            assert list(iter_lines(fp)) == []
+
+        path = filesystem_content / "testfile.txt.gz"
+        with gzip.open(path, "wb") as f_out:
+            f_out.write(b"line 1\nline 2")
+        with open_as_file(path) as fp:
+            assert map_file(fp) is None
+            assert list(iter_lines(fp)) == [b"line 1\n", b"line 2"]
+
+        assert map_file(BytesIO(b"line 1")) is None
+
+    def test_iter_lines(self, filesystem_content: Path):
+        """It should iterate over the lines starting at the current position."""
+        path = filesystem_content / "lines.txt"
+        path.write_bytes(b"line 1\r\nline 2\n\nline 4")
+
+        with open_as_file(path) as fp:
+            assert fp.readline() == b"line 1\r\n"
+            lines = iter_lines(fp)
+            assert next(lines) == b"line 2\n"
+            assert list(lines) == [b"\n", b"line 4"]
+            assert fp.read() == b""
+
     def test_path_missing(self, filesystem_content: Path):
         """It should raise an error if the file is not found."""
         path = filesystem_content / "missing.txt"
@@ -183,6 +242,225 @@ class TestExpandInputs:
         with pytest.raises(InputNotFoundError):
             list(expand_inputs("nonexistent_file.txt"))
 
+    def test_memoized_lookups(self, mock_filesystem, monkeypatch):
+        """It should check each path only once."""
+        calls = []
+        is_file = FileAdapter.is_file
+
+        def counting_is_file(self, url):
+            calls.append(url)
+            return is_file(self, url)
+
+        monkeypatch.setattr(FileAdapter, "is_file", counting_is_file)
+
+        input_list = [mock_filesystem["file1"]] * 3
+        assert list(expand_inputs(input_list)) == input_list
+        assert calls == [mock_filesystem["file1"]]
+
+
+class TestPrefetchInputs:
+    @pytest.fixture
+    def inputs(self, tmp_path: Path) -> List[str]:
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"file{i}.txt"
+            path.write_bytes(f"file {i}".encode())
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.parametrize("concurrency", [0, 1, 4])
+    def test_order(self, inputs: List[str], concurrency: int):
+        """It should yield the opened inputs in order."""
+        contents = []
+        for input_ in prefetch_inputs(inputs, concurrency=concurrency):
+            with input_ as fp:
+                contents.append(fp.read())
+        assert contents == [f"file {i}".encode() for i in range(10)]
+
+    def test_early_exit(self, monkeypatch):
+        """It should close the prefetched inputs that are not used."""
+        inputs = [BytesIO(f"file {i}".encode()) for i in range(10)]
+        opened_inputs = []
+
+        def open_input(input_):
+            opened_inputs.append(input_)
+            return input_
+
+        monkeypatch.setattr(kloppy.io, "open_as_file", open_input)
+
+        opened = prefetch_inputs(inputs, concurrency=4)
+        with next(opened) as fp:
+            assert fp.read() == b"file 0"
+        opened.close()
+
+        # at most four inputs are opened ahead
+        assert len(opened_inputs) <= 5
+        assert all(fp.closed for fp in opened_inputs)
+        assert not any(fp.closed for fp in inputs if fp not in opened_inputs)
+
+    def test_missing_input(self, inputs: List[str]):
+        """It should raise errors in the order of the inputs."""
+        opened = prefetch_inputs(
+            [inputs[0], inputs[0] + ".missing", inputs[1]], concurrency=4
+        )
+        with next(opened) as fp:
+            assert fp.read() == b"file 0"
+        with pytest.raises(InputNotFoundError):
+            next(opened)
+
+    def test_failed_open_closes_previous_input(self, monkeypatch):
+        """A loader should close its inputs when a later input can't be opened."""
+        from kloppy import sportec
+
+        event_data = BytesIO(b"<Event />")
+
+        def open_input(input_):
+            if input_ is event_data:
+                return input_
+            raise InputNotFoundError(f"File {input_} does not exist")
+
+        monkeypatch.setattr(kloppy.io, "open_as_file", open_input)
+
+        with pytest.raises(InputNotFoundError):
+            sportec.load_event(event_data=event_data, meta_data="missing.xml")
+        assert event_data.closed
+
+
+class TestDownloadCache:
+    @pytest.fixture
+    def download_cache(self, tmp_path: Path) -> DownloadCache:
+        return DownloadCache(str(tmp_path / "cache"), max_size=12)
+
+    @staticmethod
+    def fetch(data: bytes, calls: list):
+        def _fetch(output):
+            calls.append(data)
+            output.write(data)
+
+        return _fetch
+
+    def test_open(self, download_cache: DownloadCache):
+        """It should only download a file on a cache miss."""
+        calls = []
+        for _ in range(2):
+            with download_cache.open(
+                "https://example.com/a", self.fetch(b"aaaaaa", calls)
+            ) as fp:
+                assert fp.read() == b"aaaaaa"
+        assert calls == [b"aaaaaa"]
+
+        stats = download_cache.stats()
+        assert (stats.entries, stats.size) == (1, 6)
+        assert (stats.hits, stats.misses, stats.bytes_saved) == (1, 1, 6)
+        assert stats.hit_rate == 0.5
+
+    def test_eviction(self, download_cache: DownloadCache):
+        """It should evict the least recently used files."""
+        calls = []
+        for url in ["a", "b", "a", "c", "a"]:
+            download_cache.open(
+                url, self.fetch(url.encode() * 6, calls)
+            ).close()
+
+        # 'b' was evicted to make room for 'c'
+        assert calls == [b"aaaaaa", b"bbbbbb", b"cccccc"]
+        assert download_cache.stats().size == 12
+
+        assert download_cache.prune(max_size=6) == 6
+        assert download_cache.stats().entries == 1
+
+    def test_failed_download(self, download_cache: DownloadCache):
+        """It should not store partially downloaded files."""
+
+        def fetch(output):
+            output.write(b"aaa")
+            raise ConnectionError()
+
+        with pytest.raises(ConnectionError):
+            download_cache.open("a", fetch)
+
+        assert download_cache.stats().entries == 0
+        assert os.listdir(download_cache.directory) == ["kloppy_cache.db"]
+
+    def test_prune(self, download_cache: DownloadCache):
+        """It should remove files that are missing or were modified."""
+        calls = []
+        for url in ["a", "b"]:
+            download_cache.open(
+                url, self.fetch(url.encode() * 6, calls)
+            ).close()
+
+        cached_files = [
+            os.path.join(download_cache.directory, name)
+            for name in os.listdir(download_cache.directory)
+            if name != "kloppy_cache.db"
+        ]
+        for path in cached_files:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data == b"aaaaaa":
+                os.remove(path)
+            else:
+                # modify the file without changing its modification time
+                stat = os.stat(path)
+                with open(path, "wb") as f:
+                    f.write(b"xxxxxx")
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert download_cache.prune() == 6
+        assert download_cache.stats().entries == 1
+        assert download_cache.prune(verify=True) == 6
+        assert download_cache.stats().entries == 0
+
+    def test_modified_file(self, download_cache: DownloadCache):
+        """It should verify the content of files that were touched."""
+        calls = []
+        download_cache.open("a", self.fetch(b"aaaaaa", calls)).close()
+        (path,) = [
+            os.path.join(download_cache.directory, name)
+            for name in os.listdir(download_cache.directory)
+            if name != "kloppy_cache.db"
+        ]
+
+        # touched, but not modified
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with download_cache.open("a", self.fetch(b"aaaaaa", calls)) as fp:
+            assert fp.read() == b"aaaaaa"
+        assert calls == [b"aaaaaa"]
+
+        # modified, with the same size
+        with open(path, "wb") as f:
+            f.write(b"xxxxxx")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        with download_cache.open("a", self.fetch(b"aaaaaa", calls)) as fp:
+            assert fp.read() == b"aaaaaa"
+        assert calls == [b"aaaaaa", b"aaaaaa"]
+
+    def test_configured_cache(self, tmp_path: Path):
+        """It should use the configured cache directory."""
+        with config_context("cache", str(tmp_path)):
+            cache.get_cache().open(
+                "a", lambda output: output.write(b"a")
+            ).close()
+            assert cache.stats().entries == 1
+            cache.clear()
+            assert cache.stats().entries == 0
+
+        with config_context("cache", None):
+            assert cache.get_cache() is None
+            with pytest.raises(KloppyError):
+                cache.stats()
+
+    def test_configured_max_size(self, tmp_path: Path):
+        """It should parse the maximum size set by the environment."""
+        with config_context("cache", str(tmp_path)):
+            with config_context("cache.max_size", "1000"):
+                assert cache.get_cache().max_size == 1000
+            with config_context("cache.max_size", "10GB"):
+                with pytest.raises(KloppyError, match="KLOPPY_CACHE_MAX_SIZE"):
+                    cache.get_cache()
+
 
 def test_get_file_extension():
     assert get_file_extension(Path("data.xml")) == ".xml"
@@ -270,6 +548,20 @@ class TestHTTPAdapter:
             assert fp is not None
             assert fp.read() == b"Hello, world!"
 
+    def test_filesystem_pool(self):
+        """It should reuse the filesystem for the same options."""
+        adapter = HTTPAdapter()
+        fs = adapter._get_filesystem("https://example.com/testfile.txt")
+        assert adapter._get_filesystem("https://example.com/other.txt") is fs
+
+        with config_context(
+            "adapters.http.basic_authentication", ("user", "pass")
+        ):
+            assert (
+                adapter._get_filesystem("https://example.com/other.txt")
+                is not fs
+            )
+
 
 @pytest.mark.skipif(
     sys.version_info < (3, 9), reason="Patch requires Python 3.9 or higher"
@@ -2,6 +2,7 @@ from math import sqrt
 import pytest
 
 from kloppy.domain import (
+    CoordinateTransform,
     Dimension,
     NormalizedPitchDimensions,
     Point,
@@ -135,3 +136,41 @@ class TestPitchdimensions:
         )
         assert transformed_point.x == pytest.approx(16.5)
         assert transformed_point.y == pytest.approx(54.16)
+
+    def test_coordinate_transform(self):
+        to_dims = MetricPitchDimensions(
+            x_dim=Dimension(0, 105),
+            y_dim=Dimension(0, 68),
+            pitch_length=105,
+            pitch_width=68,
+            standardized=False,
+        )
+        transform = CoordinateTransform.build(
+            OptaPitchDimensions(), to_dims, 105, 68
+        )
+
+        # transforms are memoized by the value of the pitch dimensions
+        assert transform is CoordinateTransform.build(
+            OptaPitchDimensions(), to_dims, 105, 68
+        )
+        assert transform is not CoordinateTransform.build(
+            OptaPitchDimensions(), to_dims, 105, 68, invert_y=True
+        )
+
+        assert transform.apply(11.5, 50) == (11, 34)
+        assert transform.apply_point(Point3D(0, 50, 38)) == Point3D(
+            0, 34, 2.44
+        )
+
+    def test_coordinate_transform_arrays(self):
+        np = pytest.importorskip("numpy")
+
+        transform = CoordinateTransform.build(
+            OptaPitchDimensions(), None, 105, 68
+        )
+        xs = np.array([-10, 0, 5.8, 11.5, 17, 50, 60, 99, 110])
+        ys = np.array([-10, 0, 21.1, 50, 61, 78.9, 100, 45.2, 110])
+
+        xs_to, ys_to = transform.apply_arrays(xs, ys)
+        for x, y, x_to, y_to in zip(xs, ys, xs_to, ys_to):
+            assert transform.apply(x, y) == (x_to, y_to)
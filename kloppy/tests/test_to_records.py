@@ -1,12 +1,14 @@
 from datetime import timedelta
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from kloppy import statsbomb
-from kloppy.domain import EventDataset, Point
+from kloppy import statsbomb, tracab
+from kloppy.domain import EventDataset, Point, TrackingDataset
 from kloppy.domain.services.transformers.attribute import (
     AngleToGoalTransformer,
+    DefaultFrameTransformer,
     DistanceToGoalTransformer,
     DistanceToOwnGoalTransformer,
 )
@@ -109,3 +111,96 @@ class TestToRecords:
             "timestamp": timedelta(seconds=0.098),
             "angle_to_goal": 89.49633196102769,
         }
+
+    @pytest.mark.parametrize("coordinate_system", ["statsbomb", "tracab"])
+    def test_transform_batch(
+        self, event_data: Path, lineup_data: Path, coordinate_system
+    ):
+        """
+        Make sure the batch computation matches the per-event computation.
+        """
+        dataset = statsbomb.load(
+            lineup_data=lineup_data,
+            event_data=event_data,
+            coordinates=coordinate_system,
+        )
+        transformers = [
+            DistanceToGoalTransformer(),
+            DistanceToOwnGoalTransformer(),
+            AngleToGoalTransformer(),
+        ]
+        records = dataset.to_records("event_id", *transformers)
+
+        for transformer in transformers:
+            values = transformer.transform_batch(dataset.records)
+            for key, column in values.items():
+                assert len(column) == len(records)
+                assert [
+                    None if np.isnan(value) else value for value in column
+                ] == pytest.approx([record[key] for record in records])
+
+        # to_df uses the batch computation
+        df = dataset.to_df(
+            "event_id", *transformers, "coordinates_x", engine="pandas"
+        )
+        assert list(df.columns) == [
+            "event_id",
+            "distance_to_goal",
+            "distance_to_own_goal",
+            "angle_to_goal",
+            "coordinates_x",
+        ]
+        assert df["angle_to_goal"].tolist()[4] == pytest.approx(
+            89.49633196102769
+        )
+        assert df["angle_to_goal"].isna().sum() == sum(
+            record["angle_to_goal"] is None for record in records
+        )
+
+        empty = dataset.filter(lambda event: False)
+        assert len(empty.to_df(*transformers, engine="pandas")) == 0
+
+
+class TestTrackingToRecords:
+    @pytest.fixture
+    def dataset(self, base_dir) -> TrackingDataset:
+        return tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+
+    def test_string_columns(self, dataset: TrackingDataset):
+        records = dataset.to_records(
+            "frame_id",
+            "ball_*",
+            "*_s",
+            "players_data",
+            lambda frame: {"player_count": len(frame.players_data)},
+            constant=1,
+        )
+
+        for frame, record in zip(dataset, records):
+            default_row = DefaultFrameTransformer()(frame)
+            assert record == {
+                "frame_id": frame.frame_id,
+                **{k: v for k, v in default_row.items() if k[:5] == "ball_"},
+                **{k: v for k, v in default_row.items() if k[-2:] == "_s"},
+                "players_data": frame.players_data,
+                "player_count": len(frame.players_data),
+                "constant": 1,
+            }
+
+    def test_static_columns(self, dataset: TrackingDataset, monkeypatch):
+        """Columns that are part of every row don't need the default row."""
+
+        def fail(self, frame):
+            raise AssertionError("The default row should not be created")
+
+        monkeypatch.setattr(DefaultFrameTransformer, "__call__", fail)
+
+        records = dataset.to_records("timestamp", "ball_x")
+        assert records[0] == {
+            "timestamp": dataset[0].timestamp,
+            "ball_x": dataset[0].ball_coordinates.x,
+        }
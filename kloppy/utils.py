@@ -4,13 +4,26 @@ import re
 import time
 import warnings
 from contextlib import contextmanager
+from dataclasses import fields
 from io import BytesIO
 from logging import Logger
-from typing import BinaryIO, Optional, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    FrozenSet,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from urllib.parse import quote
 from urllib.request import Request, urlopen
 
 Readable = Union[bytes, BinaryIO]
+T = TypeVar("T")
 
 
 def to_file_object(s: Readable) -> BinaryIO:
@@ -91,9 +104,124 @@ def docstring_inherit_attributes(parent):
     return inherit
 
 
+def add_slots(*extra_slots: str):
+    """
+    Class decorator that adds `__slots__` to a dataclass.
+
+    Emulates `@dataclass(slots=True, weakref_slot=True)`, which is only
+    available from Python 3.11 on. The class is recreated with a slot for each field that is not
+    a slot of a base class yet. Instances only lose their `__dict__` when
+    all base classes define `__slots__` as well.
+
+    Args:
+        extra_slots: Names of attributes that are not dataclass fields.
+
+    Examples:
+        >>> @add_slots()
+        ... @dataclass
+        ... class Point:
+        ...     x: float
+        ...     y: float = 0.0
+    """
+
+    def wrap(cls):
+        if "__slots__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+        inherited_slots = set()
+        for base in cls.__mro__[1:]:
+            inherited_slots.update(_get_slots(base))
+
+        field_names = [field.name for field in fields(cls)] + list(extra_slots)
+        cls_dict = dict(cls.__dict__)
+        slots = tuple(
+            name for name in field_names if name not in inherited_slots
+        )
+        # Keep instances weak-referenceable, unless a base class already
+        # provides the `__weakref__` slot
+        if not any(hasattr(base, "__weakref__") for base in cls.__mro__[1:]):
+            slots += ("__weakref__",)
+        cls_dict["__slots__"] = slots
+        for name in field_names:
+            # Remove the class attributes holding the field defaults. The
+            # defaults are part of the generated `__init__`.
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        cls_dict["__getstate__"] = _slots_getstate
+        cls_dict["__setstate__"] = _slots_setstate
+
+        new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+        return new_cls
+
+    return wrap
+
+
+def _get_slots(cls):
+    slots = cls.__dict__.get("__slots__", ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return [slot for slot in slots if slot not in ("__dict__", "__weakref__")]
+
+
+def _slots_getstate(self):
+    state = dict(getattr(self, "__dict__", {}))
+    for cls in type(self).__mro__:
+        for name in _get_slots(cls):
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+    return state
+
+
+def _slots_setstate(self, state):
+    # object.__setattr__ also works for frozen dataclasses
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
 string_types = (bytes, str)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_init_field_names(cls: type) -> FrozenSet[str]:
+    return frozenset(field.name for field in fields(cls) if field.init)
+
+
+# The (class, argument names) pairs that were warned about
+_skipped_arguments_warned: Set[Tuple[type, FrozenSet[str]]] = set()
+
+
+def create_dataclass(cls: Type[T], kwargs: Dict[str, Any]) -> T:
+    """
+    Create an instance of a dataclass, skipping the arguments it doesn't
+    accept.
+
+    The accepted arguments are looked up once per class. When all arguments
+    are accepted, they are passed as is. Otherwise a warning is raised,
+    once per class and set of arguments.
+    """
+    init_field_names = _get_init_field_names(cls)
+    if init_field_names.issuperset(kwargs):
+        return cls(**kwargs)
+
+    key = (cls, frozenset(kwargs))
+    if key not in _skipped_arguments_warned:
+        _skipped_arguments_warned.add(key)
+        skipped_kwargs = set(kwargs) - init_field_names
+        warnings.warn(
+            f"The following arguments were skipped: {skipped_kwargs}",
+            stacklevel=3,
+        )
+    return cls(
+        **{
+            name: value
+            for name, value in kwargs.items()
+            if name in init_field_names
+        }
+    )
+
+
 def deprecated(reason):
     """
     This is a decorator which can be used to mark functions